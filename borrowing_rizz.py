@@ -15,68 +15,75 @@ TL;DR: We're stealing Kelly Slater's surfing skills to look rad at the beach.
 
 # 1. THE SETUP (Import the shit we need)
 import tensorflow as tf  # The AI brain framework (like React for AI)
-from tensorflow.keras import layers, models  # Tools to build the AI brain (like components in React)
+from rizz_backbones import build_rizz_model  # Pro brain + standard head + compile, from one config
 import numpy as np  # Math stuff (like using lodash for numbers)
 import time  # Time tracking (like setTimeout in JS, but for Python)
-
-# 2. DOWNLOAD THE "PRO BRAIN" (MobileNetV2)
-# We say include_top=False to chop off its original "head" (output layer)
-# This is like removing Kelly Slater's surfboard fins and replacing them with your own shitty fins
-base_model = tf.keras.applications.MobileNetV2(
-    input_shape=(224, 224, 3),  # Shape of the images (224x224 pixels, 3 colors = RGB)
-    include_top=False,  # We don't want its original brain, just the body
-    weights='imagenet'  # Pre-trained weights (like Kelly's muscle memory)
-)
-
-# Freeze the base model (so it doesn't forget Kelly's skills)
-# This is like putting Kelly Slater in a straightjacket so he can't move his arms
-# while you try to copy his stance. The base model's weights won't change during training.
-base_model.trainable = False
-
-# 3. BUILD YOUR OWN "SHITTY BRAIN" ON TOP
-# Now we add our own layers on top of the "pro brain" we borrowed.
-# This is like duct-taping a GoPro to Kelly Slater's board so you can record his moves.
-model = models.Sequential([
-    base_model,  # The pro brain (Kelly Slater)
-    layers.GlobalAveragePooling2D(),  # Squish the 3D data into 1D (like flattening a surfboard into a pancake)
-    layers.Dense(128, activation='relu'),  # A layer with 128 neurons (like adding 128 tiny surf instructors to your brain)
-    layers.Dropout(0.2),  # Randomly turn off 20% of neurons (like randomly forgetting 20% of Kelly's tips)
-    layers.Dense(10, activation='softmax')  # Final layer for 10 classes (like choosing between 10 different surf tricks)
-])
-
-# 4. COMPILE THE MODEL (Get it ready for training)
-# This is like setting up your GoPro to record in 4K before you start filming.
-model.compile(
-    optimizer='adam',  # The optimizer (like a surf coach who adjusts your stance)
-    loss='sparse_categorical_crossentropy',  # The loss function (like a scoreboard for your surfing)
-    metrics=['accuracy']  # What we track (like counting how many waves you don't wipe out on)
-)
+from rizz_pipeline import load_cifar10  # Streams resized batches instead of one giant tensor
+from rizz_feature_cache import cached_features, build_feature_head, attach_head  # Run the frozen pro brain only once
+
+# INPUT MODE: "streaming" (resize per batch, low memory) or "eager" (the old resize-everything path)
+INPUT_MODE = "streaming"
+NUM_PARALLEL_CALLS = tf.data.AUTOTUNE  # How many batches get stretched at once (like parallel Promises)
+PREFETCH_DEPTH = tf.data.AUTOTUNE  # How many ready batches wait in line for the model
+
+# FEATURE CACHE: the base model is frozen, so cache its features once and train only the head on them
+FEATURE_CACHE = True
+
+# 2. BORROW THE "PRO BRAIN" (MobileNetV2) + 3. BUILD YOUR "SHITTY BRAIN" ON TOP + 4. COMPILE
+# One config does all three (see rizz_backbones.py - like passing an options object to a JS factory):
+# - chops off MobileNetV2's original head (include_top=False) and loads its ImageNet weights (Kelly's muscle memory)
+# - duct-tapes our head on top: GlobalAveragePooling2D → Dense(128) → Dropout(0.2) → Dense(N, softmax)
+# - compiles with sparse_categorical_crossentropy + accuracy
+# The base model comes back frozen (like putting Kelly Slater in a straightjacket so his
+# weights won't change while you copy his stance).
+# The registry caches loaded backbones, so a second model in the same process reuses the same weights.
+RIZZ_CONFIG = {
+    "backbone": "MobileNetV2",  # The pro brain (Kelly Slater)
+    "input_shape": (224, 224, 3),  # Shape of the images (224x224 pixels, 3 colors = RGB)
+    "weights": "imagenet",  # Pre-trained weights (like Kelly's muscle memory)
+    "num_classes": 10,  # Final layer classes (10 different surf tricks)
+}
+model, base_model = build_rizz_model(RIZZ_CONFIG)
+BACKBONE_ID = (RIZZ_CONFIG["backbone"], RIZZ_CONFIG["weights"], RIZZ_CONFIG["input_shape"][:2])  # What the caches key on
 
 # 5. LOAD YOUR "SHITTY DATASET" (CIFAR-10)
 # This is like downloading a bunch of shitty surfing videos from YouTube.
 # CIFAR-10 has 60,000 tiny images (32x32 pixels) of 10 classes (airplane, car, bird, etc.)
 # We're gonna resize them to 224x224 because MobileNetV2 is a diva and only works with big images.
-(x_train, y_train), (x_test, y_test) = tf.keras.datasets.cifar10.load_data()
 
-# Resize the images (like stretching a tiny surfing thumbnail into a 4K video)
-x_train = tf.image.resize(x_train, (224, 224))  # Stretch training images
-x_test = tf.image.resize(x_test, (224, 224))  # Stretch test images
-
-# Normalize pixel values (0-255 → 0-1)
-# This is like adjusting the brightness of your surfing videos so they're easier to watch.
-x_train = x_train / 255.0
-x_test = x_test / 255.0
+# Stretch + normalize (0-255 → 0-1) inside a streaming pipeline, one batch at a time.
+# The old "eager" way resized all 50k images up front (~30 GB of float32 - our boxes OOM on it).
+# The "streaming" way keeps the tiny uint8 images and stretches each batch right before training,
+# like streaming a surf video instead of downloading the whole thing first.
+# See rizz_pipeline.py (run it to compare the peak memory of both modes).
+# Unknown INPUT_MODE → ValueError (a typo must never quietly fall back to the eager OOM path).
+train_data, test_data, (num_train, num_test) = load_cifar10(
+    INPUT_MODE, (224, 224), num_parallel_calls=NUM_PARALLEL_CALLS, prefetch_depth=PREFETCH_DEPTH
+)
 
 # 6. TRAIN THE MODEL (Start copying Kelly's moves)
 print("🏄‍♂️ Starting training... (This is where the magic happens, brah)")
 start_time = time.time()  # Start the timer (like hitting "record" on your GoPro)
 
 # Train the model (like practicing surfing for 5 epochs)
-history = model.fit(
-    x_train, y_train,  # Your shitty dataset (training data)
-    epochs=5,  # Number of training cycles (like 5 days at surf camp)
-    validation_data=(x_test, y_test)  # Test data (like your first real surf session)
-)
+if FEATURE_CACHE:
+    # The frozen pro brain gives the same features every epoch, so we run it ONCE and cache them
+    # on disk (rizz_feature_cache.py). Then only the tiny head trains - seconds per epoch.
+    train_features, train_labels = cached_features(base_model, *BACKBONE_ID, "cifar10-train-rescale255", train_data, num_train)
+    test_features, test_labels = cached_features(base_model, *BACKBONE_ID, "cifar10-test-rescale255", test_data, num_test)
+    head = build_feature_head(train_features.shape[1], 10)
+    history = head.fit(
+        train_features, train_labels,  # Cached features instead of raw images
+        epochs=5,
+        validation_data=(test_features, test_labels)
+    )
+    model = attach_head(base_model, head)  # Glue the trained head back on so the saved model eats images
+else:
+    history = model.fit(
+        train_data,  # Your shitty dataset (training data, streamed in batches)
+        epochs=5,  # Number of training cycles (like 5 days at surf camp)
+        validation_data=test_data  # Test data (like your first real surf session)
+    )
 
 # Stop the timer and print how long it took
 training_time = time.time() - start_time
@@ -85,7 +92,10 @@ print("🎉 Training complete! Now go shred some waves, dude!")
 
 # 7. EVALUATE THE MODEL (See how shitty your surfing is)
 # This is like watching the GoPro footage and realizing you look like a drunk kangaroo.
-test_loss, test_acc = model.evaluate(x_test, y_test, verbose=2)
+if FEATURE_CACHE:
+    test_loss, test_acc = head.evaluate(test_features, test_labels, verbose=2)  # No need to re-run the backbone
+else:
+    test_loss, test_acc = model.evaluate(test_data, verbose=2)
 print(f"\n📊 Test accuracy: {test_acc:.4f} (If this is below 0.5, you're cooked)")
 
 # 8. SAVE THE MODEL (So you don't have to train it again)
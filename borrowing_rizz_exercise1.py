@@ -11,57 +11,70 @@ Think of this like:
 
 # 1. THE SETUP (Import the shit we need)
 import tensorflow as tf  # The AI brain framework (like React for AI)
-from tensorflow.keras import layers, models  # Tools to build the AI brain (like components in React)
+from rizz_backbones import build_rizz_model  # Pro brain + standard head + compile, from one config
 import numpy as np  # Math stuff (like using lodash for numbers)
 import time  # Time tracking (like setTimeout in JS, but for Python)
+from rizz_pipeline import load_cifar10  # Streams resized batches instead of one giant tensor
+from rizz_partial_cache import split_backbone, cache_activations, build_tail_model, ActivationSequence  # Skip the frozen layers
 
-# 2. DOWNLOAD THE "PRO BRAIN" (MobileNetV2)
-# We say include_top=False to chop off its original "head" (output layer)
-base_model = tf.keras.applications.MobileNetV2(
-    input_shape=(224, 224, 3),  # Shape of the images (224x224 pixels, 3 colors = RGB)
-    include_top=False,  # We don't want its original brain, just the body
-    weights='imagenet'  # Pre-trained weights (like Kelly's muscle memory)
-)
-
-# FREEZE THE BASE MODEL (so it doesn't forget Kelly's skills)
-# This is like putting Kelly Slater in a straightjacket... but then loosening it a little.
-base_model.trainable = True  # Unfreeze the entire model first (like taking off the straightjacket)
-for layer in base_model.layers[:-20]:  # Freeze all layers except the last 20
-    layer.trainable = False  # Now Kelly can only adjust your stance, not your entire body
+# INPUT MODE: "streaming" (resize per batch, low memory) or "eager" (the old resize-everything path)
+INPUT_MODE = "streaming"
+NUM_PARALLEL_CALLS = tf.data.AUTOTUNE  # How many batches get stretched at once (like parallel Promises)
+PREFETCH_DEPTH = tf.data.AUTOTUNE  # How many ready batches wait in line for the model
 
-# 3. BUILD YOUR OWN "SHITTY BRAIN" ON TOP
-model = models.Sequential([
-    base_model,  # The pro brain (Kelly Slater)
-    layers.GlobalAveragePooling2D(),  # Squish the 3D data into 1D (like flattening a surfboard into a pancake)
-    layers.Dense(128, activation='relu'),  # A layer with 128 neurons (like adding 128 tiny surf instructors to your brain)
-    layers.Dropout(0.2),  # Randomly turn off 20% of neurons (like randomly forgetting 20% of Kelly's tips)
-    layers.Dense(10, activation='softmax')  # Final layer for 10 classes (like choosing between 10 different surf tricks)
-])
+# PARTIAL CACHE: the first ~134 layers are frozen, so run them ONCE, cache their output on disk,
+# and train only the last 20 layers + head per step (rizz_partial_cache.py). No random augmentation allowed!
+PARTIAL_CACHE = True
+CACHE_DTYPE = "float16"  # Half the disk + RAM of float32 (like saving your footage in 1080p instead of 4K)
 
-# 4. COMPILE THE MODEL (Get it ready for training)
-# Lower learning rate because we're fine-tuning (like taking smaller steps when learning a new trick)
-model.compile(
-    optimizer=tf.keras.optimizers.Adam(1e-5),  # Smaller steps = less chance of wiping out
-    loss='sparse_categorical_crossentropy',  # The loss function (like a scoreboard for your surfing)
-    metrics=['accuracy']  # What we track (like counting how many waves you don't wipe out on)
-)
+# 2. BORROW THE "PRO BRAIN" (MobileNetV2) + 3. BUILD YOUR "SHITTY BRAIN" ON TOP + 4. COMPILE
+# One config does all three (see rizz_backbones.py - like passing an options object to a JS factory):
+# - chops off MobileNetV2's original head (include_top=False) and loads its ImageNet weights (Kelly's muscle memory)
+# - duct-tapes our head on top: GlobalAveragePooling2D → Dense(128) → Dropout(0.2) → Dense(N, softmax)
+# - compiles with sparse_categorical_crossentropy + accuracy
+# FREEZE (MOST OF) THE BASE MODEL: `fine_tune_last` unfreezes only the last 20 layers,
+# so Kelly can adjust your stance but not your entire body. Fine-tuning gets a
+# lower learning rate (Adam 1e-5) - smaller steps = less chance of wiping out.
+# The registry caches loaded backbones, so a second model in the same process reuses the same weights.
+RIZZ_CONFIG = {
+    "backbone": "MobileNetV2",  # The pro brain (Kelly Slater)
+    "input_shape": (224, 224, 3),  # Shape of the images (224x224 pixels, 3 colors = RGB)
+    "weights": "imagenet",  # Pre-trained weights (like Kelly's muscle memory)
+    "num_classes": 10,  # Final layer classes (10 different surf tricks)
+    "fine_tune_last": 20,  # Unfreeze the last 20 layers
+}
+model, base_model = build_rizz_model(RIZZ_CONFIG)
+BACKBONE_ID = (RIZZ_CONFIG["backbone"], RIZZ_CONFIG["weights"], RIZZ_CONFIG["input_shape"][:2])  # What the caches key on
 
 # 5. LOAD YOUR "SHITTY DATASET" (CIFAR-10)
-(x_train, y_train), (x_test, y_test) = tf.keras.datasets.cifar10.load_data()
-x_train = tf.image.resize(x_train, (224, 224))  # Stretch training images
-x_test = tf.image.resize(x_test, (224, 224))  # Stretch test images
-x_train = x_train / 255.0  # Normalize (0-255 → 0-1)
-x_test = x_test / 255.0  # Normalize (0-255 → 0-1)
+# Stretch (224x224) + normalize (0-255 → 0-1) one batch at a time instead of all 50k images at once
+# Unknown INPUT_MODE → ValueError (a typo must never quietly fall back to the eager OOM path).
+train_data, test_data, (num_train, num_test) = load_cifar10(
+    INPUT_MODE, (224, 224), num_parallel_calls=NUM_PARALLEL_CALLS, prefetch_depth=PREFETCH_DEPTH
+)
 
 # 6. TRAIN THE MODEL (Start copying Kelly's moves)
 print("🏄‍♂️ Starting fine-tuning... (Kelly Slater is watching your footage and adjusting your stance)")
 start_time = time.time()  # Start the timer
 
-history = model.fit(
-    x_train, y_train,  # Your shitty dataset (training data)
-    epochs=5,  # Number of training cycles (like 5 days at surf camp)
-    validation_data=(x_test, y_test)  # Test data (like your first real surf session)
-)
+if PARTIAL_CACHE:
+    # Cut MobileNetV2 at the freeze boundary: frozen part runs once, the trainable tail runs every step.
+    # The tail shares its layers with `model`, so training it trains (and later saves) the full model.
+    frozen_part, tail = split_backbone(base_model, num_trainable=RIZZ_CONFIG["fine_tune_last"])
+    train_acts, train_labels = cache_activations(frozen_part, *BACKBONE_ID, "cifar10-train-rescale255", train_data, num_train, dtype=CACHE_DTYPE)
+    test_acts, test_labels = cache_activations(frozen_part, *BACKBONE_ID, "cifar10-test-rescale255", test_data, num_test, dtype=CACHE_DTYPE)
+    tail_model = build_tail_model(tail, model.layers[1:], tf.keras.optimizers.Adam(1e-5))
+    history = tail_model.fit(
+        ActivationSequence(train_acts, train_labels, shuffle=True),  # Cached activations instead of raw images
+        epochs=5,
+        validation_data=ActivationSequence(test_acts, test_labels)
+    )
+else:
+    history = model.fit(
+        train_data,  # Your shitty dataset (training data, streamed in batches)
+        epochs=5,  # Number of training cycles (like 5 days at surf camp)
+        validation_data=test_data  # Test data (like your first real surf session)
+    )
 
 # Stop the timer and print how long it took
 training_time = time.time() - start_time
@@ -69,7 +82,10 @@ print(f"🕒 Fine-tuning took {training_time:.2f} seconds (or {training_time/60:
 print("🎉 Fine-tuning complete! Now go shred some waves, dude!")
 
 # 7. EVALUATE THE MODEL (See if Kelly's tips helped)
-test_loss, test_acc = model.evaluate(x_test, y_test, verbose=2)
+if PARTIAL_CACHE:
+    test_loss, test_acc = tail_model.evaluate(ActivationSequence(test_acts, test_labels), verbose=2)
+else:
+    test_loss, test_acc = model.evaluate(test_data, verbose=2)
 print(f"\n📊 Test accuracy: {test_acc:.4f} (If this is below 0.5, you're still cooked)")
 
 # 8. SAVE THE MODEL (So you don't have to train it again)
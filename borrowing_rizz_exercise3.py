@@ -33,41 +33,47 @@
 
 # 1. THE SETUP (Import the shit we need)
 import tensorflow as tf  # The AI brain framework (like React for AI)
-from tensorflow.keras import layers, models  # Tools to build the AI brain (like components in React)
+from rizz_backbones import build_rizz_model  # Pro brain + standard head + compile, from one config
 from tensorflow.keras.preprocessing.image import ImageDataGenerator  # For loading your own images (like importing shitty GoPro footage)
 import numpy as np  # Math stuff (like using lodash for numbers)
 import time  # Time tracking (like setTimeout in JS, but for Python)
-
-# 2. DOWNLOAD THE "PRO BRAIN" (MobileNetV2)
-# We say include_top=False to chop off its original "head" (output layer)
-base_model = tf.keras.applications.MobileNetV2(
-    input_shape=(224, 224, 3),  # Shape of the images (224x224 pixels, 3 colors = RGB)
-    include_top=False,  # We don't want its original brain, just the body
-    weights='imagenet'  # Pre-trained weights (like Kelly's muscle memory)
-)
-
-# Freeze the base model (so it doesn't forget Kelly's skills)
-# This is like putting Kelly Slater in a straightjacket so he can't move his arms while you try to copy his stance.
-base_model.trainable = False
-
-# 3. BUILD YOUR OWN "SHITTY BRAIN" ON TOP
-# Now we add our own layers on top of the "pro brain" we borrowed.
-# This is like duct-taping a GoPro to Kelly Slater's board so you can record his moves.
-model = models.Sequential([
-    base_model,  # The pro brain (Kelly Slater)
-    layers.GlobalAveragePooling2D(),  # Squish the 3D data into 1D (like flattening a surfboard into a pancake)
-    layers.Dense(128, activation='relu'),  # A layer with 128 neurons (like adding 128 tiny surf instructors to your brain)
-    layers.Dropout(0.2),  # Randomly turn off 20% of neurons (like randomly forgetting 20% of Kelly's tips)
-    layers.Dense(2, activation='softmax')  # Final layer for 2 classes (e.g., "wipeout" vs. "shredding")
-])
-
-# 4. COMPILE THE MODEL (Get it ready for training)
-# This is like setting up your GoPro to record in 4K before you start filming.
-model.compile(
-    optimizer='adam',  # The optimizer (like a surf coach who adjusts your stance)
-    loss='sparse_categorical_crossentropy',  # The loss function (like a scoreboard for your surfing)
-    metrics=['accuracy']  # What we track (like counting how many waves you don't wipe out on)
-)
+import math  # For counting batches (like Math.ceil in JS)
+from rizz_feature_cache import cached_features, files_fingerprint, build_feature_head, attach_head  # Run the frozen pro brain only once
+from rizz_shards import ingest, ShardStore, ShardSequence  # Decode the JPEGs once, not every epoch
+from rizz_augment import BatchAugmenter  # One affine matrix per image, one resampling pass per batch
+from rizz_producer import AugmentProducer, StarvationMonitor  # A crew of worker processes making batches
+
+# SHARD CACHE: decode + resize training-data/ ONCE into uint8 shards (only new/changed files get
+# re-decoded next time), then augment on the fly from the cached pixels. False = plain flow_from_directory.
+SHARD_CACHE = True
+# VECTORIZED AUGMENT (needs SHARD_CACHE): rotate/shift/flip the whole batch in one NumPy pass (rizz_augment.py)
+VECTORIZED_AUGMENT = True
+# POOL WORKERS: > 0 = decode + augment the TRAINING batches in that many worker processes, handed back
+# through shared memory (rizz_producer.py). Reads the JPEGs itself, so it skips the shard cache. 0 = off.
+POOL_WORKERS = 0
+
+# FEATURE CACHE (opt-in): the base model is frozen, so cache its features once and train only the head.
+# Heads up: cached features come from UN-augmented images (random flips/shifts would change the
+# features every epoch, which is the whole thing we're skipping) - so this lesson's augmentation
+# (and Exercise 4) does nothing while it's on. False = the augmented training path.
+FEATURE_CACHE = False
+
+# 2. BORROW THE "PRO BRAIN" (MobileNetV2) + 3. BUILD YOUR "SHITTY BRAIN" ON TOP + 4. COMPILE
+# One config does all three (see rizz_backbones.py - like passing an options object to a JS factory):
+# - chops off MobileNetV2's original head (include_top=False) and loads its ImageNet weights (Kelly's muscle memory)
+# - duct-tapes our head on top: GlobalAveragePooling2D → Dense(128) → Dropout(0.2) → Dense(N, softmax)
+# - compiles with sparse_categorical_crossentropy + accuracy
+# The base model comes back frozen (like putting Kelly Slater in a straightjacket so his
+# weights won't change while you copy his stance).
+# The registry caches loaded backbones, so a second model in the same process reuses the same weights.
+RIZZ_CONFIG = {
+    "backbone": "MobileNetV2",  # The pro brain (Kelly Slater)
+    "input_shape": (224, 224, 3),  # Shape of the images (224x224 pixels, 3 colors = RGB)
+    "weights": "imagenet",  # Pre-trained weights (like Kelly's muscle memory)
+    "num_classes": 2,  # Final layer classes ("wipeout" vs. "shredding")
+}
+model, base_model = build_rizz_model(RIZZ_CONFIG)
+BACKBONE_ID = (RIZZ_CONFIG["backbone"], RIZZ_CONFIG["weights"], RIZZ_CONFIG["input_shape"][:2])  # What the caches key on
 
 # 5. LOAD YOUR "SHITTY DATASET" (FROM training-data FOLDER)
 # This is like importing your shitty GoPro footage instead of watching Kelly's highlight reel.
@@ -81,38 +87,89 @@ train_datagen = ImageDataGenerator(
     validation_split=0.2  # Use 20% of data for validation (like holding back some footage for testing)
 )
 
-# Load training data (80% of images)
-train_generator = train_datagen.flow_from_directory(
-    'training-data',  # Path to your training data folder (like "GoPro Footage")
-    target_size=(224, 224),  # Resize images to 224x224 (like stretching shitty footage to 4K)
-    batch_size=32,  # Number of images per batch (like how many waves you can remember at once)
-    class_mode='sparse',  # Use sparse labels (like "0 = wipeout", "1 = shredding")
-    subset='training'  # This is the training subset
-)
-
-# Load validation data (20% of images)
-validation_generator = train_datagen.flow_from_directory(
-    'training-data',  # Same folder as training data
-    target_size=(224, 224),  # Resize images to 224x224
-    batch_size=32,  # Number of images per batch
-    class_mode='sparse',  # Use sparse labels
-    subset='validation'  # This is the validation subset
-)
+if SHARD_CACHE:
+    # One-time decode (like ripping a DVD once instead of re-reading the disc every time)
+    ingest('training-data', target_size=(224, 224))
+    shard_store = ShardStore()
+
+
+def load_footage(datagen, subset, shuffle=True):
+    """Batches of `training-data` for one subset - from a worker pool, the shard cache, or straight from the JPEGs."""
+    if POOL_WORKERS and subset == 'training' and shuffle:
+        return AugmentProducer.from_directory('training-data', subset, 0.2, target_size=(224, 224), batch_size=32,
+                                              augmenter=BatchAugmenter.from_datagen(datagen),
+                                              rescale=datagen.rescale, workers=POOL_WORKERS, seed=42)
+    if SHARD_CACHE:
+        augmenter = BatchAugmenter.from_datagen(datagen) if VECTORIZED_AUGMENT else None
+        return ShardSequence(shard_store, datagen, subset=subset, batch_size=32, shuffle=shuffle,
+                             augmenter=augmenter)
+    return datagen.flow_from_directory(
+        'training-data',  # Path to your training data folder (like "GoPro Footage")
+        target_size=(224, 224),  # Resize images to 224x224 (like stretching shitty footage to 4K)
+        batch_size=32,  # Number of images per batch (like how many waves you can remember at once)
+        class_mode='sparse',  # Use sparse labels (like "0 = wipeout", "1 = shredding")
+        subset=subset,  # 'training' (80%) or 'validation' (20%)
+        shuffle=shuffle
+    )
+
+
+if FEATURE_CACHE:
+    # Same folders + same 80/20 split, but no augmentation and no shuffling: we only watch each photo once
+    feature_datagen = ImageDataGenerator(rescale=1./255, validation_split=0.2)
+    feature_flows = {subset: load_footage(feature_datagen, subset, shuffle=False) for subset in ('training', 'validation')}
+    class_indices = feature_flows['training'].class_indices
+else:
+    # Load validation data (20% of images). The augmented training batches (80%) get built right where
+    # fit() uses them below - a worker pool shouldn't be forked until we actually train on it.
+    validation_generator = load_footage(train_datagen, 'validation')
+    class_indices = validation_generator.class_indices
 
 # Print class indices (so you know what's what)
 print("🏄‍♂️ Class indices (what the model thinks your folders mean):")
-print(train_generator.class_indices)
+print(class_indices)
 
 # 6. TRAIN THE MODEL (Start copying Kelly's moves)
 print("🏄‍♂️ Starting training... (This is where the magic happens, brah)")
 start_time = time.time()  # Start the timer (like hitting "record" on your GoPro)
 
 # Train the model (like practicing surfing for 10 epochs)
-history = model.fit(
-    train_generator,  # Your shitty GoPro footage (training data)
-    epochs=10,  # Number of training cycles (like 10 days at surf camp)
-    validation_data=validation_generator  # Validation data (like your first real surf session)
-)
+if FEATURE_CACHE:
+    cached = {}
+    for subset, flow in feature_flows.items():
+        cached[subset] = cached_features(
+            base_model, *BACKBONE_ID,
+            f"training-data-{subset}-rescale255-{files_fingerprint(flow.filepaths)}",
+            flow, flow.samples, steps=math.ceil(flow.samples / flow.batch_size)
+        )
+    train_features, train_labels = cached['training']
+    val_features, val_labels = cached['validation']
+    head = build_feature_head(train_features.shape[1], 2)
+    history = head.fit(
+        train_features, train_labels,  # Cached features instead of raw images
+        epochs=10,
+        validation_data=(val_features, val_labels)
+    )
+    model = attach_head(base_model, head)  # Glue the trained head back on so the saved model eats images
+elif POOL_WORKERS:
+    # `with` = try/finally: even if fit() crashes or you Ctrl+C, the worker crew goes home and the
+    # shared memory slots are freed (leaked /dev/shm segments outlive the process)
+    with load_footage(train_datagen, 'training') as train_generator:
+        history = model.fit(
+            train_generator,  # Batches cooked by the worker crew
+            epochs=10,
+            validation_data=validation_generator,
+            shuffle=False,  # The producer reshuffles itself (deterministically, from its seed)
+            workers=0,  # Our worker processes do the parallel work, no extra Keras threads
+            callbacks=[StarvationMonitor(train_generator)]  # How long fit() sat waiting for batches
+        )
+else:
+    # Load training data (80% of images)
+    train_generator = load_footage(train_datagen, 'training')
+    history = model.fit(
+        train_generator,  # Your shitty GoPro footage (training data)
+        epochs=10,  # Number of training cycles (like 10 days at surf camp)
+        validation_data=validation_generator  # Validation data (like your first real surf session)
+    )
 
 # Stop the timer and print how long it took
 training_time = time.time() - start_time
@@ -121,7 +178,10 @@ print("🎉 Training complete! Now go shred some waves, dude!")
 
 # 7. EVALUATE THE MODEL (See if your GoPro footage helped)
 # This is like watching the footage and realizing you still look like a drunk kangaroo.
-test_loss, test_acc = model.evaluate(validation_generator, verbose=2)
+if FEATURE_CACHE:
+    test_loss, test_acc = head.evaluate(val_features, val_labels, verbose=2)  # No need to re-run the backbone
+else:
+    test_loss, test_acc = model.evaluate(validation_generator, verbose=2)
 print(f"\n📊 Validation accuracy: {test_acc:.4f} (If this is below 0.5, you're cooked)")
 
 # 8. SAVE THE MODEL (So you don't have to train it again)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+CHILD RUNS - Race every contender in its own fresh Python process.
+
+Peak RSS never goes down, and TensorFlow keeps its caches, threads and traced graphs around, so
+the second contender in a shared process always gets a rigged race. The benchmarks here start a
+fresh child per contender instead (like spawning a new Node worker per test):
+
+    parent:  row = run_child(__file__, [mode, samples], label=mode)
+    child:   if args.child: print(json.dumps(run_one(*json.loads(args.child))))
+
+The child's LAST stdout line is its JSON result, so it can print whatever it likes before that.
+"""
+
+import json
+import os
+import resource
+import subprocess
+import sys
+
+
+class ChildCrashed(RuntimeError):
+    """A child run exited non-zero. `stderr` holds the tail of what it said on the way down."""
+
+    def __init__(self, label, stderr):
+        super().__init__(f"{label} wiped out:\n{stderr}")
+        self.stderr = stderr
+
+
+def peak_rss_mb():
+    """This process's peak resident memory, in MB."""
+    # ru_maxrss is KB on Linux, bytes on macOS (because of course it is)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_child(script, payload, label="child", env=None, cpu_only=True):
+    """
+    Run `python <script> --child '<payload as JSON>'` and return the JSON it prints last.
+
+    Args:
+        script (str): The benchmark module's `__file__`
+        payload: Anything JSON-able - the child gets it back with `json.loads(args.child)`
+        label (str): Names the run in the error message
+        env (dict): Environment for the child (default: ours)
+        cpu_only (bool): Hide the GPUs, so every contender races on the same CPU
+
+    Raises:
+        ChildCrashed: If the child exits non-zero
+    """
+    env = dict(os.environ if env is None else env)
+    if cpu_only:
+        env["CUDA_VISIBLE_DEVICES"] = ""
+    proc = subprocess.run([sys.executable, script, "--child", json.dumps(payload)], capture_output=True,
+                          text=True, env=env)
+    if proc.returncode != 0:
+        raise ChildCrashed(label, proc.stderr[-2000:])
+    return json.loads(proc.stdout.strip().splitlines()[-1])
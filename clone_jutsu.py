@@ -6,6 +6,10 @@ import tensorflow as tf  # The AI brain (like TensorFlow.js but in Python)
 from tensorflow.keras.preprocessing.image import ImageDataGenerator, img_to_array, load_img  # Magic image tools
 import matplotlib.pyplot as plt  # Like a JS canvas, but for showing images
 import numpy as np  # Math magic (like NumPy in JS, but way more powerful)
+from rizz_augment import BatchAugmenter  # The same spins, but all 10 clones in one go
+
+# True = make all 10 clones in ONE vectorized pass (rizz_augment.py), False = the classic one-by-one `flow()` loop
+BATCH_CLONES = True
 
 # =============================================
 # 2. THE CLONE MACHINE (Our Magic Spinner)
@@ -49,15 +53,22 @@ print("Creating 10 clones of your image... watch the rizz happen.")
 # Set up a big canvas to show all the clones (like `document.createElement('canvas')` in JS)
 plt.figure(figsize=(10, 10))  # 10x10 inches canvas
 
-# Loop through the clone machine (like `for (let i = 0; i < 10; i++)` in JS)
-i = 0
-for batch in datagen.flow(x, batch_size=1):  # `flow()` is like a JS generator
-    # Add the cloned image to our canvas (like `ctx.drawImage()` in JS)
-    plt.subplot(3, 4, i + 1)  # Arrange clones in a 3x4 grid (like CSS Grid)
-    plt.imshow(batch[0].astype('uint8'))  # Show the image (convert numbers to pixels)
+if BATCH_CLONES:
+    # Copy the image 10 times and spin all copies at once (like `Promise.all()` instead of a `for` loop)
+    clones = BatchAugmenter.from_datagen(datagen).augment(np.repeat(x, 10, axis=0))
+    for i, clone in enumerate(clones):
+        plt.subplot(3, 4, i + 1)  # Arrange clones in a 3x4 grid (like CSS Grid)
+        plt.imshow(clone.astype('uint8'))  # Show the image (convert numbers to pixels)
+else:
+    # Loop through the clone machine (like `for (let i = 0; i < 10; i++)` in JS)
+    i = 0
+    for batch in datagen.flow(x, batch_size=1):  # `flow()` is like a JS generator
+        # Add the cloned image to our canvas (like `ctx.drawImage()` in JS)
+        plt.subplot(3, 4, i + 1)  # Arrange clones in a 3x4 grid (like CSS Grid)
+        plt.imshow(batch[0].astype('uint8'))  # Show the image (convert numbers to pixels)
 
-    i += 1
-    if i % 10 == 0: break  # Stop after 10 clones (like `break` in JS)
+        i += 1
+        if i % 10 == 0: break  # Stop after 10 clones (like `break` in JS)
 
 # Show the canvas (like `canvas.style.display = 'block'` in JS)
 plt.show()
\ No newline at end of file
@@ -12,6 +12,8 @@
 # - JS: `const model = await tf.loadLayersModel('model.json')` → Python: `tf.keras.models.load_model('best_brain.h5')`
 # """
 
+import io                # In-memory files (like a JS `Blob`)
+import os                # File paths (like Node's `path` module)
 import tensorflow as tf  # The "AI Brain Library" (like TensorFlow.js in Python)
 import numpy as np       # The "Math Magic Library" (like NumJS in Python)
 from PIL import Image    # The "Image Helper" (like `new Image()` in JS)
@@ -24,8 +26,19 @@ from PIL import Image    # The "Image Helper" (like `new Image()` in JS)
 #
 # Why `.h5`? It's like a `.zip` file for your AI brain—holds all the weights!
 # If it fails, it's like trying to load a `.js` file that doesn't exist.
+#
+# On a CPU-only box? Convert once with `python rizz_tflite.py best_brain.h5`, then point this at a
+# .tflite file to run on the lightweight TFLite interpreter instead of full Keras
+# (e.g. 'best_brain.int8.tflite'). Same `model.predict(...)` calls either way.
+TFLITE_MODEL = None
+
+model = None
 try:
-    model = tf.keras.models.load_model('best_brain.h5')
+    if TFLITE_MODEL:
+        from rizz_tflite import TFLiteRunner
+        model = TFLiteRunner(TFLITE_MODEL)
+    else:
+        model = tf.keras.models.load_model('best_brain.h5')
     print("🔥 AI IS LOADED AND READY TO SLAY! (Like a fully charged PlayStation!)")
 except Exception as e:
     print(f"🤬 D'oh! No model found. Use your Week 8 weights, brah! Error: {e}")
@@ -38,6 +51,115 @@ except Exception as e:
 # `async function predictWithRizz(imagePath) { ... }`
 #
 # It takes an image path (like `'pizza.jpg'`) and returns the AI's guess.
+IMAGE_SIZE = (160, 160)  # Adjust to YOUR model's input size!
+# FAST DECODE: let JPEGs decode straight at 1/2, 1/4 or 1/8 size (rizz_decode.py) instead of decoding
+# all 12 megapixels of a phone photo and shrinking them. False = the classic full decode below.
+FAST_DECODE = True
+# PREDICTION CACHE: same image bytes + same brain = same answer, so remember it (rizz_prediction_cache.py)
+# in memory (LRU, 1024 answers) and on disk (survives restarts). Overwrite best_brain.h5 and every
+# old answer is dropped automatically. False = always ask the AI.
+PREDICTION_CACHE = True
+
+prediction_cache = None
+if PREDICTION_CACHE and model is not None:
+    from rizz_prediction_cache import PredictionCache
+    prediction_cache = PredictionCache(
+        TFLITE_MODEL or 'best_brain.h5',  # The file whose changes wipe the cache
+        capacity=1024,
+        disk_path=os.path.join('rizz_cache', 'predictions.sqlite'),
+        salt=f"{IMAGE_SIZE}:{FAST_DECODE}"  # Different preprocessing = different answers
+    )
+
+
+def _read_bytes(image):
+    """The raw bytes of a path or file-like object (what the prediction cache hashes)."""
+    if hasattr(image, "read"):
+        return image.read()
+    with open(image, "rb") as f:
+        return f.read()
+
+
+def load_rizz_image(image_path):
+    """
+    Open + resize + normalize one image (like `tf.browser.fromPixels(image).div(255)` in JS).
+    `image_path` can also be a file-like object (e.g. the bytes of an uploaded photo).
+    """
+    if FAST_DECODE:
+        from rizz_decode import decode_image
+        return decode_image(image_path, IMAGE_SIZE)  # Reduced-scale decode + one float32 normalize
+    # - `Image.open()` is like `new Image()` in JS
+    # - `.convert("RGB")` makes sure every image has 3 channels (PNGs can sneak in a 4th, alpha)
+    # - `.resize()` is like `image.width = 160; image.height = 160;`
+    img = Image.open(image_path).convert("RGB").resize(IMAGE_SIZE)
+    # `/ 255.0` normalizes it (like `tensor.div(tf.scalar(255))` in JS)
+    return np.array(img) / 255.0
+
+
+def vibe_check(score):
+    """
+    Turn a model score into a verdict (like `score > 0.5 ? "BUSSIN" : "BASIC"` in JS).
+    - If your model has 2 classes (e.g., "Basic" vs. "Bussin"), it returns `[score_class0, score_class1]`
+    - Here, we assume `prediction[0]` is the score for "Basic" (adjust if needed!)
+
+    Returns:
+        tuple: ("BUSSIN" or "BASIC", confidence between 0.5 and 1)
+    """
+    score = float(score)
+    if score > 0.5:
+        return "BUSSIN", score
+    return "BASIC", 1 - score
+
+
+def print_vibe(verdict, confidence):
+    """Print the AI's "vibe check" (like `console.log()` in JS) and hand the verdict back."""
+    if verdict == "BUSSIN":
+        print(f"🍕 AI VIBE: BUSSIN! (Confidence: {confidence*100:.1f}%) 🔥")
+    else:
+        print(f"🤮 AI VIBE: BASIC... (Confidence: {confidence*100:.1f}%) 😬")
+    return verdict, confidence
+
+
+def predict_many(image_paths, batch_size=32):
+    """
+    Guess a whole pile of images with ONE model call per batch (like `Promise.all` instead of
+    awaiting each image in a loop). Skips the per-call `model.predict` overhead, too.
+    With the prediction cache on, only the images it hasn't seen go through the model - one
+    `batch_size` chunk at a time, so only that chunk's file bytes are ever held in memory.
+
+    Returns:
+        list: One (verdict, confidence) per image, in the same order as `image_paths`
+    """
+    if prediction_cache is None:
+        return _predict_batches(image_paths, batch_size)
+    results = []
+    for start in range(0, len(image_paths), batch_size):
+        blobs = [_read_bytes(path) for path in image_paths[start:start + batch_size]]
+        chunk = [prediction_cache.get(blob) for blob in blobs]
+        misses = [i for i, result in enumerate(chunk) if result is None]
+        fresh = _predict_batches([io.BytesIO(blobs[i]) for i in misses], batch_size) if misses else []
+        for i, result in zip(misses, fresh):
+            prediction_cache.put(blobs[i], result)
+            chunk[i] = result
+        results.extend(chunk)
+    return results
+
+
+def _predict_batches(image_paths, batch_size):
+    """The uncached part of `predict_many`: decode + one forward pass per batch."""
+    results = []
+    if FAST_DECODE:
+        from rizz_decode import prefetch_batches
+        # A thread pool decodes the NEXT batch while the model chews on this one
+        batches = (batch for _, batch in prefetch_batches(image_paths, batch_size, IMAGE_SIZE))
+    else:
+        batches = (np.stack([load_rizz_image(path) for path in image_paths[start:start + batch_size]])
+                   for start in range(0, len(image_paths), batch_size))
+    for batch in batches:
+        predictions = model.predict_on_batch(batch)  # One forward pass, no predict() loop machinery
+        results.extend(vibe_check(prediction[0]) for prediction in np.asarray(predictions))
+    return results
+
+
 def predict_with_rizz(image_path):
     """
     AI's "Guessing Machine" 🤖
@@ -50,15 +172,17 @@ def predict_with_rizz(image_path):
     5. Return the vibe (like `console.log("BUSSIN!");`)
     """
 
-    # Step 1: Open the image (like `new Image()` in JS)
-    # - `Image.open()` is like `new Image()` in JS
-    # - `.resize()` is like `image.width = 160; image.height = 160;`
-    img = Image.open(image_path).resize((160, 160))  # Adjust to YOUR model's input size!
+    # Step 0: Seen these EXACT bytes with this exact brain before? Skip it all (like an HTTP cache hit)
+    image_bytes = None
+    if prediction_cache is not None:
+        image_bytes = _read_bytes(image_path)
+        cached = prediction_cache.get(image_bytes)
+        if cached is not None:
+            return print_vibe(*cached)
+        image_path = io.BytesIO(image_bytes)  # Decode the bytes we already read (no second disk trip)
 
-    # Step 2: Convert to numbers (like `tf.browser.fromPixels(image)` in JS)
-    # - `np.array(img)` turns the image into a "number grid" (like a 3D array in JS)
-    # - `/ 255.0` normalizes it (like `tensor.div(tf.scalar(255))` in JS)
-    img_array = np.array(img) / 255.0
+    # Step 1 + 2: Open, resize and convert to numbers (see `load_rizz_image` above)
+    img_array = load_rizz_image(image_path)
 
     # Step 3: Add a "batch dimension" (like `tf.expandDims(tensor, 0)` in JS)
     # - AI expects `[batch_size, height, width, channels]`
@@ -71,15 +195,12 @@ def predict_with_rizz(image_path):
     prediction = model.predict(img_array)
 
     # Step 5: Interpret the vibe (like `if (score > 0.5) { ... }` in JS)
-    # - If your model has 2 classes (e.g., "Basic" vs. "Bussin"), it returns `[score_class0, score_class1]`
-    # - Here, we assume `prediction[0][0]` is the score for "Basic" (adjust if needed!)
-    score = prediction[0][0]
+    verdict, confidence = vibe_check(prediction[0][0])
+    if image_bytes is not None:
+        prediction_cache.put(image_bytes, (verdict, confidence))  # Next repost is free
 
     # Print the AI's "vibe check" (like `console.log()` in JS)
-    if score > 0.5:
-        print(f"🍕 AI VIBE: BUSSIN! (Confidence: {score*100:.1f}%) 🔥")
-    else:
-        print(f"🤮 AI VIBE: BASIC... (Confidence: {(1-score)*100:.1f}%) 😬")
+    return print_vibe(verdict, confidence)
 
 # =============================================
 # 3. THE LIVE DEMO 🎤 (The "Test Drive")
@@ -89,3 +210,10 @@ def predict_with_rizz(image_path):
 
 # predict_with_rizz('secret_test_image.jpg')
 
+# Got a whole folder? One batched call instead of a loop (like `Promise.all` in JS):
+# print(predict_many(['pizza1.jpg', 'pizza2.jpg', 'pizza3.jpg']))
+# Or a whole folder: `from rizz_decode import image_paths` → predict_many(image_paths('my-photos'))
+
+# Lots of callers at once (a web app, a bot)? See rizz_service.py - it groups
+# concurrent requests into micro-batches for you.
+
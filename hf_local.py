@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+HF LOCAL - Load Hugging Face models from a local folder, offline, despite our own transformers.py.
+
+Two gotchas with `from transformers import pipeline` in this repo:
+1. Our lesson file is CALLED transformers.py. Python checks the script's folder first, so
+   `import transformers` finds the lesson, not the library (like a local `node_modules/react`
+   folder that's actually your homework). `import_hf()` imports the real library with this
+   folder temporarily off `sys.path`.
+2. `pipeline("sentiment-analysis")` downloads from the Hub on every fresh machine. For millions
+   of comments (or a plane), we want the weights in a folder and the network OFF:
+       python hf_local.py --download distilbert-base-uncased-finetuned-sst-2-english gpt2 distilgpt2
+   saves them under hf_models/, and everything else loads with `local_files_only=True`.
+
+Usage from another script:
+    from hf_local import load_pipeline
+    vibe_checker = load_pipeline("sentiment-analysis", SENTIMENT_MODEL)
+"""
+
+import argparse
+import importlib
+import os
+import sys
+
+MODELS_DIR = os.environ.get("HF_MODELS_DIR", "hf_models")
+SENTIMENT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"  # What pipeline("sentiment-analysis") picks
+STORY_MODEL = "gpt2"
+DRAFT_MODEL = "distilgpt2"  # Same tokenizer as gpt2, 6 layers instead of 12
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+# =============================================
+# 1. THE REAL `transformers` (Not Our Lesson File)
+# =============================================
+def _is_here(path):
+    return os.path.abspath(path or os.getcwd()) == _HERE
+
+
+def import_hf(offline=True):
+    """
+    The Hugging Face `transformers` module, even when run from this folder.
+
+    Args:
+        offline (bool): Flip the Hub's offline switches first (must happen before the first import)
+    """
+    if offline:
+        os.environ.setdefault("HF_HUB_OFFLINE", "1")
+        os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+    module = sys.modules.get("transformers")
+    if module is not None and not _is_here(os.path.dirname(getattr(module, "__file__", None) or "")):
+        return module  # Already the real one
+    sys.modules.pop("transformers", None)  # Someone imported the lesson file under that name
+    saved = sys.path[:]
+    sys.path[:] = [p for p in sys.path if not _is_here(p)]
+    try:
+        return importlib.import_module("transformers")
+    finally:
+        sys.path[:] = saved
+
+
+# =============================================
+# 2. LOCAL MODEL FOLDERS
+# =============================================
+def model_dir(name):
+    """hf_models/<name> - raises with the download command if it isn't there yet."""
+    if os.path.isdir(name):
+        return name  # Already a path
+    path = os.path.join(MODELS_DIR, name.replace("/", "--"))
+    if not os.path.isfile(os.path.join(path, "config.json")):
+        raise FileNotFoundError(f"No local copy of {name!r} in {path} - run: python hf_local.py --download {name}")
+    return path
+
+
+def download(name):
+    """Fetch config + tokenizer + weights (safetensors if available) into hf_models/<name>. Needs the network."""
+    from huggingface_hub import snapshot_download
+
+    path = os.path.join(MODELS_DIR, name.replace("/", "--"))
+    snapshot_download(name, local_dir=path, allow_patterns=["*.json", "*.txt", "*.model", "*.safetensors"])
+    if not any(f.endswith(".safetensors") for f in os.listdir(path)):
+        snapshot_download(name, local_dir=path, allow_patterns=["pytorch_model.bin"])  # Older repos
+    return path
+
+
+def load_pipeline(task, name, **kwargs):
+    """`pipeline(task)` from a local folder, on CPU, with no network calls."""
+    path = model_dir(name)
+    return import_hf().pipeline(task, model=path, tokenizer=path, device=-1, **kwargs)
+
+
+def load_classifier(name=SENTIMENT_MODEL):
+    """(tokenizer, model) for sequence classification, in eval mode."""
+    hf = import_hf()
+    path = model_dir(name)
+    tokenizer = hf.AutoTokenizer.from_pretrained(path, local_files_only=True)
+    model = hf.AutoModelForSequenceClassification.from_pretrained(path, local_files_only=True).eval()
+    return tokenizer, model
+
+
+def load_causal_lm(name=STORY_MODEL):
+    """(tokenizer, model) for GPT-2-style generation, in eval mode. GPT-2 has no pad token, so pad = EOS."""
+    hf = import_hf()
+    path = model_dir(name)
+    tokenizer = hf.AutoTokenizer.from_pretrained(path, local_files_only=True)
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+    model = hf.AutoModelForCausalLM.from_pretrained(path, local_files_only=True).eval()
+    return tokenizer, model
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Download Hugging Face models once, then run them offline")
+    parser.add_argument("--download", nargs="+", metavar="MODEL", default=[],
+                        help=f"e.g. {SENTIMENT_MODEL} {STORY_MODEL} {DRAFT_MODEL}")
+    args = parser.parse_args()
+
+    for name in args.download:
+        print(f"🏄‍♂️ {name} → {download(name)}")
+    if os.path.isdir(MODELS_DIR):
+        print(f"🤙 Local models in {MODELS_DIR}: {', '.join(sorted(os.listdir(MODELS_DIR))) or '(none)'}")
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+HF QUANTIZE - Shrink the Vibe-Checker and the Storyteller to int8 for CPU.
+
+Both models in transformers.py run every matrix multiply in fp32 (4 bytes per weight). Dynamic
+int8 quantization stores the Linear weights as 1-byte ints (+ one scale per tensor) and quantizes
+the activations on the fly, so the big matmuls run on int8 kernels (like shipping a minified
+bundle instead of the source maps):
+
+1. GPT-2 is built from `Conv1D` layers (a Linear with the weight stored transposed), which the
+   quantizer doesn't recognise - swap each one for a real `nn.Linear` with the same numbers first
+2. `torch.quantization.quantize_dynamic` on every Linear. GPT-2's `lm_head` is skipped: it shares
+   its weight with the token embeddings, and quantizing it would store a second copy
+3. Cache it on disk (hf_models/int8/<name>): config + tokenizer + the int8 state dict. Loading
+   rebuilds the same skeleton and pours the int8 weights back in - no re-quantizing
+4. Hand it to `pipeline(...)` exactly like the fp32 model, so callers don't change
+
+Quantize once (after `python hf_local.py --download ...`), then compare int8 vs fp32:
+    python hf_quantize.py --quantize
+    python hf_quantize.py --eval
+"""
+
+import argparse
+import importlib
+import io
+import json
+import os
+import statistics
+import time
+
+from hf_local import MODELS_DIR, SENTIMENT_MODEL, STORY_MODEL, import_hf, load_causal_lm, load_classifier, model_dir
+
+QUANT_DIR = os.path.join(MODELS_DIR, "int8")
+WEIGHTS_FILE = "int8_state_dict.pt"
+META_FILE = "quantized.json"  # Written LAST - if it's there, the rest of the folder is complete
+TASKS = {"sentiment-analysis": SENTIMENT_MODEL, "text-generation": STORY_MODEL}
+
+COMMENTS = [
+    "Brah, that 360 air was absolutely gnarly! 🤙",
+    "Your code is mid and your layout is bogus. L.",
+    "I'm lowkey stoked about this pizza.",
+    "The waves were flat all day, total waste of a trip.",
+    "Best session of my life, the barrels just kept coming.",
+    "That board snapped on the first wave. Never buying from them again.",
+    "The lifeguard was super chill and helped us find a good spot.",
+    "Crowded, cold, and the parking ticket was the only thing I caught.",
+]
+PERPLEXITY_TEXT = (
+    "The surfer paddled out before sunrise, when the water was still glassy and the wind had not picked up yet. "
+    "A long set rolled in from the south, and she turned, took two strong strokes and dropped into the first wave. "
+    "It stood up tall over the reef, and for a few seconds she was inside the barrel, watching the light come "
+    "through the lip. Back on the beach, her friends were already arguing about who would get the next one."
+)
+
+
+# =============================================
+# 1. CONV1D → LINEAR → INT8
+# =============================================
+def conv1d_to_linear(model):
+    """Replace every GPT-2 `Conv1D` with an equivalent `nn.Linear` (in place). Returns how many were swapped."""
+    import torch
+
+    conv1d = importlib.import_module("transformers.pytorch_utils").Conv1D  # import_hf() has loaded the real package
+    swaps = [(name, module) for name, module in model.named_modules() if isinstance(module, conv1d)]
+    for name, module in swaps:
+        n_in, n_out = module.weight.shape  # Conv1D stores (in, out); Linear wants (out, in)
+        linear = torch.nn.Linear(n_in, n_out)
+        with torch.no_grad():
+            linear.weight.copy_(module.weight.t())
+            linear.bias.copy_(module.bias)
+        parent_name, _, child = name.rpartition(".")
+        setattr(model.get_submodule(parent_name) if parent_name else model, child, linear)
+    return len(swaps)
+
+
+def quantize(model):
+    """Dynamic int8 on every Linear except a weight-tied output head. Returns the quantized model."""
+    import torch
+
+    conv1d_to_linear(model)
+    tied = model.get_output_embeddings() if model.config.tie_word_embeddings else None
+    targets = {name: torch.quantization.default_dynamic_qconfig for name, module in model.named_modules()
+               if isinstance(module, torch.nn.Linear) and module is not tied}
+    return torch.quantization.quantize_dynamic(model, targets, dtype=torch.qint8)
+
+
+def _auto_class(task):
+    hf = import_hf()
+    return hf.AutoModelForSequenceClassification if task == "sentiment-analysis" else hf.AutoModelForCausalLM
+
+
+def _load_fp32(task, name):
+    return load_classifier(name) if task == "sentiment-analysis" else load_causal_lm(name)
+
+
+# =============================================
+# 2. THE DISK CACHE (hf_models/int8/<name>)
+# =============================================
+def quantized_dir(name):
+    return os.path.join(QUANT_DIR, os.path.basename(os.path.normpath(name)).replace("/", "--"))
+
+
+def save_quantized(task, name=None):
+    """Quantize the local fp32 model for `task` and cache it. Returns the folder."""
+    import torch
+
+    name = name or TASKS[task]
+    tokenizer, model = _load_fp32(task, name)
+    path = quantized_dir(name)
+    os.makedirs(path, exist_ok=True)
+    meta_path = os.path.join(path, META_FILE)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)  # Half-rewritten folders must not look finished
+
+    fp32_bytes = state_dict_bytes(model)
+    model = quantize(model)
+    tokenizer.save_pretrained(path)
+    model.config.save_pretrained(path)
+    torch.save(model.state_dict(), os.path.join(path, WEIGHTS_FILE))
+    meta = {"task": task, "source": model_dir(name), "torch": torch.__version__,
+            "fp32_bytes": fp32_bytes, "int8_bytes": os.path.getsize(os.path.join(path, WEIGHTS_FILE))}
+    with open(meta_path, "w") as f:
+        json.dump(meta, f, indent=2)
+    return path
+
+
+def load_quantized(task, name=None):
+    """(tokenizer, int8 model) from the cache, quantizing first if it isn't there yet."""
+    import torch
+
+    name = name or TASKS[task]
+    path = quantized_dir(name)
+    if not os.path.exists(os.path.join(path, META_FILE)):
+        save_quantized(task, name)
+    hf = import_hf()
+    config = hf.AutoConfig.from_pretrained(path, local_files_only=True)
+    model = quantize(_auto_class(task).from_config(config).eval())  # Same skeleton, random weights...
+    model.load_state_dict(torch.load(os.path.join(path, WEIGHTS_FILE)))  # ...replaced by the cached int8 ones
+    tokenizer = hf.AutoTokenizer.from_pretrained(path, local_files_only=True)
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+    return tokenizer, model.eval()
+
+
+def load_quantized_pipeline(task, name=None, **kwargs):
+    """Drop-in for `load_pipeline(task, name)`: same pipeline object, int8 model inside."""
+    tokenizer, model = load_quantized(task, name)
+    return import_hf().pipeline(task, model=model, tokenizer=tokenizer, device=-1, **kwargs)
+
+
+# =============================================
+# 3. THE EVAL (int8 vs fp32: Quality, Size, Speed)
+# =============================================
+def state_dict_bytes(model):
+    """Serialized weight size - what you'd ship, not what Python happens to allocate."""
+    import torch
+
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell()
+
+
+def _median_seconds(fn, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def eval_sentiment(comments=COMMENTS, repeats=5, batch_size=8):
+    """Label agreement (int8 vs fp32), size, single-comment latency and batched throughput."""
+    from hf_local import load_pipeline
+
+    pipes = {"fp32": load_pipeline("sentiment-analysis", SENTIMENT_MODEL),
+             "int8": load_quantized_pipeline("sentiment-analysis")}
+    report = {}
+    for kind, pipe in pipes.items():
+        pipe(comments[:1])  # Warm-up
+        report[kind] = {"labels": [r["label"] for r in pipe(comments, batch_size=batch_size)],
+                        "bytes": state_dict_bytes(pipe.model),
+                        "latency_s": _median_seconds(lambda: pipe(comments[0]), repeats),
+                        "comments_per_s": len(comments) / _median_seconds(
+                            lambda: pipe(comments, batch_size=batch_size), repeats)}
+    agree = sum(a == b for a, b in zip(report["fp32"].pop("labels"), report["int8"].pop("labels")))
+    report["label_agreement"] = agree / len(comments)
+    return report
+
+
+def perplexity(model, tokenizer, text, stride=512):
+    """exp(mean next-token loss) over `text`, in windows of at most `stride` tokens."""
+    import math
+
+    import torch
+
+    ids = tokenizer(text, return_tensors="pt").input_ids
+    total, count = 0.0, 0
+    with torch.inference_mode():
+        for start in range(0, ids.shape[1] - 1, stride):
+            window = ids[:, start:start + stride + 1]
+            loss = model(input_ids=window, labels=window).loss  # Mean over len(window) - 1 predictions
+            total += loss.item() * (window.shape[1] - 1)
+            count += window.shape[1] - 1
+    return math.exp(total / count)
+
+
+def eval_story(text=PERPLEXITY_TEXT, prompt="The surfer dropped into a 10-foot wave and", new_tokens=40, repeats=3):
+    """Perplexity delta (int8 - fp32), size, and greedy generation latency/tokens-per-sec."""
+    from story_stream import StoryStreamer
+
+    models = {"fp32": load_causal_lm(STORY_MODEL), "int8": load_quantized("text-generation")}
+    report = {}
+    for kind, (tokenizer, model) in models.items():
+        streamer = StoryStreamer(model, tokenizer)
+        streamer.generate(prompt, max_new_tokens=2, temperature=0)  # Warm-up
+        seconds = _median_seconds(lambda: streamer.generate(prompt, max_new_tokens=new_tokens, temperature=0), repeats)
+        report[kind] = {"perplexity": perplexity(model, tokenizer, text), "bytes": state_dict_bytes(model),
+                        "latency_s": seconds, "tokens_per_s": streamer.last_stats["tokens"] / seconds}
+    report["perplexity_delta"] = report["int8"]["perplexity"] - report["fp32"]["perplexity"]
+    return report
+
+
+def _print_rows(title, report, speed_key, speed_label):
+    print(f"\n--- {title} ---")
+    print(f"{'':<6}{'MB':>9}{'latency s':>11}{speed_label:>14}")
+    for kind in ("fp32", "int8"):
+        row = report[kind]
+        print(f"{kind:<6}{row['bytes'] / 1e6:>9.1f}{row['latency_s']:>11.3f}{row[speed_key]:>14.1f}")
+    print(f"int8 is {report['fp32']['bytes'] / report['int8']['bytes']:.1f}x smaller, "
+          f"{report['fp32']['latency_s'] / report['int8']['latency_s']:.2f}x faster")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dynamic int8 quantization of the transformers.py pipelines")
+    parser.add_argument("--quantize", action="store_true", help=f"(Re)build the int8 cache in {QUANT_DIR}")
+    parser.add_argument("--eval", action="store_true", help="Compare int8 vs fp32 (agreement, perplexity, size, speed)")
+    parser.add_argument("--comments", default=None, help="Sentiment eval set: .jsonl or .txt (see vibe_batch.py)")
+    parser.add_argument("--text", default=None, help="Perplexity eval text file")
+    args = parser.parse_args()
+
+    if args.quantize:
+        for task, name in TASKS.items():
+            print(f"🏄‍♂️ {task}: {name} → {save_quantized(task, name)}")
+    if args.eval:
+        comments = COMMENTS
+        if args.comments:
+            from vibe_batch import read_comments
+            comments = [text for _, text in read_comments(args.comments)]
+        text = open(args.text, encoding="utf-8").read() if args.text else PERPLEXITY_TEXT
+
+        vibes = eval_sentiment(comments)
+        _print_rows("VIBE-CHECKER (sentiment)", vibes, "comments_per_s", "comments/s")
+        print(f"Label agreement: {vibes['label_agreement']:.1%} of {len(comments)} comments")
+
+        story = eval_story(text)
+        _print_rows("STORYTELLER (gpt2)", story, "tokens_per_s", "tokens/s")
+        print(f"Perplexity: {story['fp32']['perplexity']:.2f} → {story['int8']['perplexity']:.2f} "
+              f"({story['perplexity_delta']:+.2f})")
+    if not (args.quantize or args.eval):
+        parser.print_help()
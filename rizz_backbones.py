@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+RIZZ BACKBONES - One place to borrow any pro brain, with the standard head on top.
+
+Every borrowing_rizz script used to copy-paste the same three things:
+1. `tf.keras.applications.SomePro(input_shape=..., include_top=False, weights='imagenet')`
+2. The GlobalAveragePooling2D → Dense(128) → Dropout(0.2) → Dense(N) head
+3. The compile call
+
+Now it's one config dict (like a JS options object):
+    model, base_model = build_rizz_model({"backbone": "ResNet50", "num_classes": 10})
+
+Loading ImageNet weights means parsing a big .h5 file. We keep every loaded backbone
+in a process-level cache, so several heads or experiments in one process share ONE copy
+of the frozen weights (like importing the same JS module twice - you get the same object).
+
+Run this file directly to time cold vs warm construction for every backbone:
+    python rizz_backbones.py
+"""
+
+import argparse
+import time
+
+import tensorflow as tf
+from tensorflow.keras import layers, models
+
+from rizz_feature_cache import weights_fingerprint
+
+# The pro surfers we know how to borrow from (name → Keras constructor)
+# Heads up: EfficientNet has its own Rescaling layer built in and expects 0-255 pixels.
+BACKBONES = {
+    "MobileNetV2": tf.keras.applications.MobileNetV2,  # Kelly Slater: light + fast
+    "ResNet50": tf.keras.applications.ResNet50,  # John John Florence: big + smooth
+    "EfficientNetB0": tf.keras.applications.EfficientNetB0,  # Italo Ferreira: efficient AF
+}
+
+DEFAULT_CONFIG = {
+    "backbone": "MobileNetV2",
+    "input_shape": (224, 224, 3),
+    "weights": "imagenet",
+    "num_classes": 10,
+    "fine_tune_last": 0,  # 0 = fully frozen backbone; N = unfreeze the last N layers
+    "learning_rate": None,  # None = plain 'adam' when frozen, Adam(1e-5) when fine-tuning
+    "dense_units": 128,
+    "dropout": 0.2,
+}
+
+# Process-level cache: (name, input_shape, weights) → loaded backbone
+_BACKBONE_CACHE = {}
+
+
+# =============================================
+# 1. BORROW A PRO BRAIN (Cached)
+# =============================================
+def get_backbone(name, input_shape=(224, 224, 3), weights="imagenet"):
+    """
+    Return a (shared!) backbone, loading its weights only the first time.
+
+    The returned model is the SAME object for every caller with the same arguments,
+    so treat it as frozen. Need to fine-tune? Use `private_backbone` instead.
+
+    Raises:
+        ValueError: If `name` isn't in BACKBONES
+    """
+    if name not in BACKBONES:
+        raise ValueError(f"Unknown backbone {name!r}. Pick one of: {', '.join(BACKBONES)}")
+    key = (name, tuple(input_shape), weights_fingerprint(weights))
+    if key not in _BACKBONE_CACHE:
+        base_model = BACKBONES[name](input_shape=tuple(input_shape), include_top=False, weights=weights)
+        base_model.trainable = False
+        _BACKBONE_CACHE[key] = base_model
+    return _BACKBONE_CACHE[key]
+
+
+def private_backbone(name, input_shape=(224, 224, 3), weights="imagenet"):
+    """
+    A private copy for fine-tuning, cloned from the cached one in memory
+    (no second trip through the weight file, and other heads keep their frozen copy).
+    """
+    shared = get_backbone(name, input_shape, weights)
+    base_model = tf.keras.models.clone_model(shared)
+    base_model.set_weights(shared.get_weights())
+    return base_model
+
+
+def clear_backbone_cache():
+    """Forget every cached backbone (frees the memory once nobody else holds them)."""
+    _BACKBONE_CACHE.clear()
+
+
+# =============================================
+# 2. BUILD THE WHOLE BRAIN FROM ONE CONFIG
+# =============================================
+def build_rizz_model(config=None, **overrides):
+    """
+    Backbone + standard head + compile, from a config dict.
+
+    Args:
+        config (dict): Any keys from DEFAULT_CONFIG (missing ones use the defaults)
+        **overrides: Same keys, as keyword args (handy for one-off tweaks)
+
+    Returns:
+        tuple: (model, base_model) - `base_model` is handy for feature/activation caching
+    """
+    cfg = {**DEFAULT_CONFIG, **(config or {}), **overrides}
+    unknown = set(cfg) - set(DEFAULT_CONFIG)
+    if unknown:
+        raise ValueError(f"Unknown config keys: {', '.join(sorted(unknown))}")
+
+    fine_tune_last = cfg["fine_tune_last"]
+    if fine_tune_last:
+        # Fine-tuning changes weights, so this brain gets its own copy
+        base_model = private_backbone(cfg["backbone"], cfg["input_shape"], cfg["weights"])
+        base_model.trainable = True
+        for layer in base_model.layers[:-fine_tune_last]:
+            layer.trainable = False
+    else:
+        base_model = get_backbone(cfg["backbone"], cfg["input_shape"], cfg["weights"])
+
+    model = models.Sequential([
+        base_model,
+        layers.GlobalAveragePooling2D(),
+        layers.Dense(cfg["dense_units"], activation='relu'),
+        layers.Dropout(cfg["dropout"]),
+        layers.Dense(cfg["num_classes"], activation='softmax')
+    ])
+
+    learning_rate = cfg["learning_rate"]
+    if learning_rate is None:
+        optimizer = tf.keras.optimizers.Adam(1e-5) if fine_tune_last else 'adam'
+    else:
+        optimizer = tf.keras.optimizers.Adam(learning_rate)
+    model.compile(optimizer=optimizer, loss='sparse_categorical_crossentropy', metrics=['accuracy'])
+    return model, base_model
+
+
+# =============================================
+# 3. COLD VS WARM (How Much the Cache Saves)
+# =============================================
+def measure_construction(names=None, input_shape=(224, 224, 3), weights="imagenet"):
+    """
+    Time building each backbone cold (parse the weight file) and warm (cache hit),
+    plus the in-memory clone used for fine-tuning.
+
+    Run `python rizz_backbones.py` once first so the weight files are downloaded -
+    otherwise "cold" mostly measures your internet.
+
+    Returns:
+        list: One dict per backbone with cold/warm/clone seconds
+    """
+    results = []
+    for name in names or BACKBONES:
+        clear_backbone_cache()
+        start = time.perf_counter()
+        get_backbone(name, input_shape, weights)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        get_backbone(name, input_shape, weights)
+        warm = time.perf_counter() - start
+
+        start = time.perf_counter()
+        private_backbone(name, input_shape, weights)
+        clone = time.perf_counter() - start
+        results.append({"backbone": name, "cold_s": cold, "warm_s": warm, "clone_s": clone})
+    clear_backbone_cache()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold vs warm backbone construction time")
+    parser.add_argument("--backbones", nargs="*", default=list(BACKBONES), help="Which backbones to time")
+    parser.add_argument("--weights", default="imagenet", help="'imagenet' or a path to a weight file")
+    args = parser.parse_args()
+
+    print("🏄‍♂️ Timing backbone construction (first run downloads weights, run it twice for real numbers)...")
+    rows = measure_construction(args.backbones, weights=args.weights)
+    print(f"\n{'Backbone':<16}{'Cold (s)':>10}{'Warm (ms)':>12}{'Clone (s)':>11}")
+    for row in rows:
+        print(f"{row['backbone']:<16}{row['cold_s']:>10.2f}{row['warm_s'] * 1000:>12.3f}{row['clone_s']:>11.2f}")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+RIZZ BENCHMARK - Pick your pro brain from data, not vibes.
+
+`borrowing_rizz_exercise2.py` swaps MobileNetV2 for ResNet50 and tells you one number:
+how long `model.fit` took. That's like picking a surfboard because your mate said it "felt fast".
+
+This script races every backbone in the registry (with our GAP + Dense head) on CPU over a
+grid of batch sizes and input resolutions, and writes everything to JSON:
+- training images/sec and inference images/sec (per batch size)
+- p50 / p95 / p99 single-image latency
+- peak RSS (memory) and parameter count
+
+Every (backbone, resolution) runs in its own fresh process, so one model's memory
+doesn't leak into the next one's peak RSS.
+
+Usage:
+    python rizz_benchmark.py --batch-sizes 1 8 32 --resolutions 160 224 --out rizz_benchmark.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from child_runs import ChildCrashed, peak_rss_mb, run_child
+
+
+# =============================================
+# 1. ONE RUN (One Backbone, One Resolution)
+# =============================================
+def _percentile(sorted_values, q):
+    """Nearest-rank percentile (no numpy needed for 3 numbers)."""
+    idx = min(len(sorted_values) - 1, max(0, int(round(q / 100 * len(sorted_values))) - 1))
+    return sorted_values[idx]
+
+
+def run_one(backbone, resolution, batch_sizes, steps=10, latency_runs=100, weights=None,
+            fine_tune_last=0, num_classes=10):
+    """
+    Benchmark one backbone at one resolution (call this in a fresh process).
+
+    Args:
+        backbone (str): A name from rizz_backbones.BACKBONES
+        resolution (int): Square input size (e.g. 224)
+        batch_sizes (list): Batch sizes for the throughput runs
+        steps (int): Timed steps per batch size (after one warm-up step)
+        latency_runs (int): Single-image calls for the latency percentiles
+        weights: None (random - same speed, no download) or 'imagenet'
+        fine_tune_last (int): 0 = frozen backbone like borrowing_rizz.py, N = train the last N layers too
+
+    Returns:
+        dict: Everything we measured, JSON-ready
+    """
+    import numpy as np
+    import tensorflow as tf
+    from rizz_backbones import build_rizz_model
+
+    model, _ = build_rizz_model({"backbone": backbone, "input_shape": (resolution, resolution, 3),
+                                 "weights": weights, "num_classes": num_classes,
+                                 "fine_tune_last": fine_tune_last})
+    infer = tf.function(lambda x: model(x, training=False))  # Compiled call, no `predict` overhead
+    rng = np.random.default_rng(0)
+
+    throughput = []
+    for batch_size in batch_sizes:
+        x = rng.random((batch_size, resolution, resolution, 3), dtype=np.float32)
+        y = rng.integers(0, num_classes, size=(batch_size,))
+
+        model.train_on_batch(x, y)  # Warm-up (tracing), not timed
+        start = time.perf_counter()
+        for _ in range(steps):
+            model.train_on_batch(x, y)
+        train_s = time.perf_counter() - start
+
+        infer(x)  # Warm-up
+        start = time.perf_counter()
+        for _ in range(steps):
+            infer(x).numpy()
+        infer_s = time.perf_counter() - start
+
+        throughput.append({
+            "batch_size": batch_size,
+            "train_images_per_s": batch_size * steps / train_s,
+            "infer_images_per_s": batch_size * steps / infer_s,
+        })
+
+    one = rng.random((1, resolution, resolution, 3), dtype=np.float32)
+    infer(one)  # Warm-up for batch size 1
+    latencies = []
+    for _ in range(latency_runs):
+        start = time.perf_counter()
+        infer(one).numpy()
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+
+    return {
+        "backbone": backbone,
+        "resolution": resolution,
+        "weights": weights,
+        "fine_tune_last": fine_tune_last,
+        "params_total": int(model.count_params()),
+        "params_trainable": int(sum(np.prod(w.shape) for w in model.trainable_weights)),
+        "throughput": throughput,
+        "latency_ms": {
+            "p50": _percentile(latencies, 50),
+            "p95": _percentile(latencies, 95),
+            "p99": _percentile(latencies, 99),
+            "runs": latency_runs,
+        },
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+# =============================================
+# 2. THE GRID (Every Backbone × Every Resolution)
+# =============================================
+def run_grid(backbones, resolutions, batch_sizes, steps=10, latency_runs=100, weights=None,
+             fine_tune_last=0, threads=None):
+    """Run every (backbone, resolution) in a fresh CPU-only child process."""
+    env = dict(os.environ, CUDA_VISIBLE_DEVICES="")  # CPU-only, like our inference boxes
+    if threads:
+        env["TF_NUM_INTRAOP_THREADS"] = str(threads)
+        env["TF_NUM_INTEROP_THREADS"] = "1"
+    results = []
+    for backbone in backbones:
+        for resolution in resolutions:
+            print(f"🏄‍♂️ {backbone} @ {resolution}x{resolution}...", flush=True)
+            job = {"backbone": backbone, "resolution": resolution, "batch_sizes": batch_sizes,
+                   "steps": steps, "latency_runs": latency_runs, "weights": weights,
+                   "fine_tune_last": fine_tune_last}
+            try:
+                results.append(run_child(__file__, job, label=f"{backbone} @ {resolution}", env=env))
+            except ChildCrashed as e:
+                print(f"🤬 {e}")
+                results.append({"backbone": backbone, "resolution": resolution, "error": e.stderr})
+    return results
+
+
+def _print_summary(results):
+    print(f"\n{'Backbone':<16}{'Res':>5}{'Params (M)':>12}{'Batch':>7}{'Train img/s':>13}{'Infer img/s':>13}"
+          f"{'p50 ms':>9}{'p99 ms':>9}{'RSS MB':>9}")
+    for row in results:
+        if "error" in row:
+            print(f"{row['backbone']:<16}{row['resolution']:>5}  (failed)")
+            continue
+        for t in row["throughput"]:
+            print(f"{row['backbone']:<16}{row['resolution']:>5}{row['params_total'] / 1e6:>12.2f}{t['batch_size']:>7}"
+                  f"{t['train_images_per_s']:>13.1f}{t['infer_images_per_s']:>13.1f}"
+                  f"{row['latency_ms']['p50']:>9.1f}{row['latency_ms']['p99']:>9.1f}{row['peak_rss_mb']:>9.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CPU throughput/latency benchmark for every registered backbone")
+    parser.add_argument("--backbones", nargs="*", default=None, help="Default: every backbone in the registry")
+    parser.add_argument("--batch-sizes", nargs="*", type=int, default=[1, 8, 32])
+    parser.add_argument("--resolutions", nargs="*", type=int, default=[160, 224])
+    parser.add_argument("--steps", type=int, default=10, help="Timed steps per batch size")
+    parser.add_argument("--latency-runs", type=int, default=100, help="Single-image calls for p50/p95/p99")
+    parser.add_argument("--weights", default=None, type=lambda v: None if v.lower() == "none" else v,
+                        help="None (random, no download) or 'imagenet'")
+    parser.add_argument("--fine-tune-last", type=int, default=0, help="Also train the last N backbone layers")
+    parser.add_argument("--threads", type=int, default=None, help="Pin TF intra-op threads (default: TF decides)")
+    parser.add_argument("--out", default="rizz_benchmark.json", help="Where the JSON results go")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        job = json.loads(args.child)
+        print(json.dumps(run_one(job["backbone"], job["resolution"], job["batch_sizes"], job["steps"],
+                                 job["latency_runs"], job["weights"], job["fine_tune_last"])))
+        sys.exit(0)
+
+    if args.backbones is None:
+        from rizz_backbones import BACKBONES  # Only the parent needs the list; children import TF anyway
+        args.backbones = list(BACKBONES)
+
+    results = run_grid(args.backbones, args.resolutions, args.batch_sizes, args.steps, args.latency_runs,
+                       args.weights, args.fine_tune_last, args.threads)
+    report = {
+        "machine": {"platform": platform.platform(), "python": platform.python_version(),
+                    "cpu_count": os.cpu_count()},
+        "settings": {"batch_sizes": args.batch_sizes, "resolutions": args.resolutions, "steps": args.steps,
+                     "latency_runs": args.latency_runs, "weights": args.weights,
+                     "fine_tune_last": args.fine_tune_last, "threads": args.threads},
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    _print_summary(results)
+    print(f"\n💾 Results saved to {args.out}")
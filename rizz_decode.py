@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+RIZZ DECODE - Stop decoding 12 megapixels just to look at 160x160 of them.
+
+`Image.open(path).resize((160, 160))` decodes the FULL phone photo (say 4032x3024),
+then throws away 99.8% of the pixels. For phone photos that decode costs more than the model.
+
+JPEG has a cheat code: it can decode straight at 1/2, 1/4 or 1/8 size (PIL calls it "draft mode"),
+skipping most of the work - like streaming a video at 360p instead of downloading the 4K file
+and shrinking it yourself. We:
+1. ask for a draft close to (but not below) the target size
+2. resize the small leftover gap
+3. convert to float32 AND normalize in one step (no float64 detour)
+
+Plus a thread pool that decodes the next images while the model chews on the current batch
+(PIL releases the GIL while decoding, so threads really run in parallel).
+
+Run this file to benchmark decode + preprocess time per image at several source resolutions:
+    python rizz_decode.py --sizes 640x480 1920x1080 4032x3024
+"""
+
+import argparse
+import io
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+
+# =============================================
+# 1. DECODE CLOSE TO THE TARGET SIZE
+# =============================================
+def decode_image(source, size=(160, 160), rescale=1. / 255):
+    """
+    Decode + resize + normalize one image.
+
+    Args:
+        source: A path or a file-like object
+        size (tuple): (width, height), PIL order - same as `Image.resize`
+        rescale (float): Pixel multiplier, applied in float32
+
+    Returns:
+        np.ndarray: (height, width, 3) float32
+    """
+    with Image.open(source) as img:
+        # JPEG only: decode at the smallest 1/2, 1/4, 1/8 scale that's still >= size (no-op for PNG etc.)
+        img.draft("RGB", size)
+        img = img.convert("RGB").resize(size)
+    # One float32 multiply does the dtype conversion and the normalization together
+    return np.multiply(np.asarray(img), rescale, dtype=np.float32)
+
+
+def decode_full(source, size=(160, 160)):
+    """The old way (full decode, resize, float64 divide) - kept for the benchmark."""
+    return np.array(Image.open(source).convert("RGB").resize(size)) / 255.0
+
+
+# =============================================
+# 2. PREFETCH ON A THREAD POOL
+# =============================================
+def image_paths(directory, extensions=(".jpg", ".jpeg", ".png", ".bmp")):
+    """Every image under `directory`, sorted (like a recursive `fs.readdir` + filter)."""
+    return sorted(os.path.join(root, name) for root, _, names in os.walk(directory)
+                  for name in names if name.lower().endswith(extensions))
+
+
+def prefetch_images(paths, size=(160, 160), rescale=1. / 255, workers=4, depth=None):
+    """
+    Yield (path, pixels) in order, while up to `depth` upcoming images decode in the background
+    (like a JS `Promise` queue that always keeps a few fetches in flight).
+    """
+    depth = depth or 2 * workers
+    with ThreadPoolExecutor(workers) as pool:
+        pending = deque()
+        for path in paths:
+            pending.append((path, pool.submit(decode_image, path, size, rescale)))
+            if len(pending) >= depth:
+                done_path, future = pending.popleft()
+                yield done_path, future.result()
+        while pending:
+            done_path, future = pending.popleft()
+            yield done_path, future.result()
+
+
+def prefetch_batches(paths, batch_size=32, size=(160, 160), rescale=1. / 255, workers=4):
+    """Yield (paths, stacked pixels) batches; the next batch is already decoding while you use this one."""
+    batch_paths, batch = [], []
+    for path, pixels in prefetch_images(paths, size, rescale, workers, depth=batch_size + 2 * workers):
+        batch_paths.append(path)
+        batch.append(pixels)
+        if len(batch) == batch_size:
+            yield batch_paths, np.stack(batch)
+            batch_paths, batch = [], []
+    if batch:
+        yield batch_paths, np.stack(batch)
+
+
+# =============================================
+# 3. THE BENCHMARK (Per Source Resolution)
+# =============================================
+def _fake_photo(width, height, seed=0):
+    """A JPEG with smooth gradients + noise (compresses like a real photo, unlike pure noise)."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:height, 0:width]
+    base = np.stack([x / width, y / height, (x + y) / (width + height)], -1) * 200
+    pixels = np.clip(base + rng.normal(0, 12, base.shape), 0, 255).astype(np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def benchmark(sizes, target=(160, 160), runs=20):
+    """
+    ms/image for the full decode vs the draft decode at each source resolution.
+
+    Returns:
+        list: One dict per source size
+    """
+    rows = []
+    for width, height in sizes:
+        data = _fake_photo(width, height)
+        row = {"source": f"{width}x{height}", "jpeg_kb": len(data) / 1024}
+        for name, fn in (("full_ms", decode_full), ("draft_ms", decode_image)):
+            fn(io.BytesIO(data), target)  # Warm-up
+            start = time.perf_counter()
+            for _ in range(runs):
+                fn(io.BytesIO(data), target)
+            row[name] = (time.perf_counter() - start) / runs * 1000
+        # How far the shortcut drifts from the full decode (0-1 pixel scale)
+        row["max_abs_diff"] = float(np.abs(decode_full(io.BytesIO(data), target)
+                                           - decode_image(io.BytesIO(data), target)).max())
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Full vs reduced-scale JPEG decode + preprocess time")
+    parser.add_argument("--sizes", nargs="*", default=["640x480", "1280x720", "1920x1080", "4032x3024"],
+                        help="Source resolutions as WIDTHxHEIGHT")
+    parser.add_argument("--target", type=int, nargs=2, default=[160, 160], metavar=("W", "H"))
+    parser.add_argument("--runs", type=int, default=20, help="Timed decodes per size and method")
+    args = parser.parse_args()
+
+    sizes = [tuple(int(v) for v in s.lower().split("x")) for s in args.sizes]
+    print(f"🍕 Decoding to {args.target[0]}x{args.target[1]}...")
+    print(f"\n{'Source':>11}{'JPEG KB':>9}{'Full ms':>9}{'Draft ms':>10}{'Speedup':>9}{'Max diff':>10}")
+    for row in benchmark(sizes, tuple(args.target), args.runs):
+        print(f"{row['source']:>11}{row['jpeg_kb']:>9.0f}{row['full_ms']:>9.2f}{row['draft_ms']:>10.2f}"
+              f"{row['full_ms'] / row['draft_ms']:>8.1f}x{row['max_abs_diff']:>10.3f}")
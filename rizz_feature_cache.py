@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+RIZZ FEATURE CACHE - Run the frozen pro brain ONCE, then train the head in seconds.
+
+When `base_model.trainable = False`, MobileNetV2/ResNet50 spit out the exact same
+features for the same image every single epoch. Re-running them is like re-watching
+the same Kelly Slater clip 10 times to take the same notes.
+
+So we watch it once:
+1. Push every image through the backbone + GlobalAveragePooling2D.
+2. Write the features to a memory-mapped .npy file on disk (like a JS `localStorage` for tensors).
+3. Train the tiny Dense(128)/Dropout/Dense head on those features.
+
+The cache key covers the backbone name, its weights, the input size, the dataset and how many
+images were used, so the backbone only runs again when one of those changes. A randomly initialised
+backbone (weights=None) is never cached: it's a different brain every run.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from tensorflow.keras import layers, models
+
+CACHE_DIR = os.path.join("rizz_cache", "features")
+
+
+# =============================================
+# 1. THE CACHE KEY (What Makes Features "The Same")
+# =============================================
+def weights_fingerprint(weights):
+    """'imagenet' is a name; a path to a weight file also gets its size + mtime."""
+    if weights is not None and os.path.isfile(str(weights)):
+        stat = os.stat(weights)
+        return f"{os.path.abspath(weights)}:{stat.st_size}:{stat.st_mtime_ns}"
+    return str(weights)
+
+
+def feature_cache_key(backbone_name, weights, input_size, dataset_tag, num_samples=None):
+    """
+    Hash everything that changes the features (like a JS `useMemo` dependency array).
+
+    Args:
+        backbone_name (str): e.g. "MobileNetV2"
+        weights (str): "imagenet", None, or a path to a weight file
+        input_size (tuple): e.g. (224, 224)
+        dataset_tag (str): Names the images + preprocessing, e.g. "cifar10-train"
+        num_samples (int): How many of them (so `x_train[:5000]` doesn't reuse the 50 000-image cache)
+
+    Returns:
+        str: A short hex key
+    """
+    blob = json.dumps({
+        "backbone": backbone_name,
+        "weights": weights_fingerprint(weights),
+        "input_size": list(input_size),
+        "dataset": dataset_tag,
+        "num_samples": num_samples,
+    }, sort_keys=True)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def files_fingerprint(paths):
+    """
+    Short hash of a list of image files (path + size + mtime), for folder datasets.
+    Add a photo to training-data/ and the dataset tag (and so the cache key) changes.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        stat = os.stat(path)
+        digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+# =============================================
+# 2. WATCH THE PRO ONCE (Extract + Memory-Map)
+# =============================================
+def extract_features(base_model, data, num_samples, cache_path, steps=None):
+    """
+    Run `base_model` + GlobalAveragePooling2D over `data` and write the features to disk.
+
+    Args:
+        base_model: The frozen backbone
+        data: Anything that yields (images, labels) batches - a tf.data.Dataset or a Keras iterator
+        num_samples (int): How many images `data` holds (so we can size the file up front)
+        cache_path (str): Folder to write features.npy / labels.npy / meta.json into
+        steps (int): Batches to pull (needed for endless Keras iterators like flow_from_directory)
+
+    Returns:
+        tuple: (features, labels) as read-only memory-mapped arrays
+    """
+    extractor = models.Sequential([base_model, layers.GlobalAveragePooling2D()])
+    feature_dim = extractor.output_shape[-1]
+
+    tmp_path = cache_path + ".tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    features = np.lib.format.open_memmap(os.path.join(tmp_path, "features.npy"), mode="w+",
+                                         dtype=np.float32, shape=(num_samples, feature_dim))
+    labels = np.lib.format.open_memmap(os.path.join(tmp_path, "labels.npy"), mode="w+",
+                                       dtype=np.int64, shape=(num_samples,))
+
+    # Labels are saved next to the features as we go, so a shuffled stream still lines up
+    filled = 0
+    for step, (images, batch_labels) in enumerate(data):
+        if steps is not None and step >= steps:
+            break
+        batch_features = extractor(images, training=False).numpy()
+        n = min(len(batch_features), num_samples - filled)
+        features[filled:filled + n] = batch_features[:n]
+        labels[filled:filled + n] = np.asarray(batch_labels).reshape(-1)[:n]
+        filled += n
+        if filled >= num_samples:
+            break
+    if filled != num_samples:
+        raise ValueError(f"Expected {num_samples} images but the data only had {filled}")
+    features.flush()
+    labels.flush()
+    del features, labels
+
+    with open(os.path.join(tmp_path, "meta.json"), "w") as f:
+        json.dump({"num_samples": num_samples, "feature_dim": int(feature_dim)}, f)
+    # Only a finished cache gets the real name, so a crash never leaves half a cache behind
+    shutil.rmtree(cache_path, ignore_errors=True)
+    os.rename(tmp_path, cache_path)
+    return load_features(cache_path)
+
+
+def load_features(cache_path):
+    """Memory-map a finished cache (the OS pages it in, nothing gets copied up front)."""
+    features = np.load(os.path.join(cache_path, "features.npy"), mmap_mode="r")
+    labels = np.load(os.path.join(cache_path, "labels.npy"), mmap_mode="r")
+    return features, labels
+
+
+def cached_features(base_model, backbone_name, weights, input_size, dataset_tag, data,
+                    num_samples, steps=None, cache_dir=CACHE_DIR):
+    """
+    Return (features, labels) from the cache, running the backbone only on a cache miss.
+    """
+    if weights is None:
+        # Random init = a new brain every run, so features on disk never belong to it. Extract to a scratch folder.
+        print(f"🎲 {backbone_name} has random weights - extracting features without caching them...")
+        scratch = tempfile.mkdtemp(prefix="rizz_features_")
+        try:
+            features, labels = extract_features(base_model, data, num_samples, os.path.join(scratch, "features"),
+                                                steps=steps)
+            return np.array(features), np.array(labels)  # Copied into RAM before the scratch folder goes
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    key = feature_cache_key(backbone_name, weights, input_size, dataset_tag, num_samples)
+    cache_path = os.path.join(cache_dir, key)
+    if os.path.exists(os.path.join(cache_path, "meta.json")):
+        with open(os.path.join(cache_path, "meta.json")) as f:
+            cached_samples = json.load(f)["num_samples"]
+        if cached_samples == num_samples:
+            print(f"⚡ Feature cache hit for {backbone_name} / {dataset_tag} ({key})")
+            return load_features(cache_path)
+        print(f"🔁 Feature cache for {dataset_tag} holds {cached_samples} images, not {num_samples} - re-extracting")
+    print(f"🐢 Feature cache miss for {backbone_name} / {dataset_tag} - running the backbone once...")
+    os.makedirs(cache_dir, exist_ok=True)
+    return extract_features(base_model, data, num_samples, cache_path, steps=steps)
+
+
+# =============================================
+# 3. THE HEAD (Your Shitty Brain, Minus the Pro)
+# =============================================
+def build_feature_head(feature_dim, num_classes, optimizer="adam"):
+    """
+    The same Dense(128)/Dropout/Dense head the scripts use, but fed pooled features.
+    """
+    head = models.Sequential([
+        layers.Input(shape=(feature_dim,)),
+        layers.Dense(128, activation='relu'),
+        layers.Dropout(0.2),
+        layers.Dense(num_classes, activation='softmax')
+    ])
+    head.compile(optimizer=optimizer, loss='sparse_categorical_crossentropy', metrics=['accuracy'])
+    return head
+
+
+def attach_head(base_model, head):
+    """
+    Glue the trained head back onto the backbone, so the saved .h5 still eats raw images.
+    The head's layers are shared, not copied - their trained weights come along for free.
+    """
+    full = models.Sequential([base_model, layers.GlobalAveragePooling2D()] + head.layers)
+    full.compile(optimizer='adam', loss='sparse_categorical_crossentropy', metrics=['accuracy'])
+    return full
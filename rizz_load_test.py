@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+RIZZ LOAD TEST - How many vibe checks per second, and how slow are the unlucky ones?
+
+Fires a bunch of concurrent callers (threads, like a pile of `fetch()` calls in flight)
+at the micro-batching service and reports, per concurrency level:
+- throughput (requests/sec)
+- p50 / p95 / p99 latency (the tail = the users who rage-quit)
+- the average micro-batch size the service actually formed
+
+Two targets:
+    python rizz_load_test.py --images training-data --concurrency 1 4 16 64        # in-process RizzService
+    python rizz_load_test.py --url http://localhost:8000/predict --concurrency 1 8    # a running rizz_service.py
+
+`--baseline` also times the old way (one `model.predict` per image, one caller) for comparison.
+"""
+
+import argparse
+import os
+import threading
+import time
+import urllib.request
+
+import numpy as np
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+def find_images(path):
+    """A single image, or every image under a folder (like a recursive `fs.readdir`)."""
+    if os.path.isfile(path):
+        return [path]
+    return sorted(os.path.join(root, name) for root, _, names in os.walk(path)
+                  for name in names if name.lower().endswith(IMAGE_EXTENSIONS))
+
+
+# =============================================
+# 1. THE CALLERS (One Thread = One Impatient User)
+# =============================================
+def _http_caller(url):
+    def call(path):
+        with open(path, "rb") as f:
+            request = urllib.request.Request(url, data=f.read(), method="POST")
+        with urllib.request.urlopen(request) as response:
+            return response.read()
+    return call
+
+
+def run_level(call, images, concurrency, requests_per_caller):
+    """
+    `concurrency` threads each send `requests_per_caller` requests back to back.
+
+    Returns:
+        dict: requests/sec + latency percentiles in ms
+    """
+    latencies = [[] for _ in range(concurrency)]
+    errors = []
+
+    def caller(slot):
+        for i in range(requests_per_caller):
+            path = images[(slot * requests_per_caller + i) % len(images)]
+            start = time.perf_counter()
+            try:
+                call(path)
+            except Exception as e:
+                errors.append(repr(e))
+                continue
+            latencies[slot].append((time.perf_counter() - start) * 1000)
+
+    threads = [threading.Thread(target=caller, args=(slot,)) for slot in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    flat = np.concatenate([np.asarray(lat, dtype=np.float64) for lat in latencies])
+    p50, p95, p99 = np.percentile(flat, [50, 95, 99]) if len(flat) else (np.nan,) * 3
+    return {"concurrency": concurrency, "requests": len(flat), "errors": len(errors),
+            "requests_per_s": len(flat) / elapsed, "p50_ms": p50, "p95_ms": p95, "p99_ms": p99}
+
+
+# =============================================
+# 2. THE SWEEP (Every Concurrency Level)
+# =============================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput + tail latency of the rizz service under load")
+    parser.add_argument("--images", default="test.jpg", help="An image or a folder of images to send")
+    parser.add_argument("--url", default=None, help="Hit a running rizz_service.py instead of an in-process one")
+    parser.add_argument("--concurrency", nargs="*", type=int, default=[1, 4, 16, 64])
+    parser.add_argument("--requests", type=int, default=50, help="Requests per caller per level")
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--baseline", action="store_true", help="Also time one predict_with_rizz-style call at a time")
+    args = parser.parse_args()
+
+    images = find_images(args.images)
+    if not images:
+        raise SystemExit(f"🤬 No images found in {args.images!r}")
+
+    rows = []
+    if args.url:
+        call = _http_caller(args.url)
+        for concurrency in args.concurrency:
+            rows.append(run_level(call, images, concurrency, args.requests))
+    else:
+        from rizz_service import RizzService
+
+        with RizzService(max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms) as service:
+            service.predict(images[0])  # Warm-up (graph tracing), not timed
+            if args.baseline:
+                import final_demo
+
+                def old_way(path):
+                    x = np.expand_dims(final_demo.load_rizz_image(path), 0)
+                    return final_demo.vibe_check(final_demo.model.predict(x, verbose=0)[0][0])
+
+                row = run_level(old_way, images, 1, args.requests)
+                row["concurrency"] = "1 (predict)"
+                rows.append(row)
+            for concurrency in args.concurrency:
+                before = dict(service.stats)
+                row = run_level(service.predict, images, concurrency, args.requests)
+                batches = service.stats["batches"] - before["batches"]
+                row["avg_batch"] = (service.stats["requests"] - before["requests"]) / max(batches, 1)
+                rows.append(row)
+
+    print(f"\n{'Concurrency':>12}{'Req/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'Avg batch':>11}{'Errors':>8}")
+    for row in rows:
+        avg_batch = f"{row['avg_batch']:.1f}" if "avg_batch" in row else "-"
+        print(f"{row['concurrency']!s:>12}{row['requests_per_s']:>10.1f}{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}"
+              f"{row['p99_ms']:>9.1f}{avg_batch:>11}{row['errors']:>8}")
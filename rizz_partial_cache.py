@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+RIZZ PARTIAL CACHE - Fine-tune the last 20 layers without re-running the first 134.
+
+In `borrowing_rizz_exercise1.py` only `base_model.layers[-20:]` can learn, but every
+training step still pushes every image through ALL of MobileNetV2. The frozen part
+gives the same answer every time (like Kelly's stance from the waist down - it never changes).
+
+So we cut the backbone in two at the freeze boundary:
+- frozen part: runs ONCE per image, its output gets cached on disk (float16 by default)
+- trainable tail: the last 20 layers + our head, the only thing that runs per step
+
+Catch: random augmentation changes the image every epoch, so the cached activations
+would be lies. This mode refuses to run with augmentation turned on.
+
+Run this file directly to benchmark the step time against the end-to-end fine-tune:
+    python rizz_partial_cache.py --steps 20
+"""
+
+import argparse
+import math
+import os
+import shutil
+import time
+
+import numpy as np
+import tensorflow as tf
+from tensorflow.keras import layers, models
+
+from rizz_backbones import build_rizz_model
+from rizz_feature_cache import feature_cache_key
+
+CACHE_DIR = os.path.join("rizz_cache", "activations")
+
+# ImageDataGenerator settings that make every epoch see different pixels
+_RANDOM_AUGMENT_ATTRS = ("rotation_range", "width_shift_range", "height_shift_range", "shear_range",
+                         "zoom_range", "channel_shift_range", "brightness_range",
+                         "horizontal_flip", "vertical_flip")
+
+
+# =============================================
+# 1. THE SAFETY CHECK (No Augmentation Allowed)
+# =============================================
+def _has_random_augmentation(data):
+    """Sniff a Keras `flow`/`flow_from_directory` iterator for random transforms."""
+    datagen = getattr(data, "image_data_generator", None)
+    if datagen is None:
+        return False
+    for attr in _RANDOM_AUGMENT_ATTRS:
+        value = getattr(datagen, attr, None)
+        if attr == "zoom_range":
+            # ImageDataGenerator stores zoom as [1 - z, 1 + z]; [1, 1] means "no zoom"
+            if value is not None and list(np.ravel(value)) != [1.0, 1.0]:
+                return True
+        elif value:
+            return True
+    return False
+
+
+def check_partial_cache_config(data=None, augment=False):
+    """
+    Refuse to cache activations of images that change every epoch.
+
+    Raises:
+        ValueError: If `augment` is set or `data` is an augmenting Keras iterator
+    """
+    if augment or _has_random_augmentation(data):
+        raise ValueError("Partial-activation caching can't be combined with random augmentation: "
+                         "the frozen layers would see different pixels every epoch. "
+                         "Turn off augmentation or use the end-to-end fine-tune.")
+
+
+# =============================================
+# 2. CUT THE PRO BRAIN IN TWO (Freeze Boundary)
+# =============================================
+def _as_list(value):
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def split_backbone(base_model, num_trainable=20):
+    """
+    Split a functional backbone into (frozen_part, trainable_tail) at `layers[-num_trainable]`.
+
+    Both halves share the ORIGINAL layers (no weight copies), so training the tail
+    also trains `base_model` - the full model can be saved as usual afterwards.
+
+    Raises:
+        ValueError: If more than one tensor crosses the boundary (e.g. a skip
+            connection jumps over it), since then there's no single thing to cache
+    """
+    boundary = len(base_model.layers) - num_trainable
+    if boundary < 1:
+        raise ValueError(f"Can't leave {num_trainable} trainable layers in a {len(base_model.layers)}-layer model")
+    frozen_ids = {id(layer) for layer in base_model.layers[:boundary]}
+    tail_layers = base_model.layers[boundary:]
+
+    # Find every tensor a tail layer reads from the frozen side
+    crossing = []
+    for layer in tail_layers:
+        inputs = _as_list(layer.get_input_at(0))
+        producers = _as_list(layer.inbound_nodes[0].inbound_layers)
+        for tensor, producer in zip(inputs, producers):
+            if id(producer) in frozen_ids and all(tensor is not seen for seen, _ in crossing):
+                crossing.append((tensor, producer))
+    if len(crossing) != 1:
+        raise ValueError(f"{len(crossing)} tensors cross the freeze boundary at layer "
+                         f"'{tail_layers[0].name}'; pick a num_trainable that cuts the graph at a single tensor")
+    boundary_tensor, boundary_layer = crossing[0]
+
+    # The name records where we cut, so the activation cache key changes if the cut moves
+    frozen_part = tf.keras.Model(base_model.input, boundary_tensor,
+                                 name=f"{base_model.name}_upto_{boundary_layer.name}")
+    frozen_part.trainable = False
+
+    # Replay the tail layers on a fresh input (like re-wiring React components to a new prop)
+    tail_input = layers.Input(shape=boundary_tensor.shape[1:])
+    rewired = {id(boundary_tensor): tail_input}
+    for layer in tail_layers:
+        inputs = layer.get_input_at(0)
+        output = layer.get_output_at(0)
+        new_inputs = tf.nest.map_structure(lambda t: rewired[id(t)], inputs)
+        rewired[id(output)] = layer(new_inputs)
+    tail = tf.keras.Model(tail_input, rewired[id(base_model.get_output_at(0))], name=f"{base_model.name}_tail")
+    return frozen_part, tail
+
+
+# =============================================
+# 3. CACHE THE FROZEN OUTPUT (Memory-Mapped, float16)
+# =============================================
+def cache_activations(frozen_part, backbone_name, weights, input_size, dataset_tag, data,
+                      num_samples, steps=None, dtype="float16", augment=False, cache_dir=CACHE_DIR):
+    """
+    Run the frozen part once over `data` and memory-map its output from disk.
+
+    Args:
+        frozen_part: First model returned by `split_backbone`
+        data: Yields (images, labels) batches (tf.data.Dataset or Keras iterator)
+        num_samples (int): Images in `data`
+        steps (int): Batches to pull (needed for endless Keras iterators)
+        dtype (str): "float16" halves the disk + RAM bill, "float32" keeps it exact
+        augment (bool): Must be False - see `check_partial_cache_config`
+
+    Returns:
+        tuple: (activations, labels) as read-only memory-mapped arrays
+    """
+    check_partial_cache_config(data, augment)
+    if weights is None:
+        raise ValueError("A randomly initialised backbone (weights=None) is a new brain every run, so its cached "
+                         "activations would never match it. Use weights='imagenet' or the end-to-end fine-tune.")
+    key = feature_cache_key(f"{backbone_name}@{frozen_part.name}", weights, input_size, f"{dataset_tag}-{dtype}",
+                            num_samples)
+    cache_path = os.path.join(cache_dir, key)
+    acts_file = os.path.join(cache_path, "activations.npy")
+    labels_file = os.path.join(cache_path, "labels.npy")
+    if os.path.exists(os.path.join(cache_path, "done")):
+        print(f"⚡ Activation cache hit for {frozen_part.name} / {dataset_tag} ({key})")
+        return np.load(acts_file, mmap_mode="r"), np.load(labels_file, mmap_mode="r")
+
+    print(f"🐢 Activation cache miss for {frozen_part.name} - running the frozen layers once...")
+    tmp_path = cache_path + ".tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    acts = np.lib.format.open_memmap(os.path.join(tmp_path, "activations.npy"), mode="w+", dtype=dtype,
+                                     shape=(num_samples,) + tuple(frozen_part.output_shape[1:]))
+    labels = np.lib.format.open_memmap(os.path.join(tmp_path, "labels.npy"), mode="w+",
+                                       dtype=np.int64, shape=(num_samples,))
+    filled = 0
+    for step, (images, batch_labels) in enumerate(data):
+        if (steps is not None and step >= steps) or filled >= num_samples:
+            break
+        batch_acts = frozen_part(images, training=False).numpy()
+        n = min(len(batch_acts), num_samples - filled)
+        acts[filled:filled + n] = batch_acts[:n]
+        labels[filled:filled + n] = np.asarray(batch_labels).reshape(-1)[:n]
+        filled += n
+    if filled != num_samples:
+        raise ValueError(f"Expected {num_samples} images but the data only had {filled}")
+    acts.flush()
+    labels.flush()
+    del acts, labels
+    open(os.path.join(tmp_path, "done"), "w").close()
+    shutil.rmtree(cache_path, ignore_errors=True)
+    os.rename(tmp_path, cache_path)
+    return np.load(acts_file, mmap_mode="r"), np.load(labels_file, mmap_mode="r")
+
+
+class ActivationSequence(tf.keras.utils.Sequence):
+    """
+    Feeds cached activations to `model.fit` one batch at a time, cast back to float32.
+    Only the current batch leaves the memory map (like paginating a JS API instead of fetching it all).
+    """
+
+    def __init__(self, activations, labels, batch_size=32, shuffle=False, seed=None):
+        super().__init__()
+        self.activations = activations
+        self.labels = labels
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.rng = np.random.default_rng(seed)
+        self.order = np.arange(len(labels))
+        if shuffle:
+            self.rng.shuffle(self.order)
+
+    def __len__(self):
+        return math.ceil(len(self.labels) / self.batch_size)
+
+    def __getitem__(self, idx):
+        # Sorted indices = mostly sequential reads from the memory map
+        batch = np.sort(self.order[idx * self.batch_size:(idx + 1) * self.batch_size])
+        return self.activations[batch].astype(np.float32), np.asarray(self.labels[batch])
+
+    def on_epoch_end(self):
+        if self.shuffle:
+            self.rng.shuffle(self.order)
+
+
+def build_tail_model(tail, head_layers, optimizer):
+    """
+    Tail + head as one trainable model. Pass the head layers of your full model so
+    they're shared: training this trains the full model too.
+    """
+    tail_model = models.Sequential([layers.Input(shape=tail.input_shape[1:]), tail] + list(head_layers))
+    tail_model.compile(optimizer=optimizer, loss='sparse_categorical_crossentropy', metrics=['accuracy'])
+    return tail_model
+
+
+# =============================================
+# 4. THE BENCHMARK (End-to-End vs Tail-Only Steps)
+# =============================================
+def _time_steps(model, x, y, steps):
+    model.train_on_batch(x, y)  # Warm-up step (tracing + graph building, like a JS JIT warm-up)
+    start = time.perf_counter()
+    for _ in range(steps):
+        model.train_on_batch(x, y)
+    return (time.perf_counter() - start) / steps
+
+
+def benchmark_step_time(num_trainable=20, batch_size=32, steps=20, weights=None, dtype="float16"):
+    """
+    Time one fine-tuning step end-to-end vs on cached activations (random pixels, same shapes).
+
+    Returns:
+        dict: Seconds per step for both paths + the speedup
+    """
+    model, base_model = build_rizz_model({"weights": weights, "fine_tune_last": num_trainable})
+
+    rng = np.random.default_rng(0)
+    images = rng.random((batch_size, 224, 224, 3), dtype=np.float32)
+    labels = rng.integers(0, 10, size=(batch_size,))
+
+    frozen_part, tail = split_backbone(base_model, num_trainable)
+    acts = frozen_part(images, training=False).numpy().astype(dtype).astype(np.float32)
+    tail_model = build_tail_model(tail, model.layers[1:], tf.keras.optimizers.Adam(1e-5))
+
+    end_to_end = _time_steps(model, images, labels, steps)
+    tail_only = _time_steps(tail_model, acts, labels, steps)
+    return {"end_to_end_s": end_to_end, "tail_only_s": tail_only, "speedup": end_to_end / tail_only,
+            "cached_shape": list(acts.shape[1:])}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Step time: end-to-end fine-tune vs partial-activation cache")
+    parser.add_argument("--trainable", type=int, default=20, help="How many backbone layers stay trainable")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--steps", type=int, default=20, help="Timed training steps per path")
+    parser.add_argument("--weights", default=None, type=lambda v: None if v.lower() == "none" else v,
+                        help="'imagenet' or None (random weights time the same)")
+    args = parser.parse_args()
+
+    print("🏄‍♂️ Timing fine-tune steps (this takes a minute, brah)...")
+    result = benchmark_step_time(args.trainable, args.batch_size, args.steps, args.weights)
+    print(f"\n🕒 End-to-end step:  {result['end_to_end_s'] * 1000:8.1f} ms")
+    print(f"⚡ Tail-only step:   {result['tail_only_s'] * 1000:8.1f} ms  (cached activations {result['cached_shape']})")
+    print(f"📊 Speedup: {result['speedup']:.1f}x")
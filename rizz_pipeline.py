@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+RIZZ PIPELINE - Streaming CIFAR-10 input for the borrowing_rizz scripts.
+
+The old way: resize ALL 50,000 CIFAR-10 images to 224x224 float32 before training.
+That's ~30 GB of pixels sitting in RAM (like downloading every surf video on YouTube
+before you watch the first one). Our boxes wipe out (OOM) on it.
+
+The streaming way: keep the tiny raw uint8 32x32 images in memory (~150 MB) and only
+stretch + normalize each batch right before the model eats it, inside a `tf.data`
+pipeline. Think of it like a JS ReadableStream instead of `await response.arrayBuffer()`.
+
+Run this file directly to compare the peak memory of both paths side by side:
+    python rizz_pipeline.py --samples 5000
+"""
+
+import argparse
+import json
+import sys
+
+import numpy as np
+import tensorflow as tf
+
+from child_runs import peak_rss_mb, run_child
+
+AUTOTUNE = tf.data.AUTOTUNE
+
+
+# =============================================
+# 1. THE STREAMING PIPELINE (Resize Per Batch)
+# =============================================
+def streaming_dataset(x, y, image_size=(224, 224), batch_size=32, shuffle=False,
+                      num_parallel_calls=AUTOTUNE, prefetch_depth=AUTOTUNE, seed=None):
+    """
+    Build a `tf.data` stream that resizes and normalizes one batch at a time.
+
+    Args:
+        x (np.ndarray): Raw uint8 images, shape (N, H, W, 3) - kept as-is in memory
+        y (np.ndarray): Labels, shape (N,) or (N, 1)
+        image_size (tuple): Size the backbone wants (like 224x224 for MobileNetV2)
+        batch_size (int): Images per batch (same default as `model.fit`)
+        shuffle (bool): Reshuffle every epoch (like `model.fit` does for arrays)
+        num_parallel_calls (int): How many batches get resized at once
+        prefetch_depth (int): How many finished batches wait in line for the model
+        seed (int): Shuffle seed, for reproducible runs
+
+    Returns:
+        tf.data.Dataset: Yields (float32 images in [0, 1], labels)
+    """
+    ds = tf.data.Dataset.from_tensor_slices((x, y))
+    if shuffle:
+        # Shuffling raw 32x32 uint8 images is cheap (3 KB each, not 600 KB)
+        ds = ds.shuffle(len(x), seed=seed, reshuffle_each_iteration=True)
+    ds = ds.batch(batch_size)
+
+    def stretch_and_normalize(images, labels):
+        # Same math as the old path: bilinear resize to float32, then 0-255 → 0-1
+        images = tf.image.resize(images, image_size) / 255.0
+        return images, labels
+
+    ds = ds.map(stretch_and_normalize, num_parallel_calls=num_parallel_calls)
+    return ds.prefetch(prefetch_depth)
+
+
+def eager_dataset(x, y, image_size=(224, 224), batch_size=32, shuffle=False, seed=None):
+    """
+    The OLD path, wrapped as a dataset so the scripts can swap modes with one flag.
+
+    Resizes everything up front (the ~30 GB monster), then only batches by index,
+    so its memory profile is exactly the original `tf.image.resize(x_train, ...)` code.
+    """
+    images = tf.image.resize(x, image_size) / 255.0
+    labels = tf.convert_to_tensor(y)
+    ds = tf.data.Dataset.range(len(x))
+    if shuffle:
+        ds = ds.shuffle(len(x), seed=seed, reshuffle_each_iteration=True)
+    ds = ds.batch(batch_size)
+    return ds.map(lambda idx: (tf.gather(images, idx), tf.gather(labels, idx)))
+
+
+def load_cifar10(input_mode="streaming", image_size=(224, 224), batch_size=32,
+                 num_parallel_calls=AUTOTUNE, prefetch_depth=AUTOTUNE, limit=None):
+    """
+    Load CIFAR-10 as (train_ds, test_ds) for `model.fit` / `model.evaluate`.
+
+    Args:
+        input_mode (str): "streaming" (resize per batch) or "eager" (old resize-everything path)
+        limit (int): Only use the first N images of each split (handy for quick tests)
+
+    Returns:
+        tuple: (train_ds, test_ds, (num_train, num_test)) - the datasets go straight to fit/evaluate,
+        the sizes to the feature/activation caches (a dataset doesn't know its own length up front)
+
+    Raises:
+        ValueError: On an unknown `input_mode` (a typo must not silently pick the OOM path)
+    """
+    (x_train, y_train), (x_test, y_test) = tf.keras.datasets.cifar10.load_data()
+    if limit is not None:
+        x_train, y_train = x_train[:limit], y_train[:limit]
+        x_test, y_test = x_test[:limit], y_test[:limit]
+
+    if input_mode == "streaming":
+        train_ds = streaming_dataset(x_train, y_train, image_size, batch_size, shuffle=True,
+                                     num_parallel_calls=num_parallel_calls,
+                                     prefetch_depth=prefetch_depth)
+        test_ds = streaming_dataset(x_test, y_test, image_size, batch_size,
+                                    num_parallel_calls=num_parallel_calls,
+                                    prefetch_depth=prefetch_depth)
+    elif input_mode == "eager":
+        train_ds = eager_dataset(x_train, y_train, image_size, batch_size, shuffle=True)
+        test_ds = eager_dataset(x_test, y_test, image_size, batch_size)
+    else:
+        raise ValueError(f"Unknown input_mode {input_mode!r} (use 'streaming' or 'eager')")
+    return train_ds, test_ds, (len(x_train), len(x_test))
+
+
+# =============================================
+# 2. THE MEMORY FACE-OFF (Old Path vs New Path)
+# =============================================
+def _measure_one(input_mode, samples, batches, num_parallel_calls, prefetch_depth):
+    """Build one pipeline, pull a few batches through it and return the peak RSS."""
+    (x_train, y_train), _ = tf.keras.datasets.cifar10.load_data()
+    x_train, y_train = x_train[:samples], y_train[:samples]
+    if input_mode == "streaming":
+        ds = streaming_dataset(x_train, y_train, num_parallel_calls=num_parallel_calls,
+                               prefetch_depth=prefetch_depth)
+    else:
+        ds = eager_dataset(x_train, y_train)
+    for _ in ds.take(batches):
+        pass
+    return {"mode": input_mode, "samples": samples, "peak_rss_mb": round(peak_rss_mb(), 1)}
+
+
+def compare_peak_memory(samples=5000, batches=20, num_parallel_calls=AUTOTUNE, prefetch_depth=AUTOTUNE):
+    """
+    Measure each path in its own fresh process (peak RSS never goes down, so sharing
+    a process would make the second number lie).
+    """
+    results = []
+    for mode in ("eager", "streaming"):
+        args = [mode, samples, batches, num_parallel_calls, prefetch_depth]
+        results.append(run_child(__file__, args, label=mode, cpu_only=False))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Peak memory: eager resize vs streaming tf.data")
+    parser.add_argument("--samples", type=int, default=5000, help="CIFAR-10 images to load (50000 = the full OOM experience)")
+    parser.add_argument("--batches", type=int, default=20, help="Batches to pull through each pipeline")
+    parser.add_argument("--parallel", type=int, default=AUTOTUNE, help="num_parallel_calls for the map (-1 = AUTOTUNE)")
+    parser.add_argument("--prefetch", type=int, default=AUTOTUNE, help="Prefetch depth (-1 = AUTOTUNE)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_measure_one(*json.loads(args.child))))
+        sys.exit(0)
+
+    print(f"🏄‍♂️ Measuring peak memory with {args.samples} CIFAR-10 images...")
+    results = compare_peak_memory(args.samples, args.batches, args.parallel, args.prefetch)
+    full_eager_gb = 50000 * 224 * 224 * 3 * 4 / 1024 ** 3
+    print(f"\n{'Mode':<12}{'Samples':>10}{'Peak RSS (MB)':>16}")
+    for row in results:
+        print(f"{row['mode']:<12}{row['samples']:>10}{row['peak_rss_mb']:>16.1f}")
+    print(f"\n📊 For reference: the eager path on all 50k images needs ~{full_eager_gb:.1f} GB "
+          f"just for the resized float32 tensor. Streaming keeps ~{np.prod((50000, 32, 32, 3)) / 1024 ** 2:.0f} MB of raw uint8.")
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+RIZZ PREDICTION CACHE - Same pizza pic twice? Don't ask the AI twice.
+
+Reposts and retries send the exact same image bytes through `predict_with_rizz` over and over,
+and every time we pay for a decode + a forward pass. The answer can't change unless the
+image or the model changes, so we remember it (like an HTTP cache keyed on a content hash / ETag).
+
+The key = sha256(image bytes) + the model's identity:
+- the model's identity is a hash of the model file's CONTENTS (re-hashed only when its size/mtime
+  changes, so the check per lookup is one cheap `os.stat`)
+- retrain and overwrite `best_brain.h5` → new identity → every old answer is dropped automatically
+
+Two tiers (like a browser's memory cache + disk cache):
+- memory: an LRU with a size cap (least recently used answers get evicted first)
+- disk (optional): a small SQLite file, so answers survive a restart
+
+`cache.stats` counts hits (memory + disk), misses, evictions and invalidations.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """Content hash of a file, read in 1 MB chunks (no loading a 100 MB model into memory)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PredictionCache:
+    """
+    Content-addressed (verdict, confidence) cache with an LRU memory tier and an optional SQLite tier.
+
+    Args:
+        model_path (str): The model file whose changes invalidate the cache (e.g. 'best_brain.h5')
+        capacity (int): Most answers kept in memory
+        disk_path (str): SQLite file for the persistent tier (None = memory only)
+        salt (str): Anything else that changes answers (input size, decode mode, ...)
+    """
+
+    def __init__(self, model_path="best_brain.h5", capacity=1024, disk_path=None, salt=""):
+        self.model_path = model_path
+        self.capacity = capacity
+        self.salt = salt
+        self.memory = OrderedDict()  # key → (verdict, confidence), oldest first
+        self.stats = {"hits": 0, "memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0,
+                      "invalidations": 0}
+        self._lock = threading.Lock()  # rizz_service.py calls us from many threads
+        self._stat_signature = None
+        self._model_id = None
+        self.disk = None
+        if disk_path:
+            os.makedirs(os.path.dirname(os.path.abspath(disk_path)), exist_ok=True)
+            self.disk = sqlite3.connect(disk_path, check_same_thread=False)
+            self.disk.execute("CREATE TABLE IF NOT EXISTS predictions (model TEXT, image TEXT, verdict TEXT, "
+                              "confidence REAL, PRIMARY KEY (model, image))")
+            self.disk.commit()
+
+    # =============================================
+    # 1. THE MODEL'S IDENTITY (Auto-Invalidation)
+    # =============================================
+    def model_id(self):
+        """Hash of the model file + salt. Re-hashes only when the file's size or mtime changed."""
+        stat = os.stat(self.model_path)
+        signature = (stat.st_size, stat.st_mtime_ns)
+        if signature != self._stat_signature:
+            model_id = hashlib.sha256(f"{file_sha256(self.model_path)}:{self.salt}".encode()).hexdigest()[:16]
+            if self._model_id is None:
+                self._purge_disk(model_id)  # Answers a previous run stored for an older brain
+            elif model_id != self._model_id:
+                self._invalidate(model_id)
+            self._stat_signature, self._model_id = signature, model_id
+        return self._model_id
+
+    def _invalidate(self, new_model_id):
+        """New brain → old answers are wrong. Drop them from both tiers."""
+        self.memory.clear()
+        self._purge_disk(new_model_id)
+        self.stats["invalidations"] += 1
+
+    def _purge_disk(self, model_id):
+        if self.disk is not None:
+            self.disk.execute("DELETE FROM predictions WHERE model != ?", (model_id,))
+            self.disk.commit()
+
+    # =============================================
+    # 2. LOOKUP + STORE
+    # =============================================
+    @staticmethod
+    def image_key(image_bytes):
+        return hashlib.sha256(image_bytes).hexdigest()
+
+    def get(self, image_bytes):
+        """The cached (verdict, confidence) for these exact bytes, or None."""
+        image = self.image_key(image_bytes)
+        with self._lock:
+            model = self.model_id()
+            key = (model, image)
+            if key in self.memory:
+                self.memory.move_to_end(key)  # Freshly used → last in line for eviction
+                self.stats["hits"] += 1
+                self.stats["memory_hits"] += 1
+                return self.memory[key]
+            if self.disk is not None:
+                row = self.disk.execute("SELECT verdict, confidence FROM predictions WHERE model = ? AND image = ?",
+                                        key).fetchone()
+                if row is not None:
+                    self._remember(key, tuple(row))  # Promote to the memory tier
+                    self.stats["hits"] += 1
+                    self.stats["disk_hits"] += 1
+                    return tuple(row)
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, image_bytes, result):
+        """Store a (verdict, confidence) for these bytes under the current model."""
+        image = self.image_key(image_bytes)
+        with self._lock:
+            key = (self.model_id(), image)
+            self._remember(key, tuple(result))
+            if self.disk is not None:
+                self.disk.execute("INSERT OR REPLACE INTO predictions VALUES (?, ?, ?, ?)",
+                                  key + (result[0], float(result[1])))
+                self.disk.commit()
+
+    def _remember(self, key, result):
+        self.memory[key] = result
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.capacity:
+            self.memory.popitem(last=False)  # Least recently used goes first
+            self.stats["evictions"] += 1
+
+    def hit_rate(self):
+        with self._lock:
+            total = self.stats["hits"] + self.stats["misses"]
+            return self.stats["hits"] / total if total else 0.0
+
+    def clear(self):
+        """Forget everything (both tiers)."""
+        with self._lock:
+            self.memory.clear()
+            if self.disk is not None:
+                self.disk.execute("DELETE FROM predictions")
+                self.disk.commit()
+
+    def close(self):
+        if self.disk is not None:
+            self.disk.close()
+            self.disk = None
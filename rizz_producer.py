@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+RIZZ PRODUCER - A whole crew of workers decoding + augmenting while the model trains.
+
+`flow_from_directory` decodes and augments on the training thread, so while it's busy
+opening JPEGs the model sits on the beach waiting for a wave - and your other CPU cores nap.
+
+This producer hires a pool of worker processes (like JS Web Workers):
+- each worker decodes the JPEGs for one batch and runs the batched augmentation (rizz_augment.py)
+- the finished batch goes into a shared-memory slot (no pickling megabytes of pixels back and forth)
+- the training thread just copies the slot out and hands it to `model.fit`
+
+Every batch gets its own seed derived from (seed, epoch, batch index), so it doesn't matter
+which worker grabs which batch - the same seed gives the same pixels.
+
+It's a `Sequence`, so it plugs into `model.fit` like flow_from_directory does:
+    producer = AugmentProducer.from_directory('training-data', 'training', 0.2, augmenter=..., workers=4)
+    model.fit(producer, epochs=10, shuffle=False, workers=0, callbacks=[StarvationMonitor(producer)])
+    producer.close()
+`shuffle=False` because the producer already reshuffles every epoch (in its own deterministic order),
+`workers=0` because our processes do the parallel work - Keras' own threads would just race each other for batches.
+`StarvationMonitor` tells you how long the training loop sat waiting for data.
+"""
+
+import math
+import multiprocessing as mp
+import os
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+import tensorflow as tf
+from PIL import Image
+
+from rizz_augment import BatchAugmenter
+from rizz_shards import scan_folder
+
+# =============================================
+# 1. THE WORKER (Runs in Its Own Process)
+# =============================================
+_attached_slots = {}  # Per-worker cache: shared memory name → SharedMemory
+
+
+def _attach(name):
+    """Open a shared-memory slot once per worker (and keep the resource tracker out of it)."""
+    if name not in _attached_slots:
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+            # The parent owns (and unlinks) the slot; without this the worker's exit would too
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        _attached_slots[name] = shm
+    return _attached_slots[name]
+
+
+def _produce_batch(slot_name, paths, target_size, augment_config, rescale, seed):
+    """Decode + resize + augment one batch straight into a shared-memory slot."""
+    height, width = target_size
+    out = np.ndarray((len(paths), height, width, 3), dtype=np.float32, buffer=_attach(slot_name).buf)
+    for i, path in enumerate(paths):
+        with Image.open(path) as img:
+            # Same decode as flow_from_directory: RGB + nearest-neighbor resize
+            out[i] = np.asarray(img.convert("RGB").resize((width, height), Image.NEAREST), dtype=np.float32)
+    if augment_config is not None:
+        out[:] = BatchAugmenter(**augment_config, seed=seed).augment(out)
+    if rescale:
+        out *= rescale
+    return len(paths)
+
+
+# =============================================
+# 2. THE PRODUCER (Plugs Into model.fit)
+# =============================================
+class AugmentProducer(tf.keras.utils.Sequence):
+    """
+    Multi-process decode + augmentation with shared-memory hand-off.
+
+    Args:
+        filepaths (list): Image files
+        labels (array): One int label per file
+        target_size (tuple): (height, width) to resize to
+        batch_size (int): Images per batch
+        augmenter (BatchAugmenter): Geometric augmentation settings (None = no augmentation)
+        rescale (float): Multiply pixels by this (1/255 like the datagen in exercise 3)
+        workers (int): Worker processes (default: all CPU cores but one)
+        prefetch (int): Batches in flight at once = number of shared-memory slots (default: 2 per worker)
+        shuffle (bool): Reshuffle every epoch
+        seed (int): Base seed for the shuffle order and every batch's augmentation
+        start_method (str): "fork" (like Keras' use_multiprocessing). With "spawn"/"forkserver",
+            guard your training script with `if __name__ == "__main__":`.
+    """
+
+    def __init__(self, filepaths, labels, target_size=(224, 224), batch_size=32, augmenter=None,
+                 rescale=1. / 255, workers=None, prefetch=None, shuffle=True, seed=0, start_method="fork"):
+        super().__init__()
+        self.filepaths = list(filepaths)
+        self.labels = np.asarray(labels, dtype=np.float32)
+        self.classes = self.labels.astype(np.int64)  # Same attributes as a DirectoryIterator
+        self.class_indices = {}
+        self.samples = len(self.filepaths)
+        self.target_size = tuple(target_size)
+        self.batch_size = batch_size
+        self.augment_config = augmenter.get_config() if augmenter is not None else None
+        self.rescale = rescale
+        self.shuffle = shuffle
+        self.seed = seed
+        self.workers = workers or max(1, (mp.cpu_count() or 2) - 1)
+        self.prefetch = prefetch or 2 * self.workers
+
+        self.pool = mp.get_context(start_method).Pool(self.workers)
+        slot_bytes = batch_size * self.target_size[0] * self.target_size[1] * 3 * 4
+        self.slots = [shared_memory.SharedMemory(create=True, size=slot_bytes) for _ in range(self.prefetch)]
+        self.free_slots = list(range(self.prefetch))
+        self.in_flight = {}  # batch index → (slot, AsyncResult)
+        self.starved_s = 0.0  # Total time the training loop waited on workers
+        self.epoch = 0
+        self._new_order()
+        self._submit_ahead(0)
+
+    @classmethod
+    def from_directory(cls, src_dir, subset=None, validation_split=0.0, **kwargs):
+        """
+        Build a producer over a class-per-folder tree, with flow_from_directory's split:
+        the first `validation_split` of each class is validation, the rest is training.
+        """
+        classes, files = scan_folder(src_dir)
+        by_class = [[rel for rel, label in files if label == i] for i in range(len(classes))]
+        paths, labels = [], []
+        for label, rels in enumerate(by_class):
+            cut = int(validation_split * len(rels)) if subset else 0
+            picked = rels[:cut] if subset == "validation" else rels[cut:]
+            paths += [os.path.join(src_dir, rel) for rel in picked]
+            labels += [label] * len(picked)
+        producer = cls(paths, labels, **kwargs)
+        producer.class_indices = {name: i for i, name in enumerate(classes)}
+        return producer
+
+    def __len__(self):
+        return math.ceil(self.samples / self.batch_size)
+
+    def _new_order(self):
+        rng = np.random.default_rng([self.seed, self.epoch])
+        self.order = rng.permutation(self.samples) if self.shuffle else np.arange(self.samples)
+
+    def _batch_seed(self, idx):
+        # Same (seed, epoch, idx) → same augmentation, whichever worker runs it
+        return int(np.random.SeedSequence([self.seed, self.epoch, idx]).generate_state(1)[0])
+
+    def _submit(self, idx):
+        if idx in self.in_flight or idx >= len(self):
+            return
+        if not self.free_slots:
+            # Every slot is busy with batches we don't need yet: wait for the farthest one, drop it
+            victim = max(self.in_flight)
+            slot, result = self.in_flight.pop(victim)
+            result.wait()
+            self.free_slots.append(slot)
+        slot = self.free_slots.pop()
+        batch = self.order[idx * self.batch_size:(idx + 1) * self.batch_size]
+        paths = [self.filepaths[i] for i in batch]
+        result = self.pool.apply_async(_produce_batch, (self.slots[slot].name, paths, self.target_size,
+                                                        self.augment_config, self.rescale, self._batch_seed(idx)))
+        self.in_flight[idx] = (slot, result)
+
+    def _submit_ahead(self, start):
+        for idx in range(start, min(len(self), start + self.prefetch)):
+            if not self.free_slots and idx not in self.in_flight:
+                break
+            self._submit(idx)
+
+    def __getitem__(self, idx):
+        self._submit(idx)
+        slot, result = self.in_flight.pop(idx)
+        start = time.perf_counter()
+        n = result.get()  # Blocks only if the workers are behind (= starvation)
+        self.starved_s += time.perf_counter() - start
+
+        height, width = self.target_size
+        view = np.ndarray((n, height, width, 3), dtype=np.float32, buffer=self.slots[slot].buf)
+        x = view.copy()  # The slot gets reused, so Keras gets its own copy
+        del view
+        self.free_slots.append(slot)
+        self._submit_ahead(idx + 1)
+        batch = self.order[idx * self.batch_size:(idx + 1) * self.batch_size]
+        return x, self.labels[batch]
+
+    def on_epoch_end(self):
+        for slot, result in self.in_flight.values():
+            result.wait()
+            self.free_slots.append(slot)
+        self.in_flight.clear()
+        self.epoch += 1
+        self._new_order()
+        self._submit_ahead(0)
+
+    def close(self):
+        """Stop the workers and free the shared memory (call this when training is done)."""
+        self.pool.terminate()
+        self.pool.join()
+        for shm in self.slots:
+            shm.close()
+            shm.unlink()
+        self.slots = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class StarvationMonitor(tf.keras.callbacks.Callback):
+    """Prints how long each epoch waited on the producer (like a network waterfall for your data)."""
+
+    def __init__(self, producer):
+        super().__init__()
+        self.producer = producer
+        self.history = []
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self._epoch_start = time.perf_counter()
+        self._starved_start = self.producer.starved_s
+
+    def on_epoch_end(self, epoch, logs=None):
+        total = time.perf_counter() - self._epoch_start
+        starved = self.producer.starved_s - self._starved_start
+        self.history.append({"epoch": epoch, "epoch_s": total, "starved_s": starved})
+        print(f"\n🍽️ Epoch {epoch + 1}: waited {starved:.2f}s for data "
+              f"({100 * starved / max(total, 1e-9):.1f}% of {total:.2f}s)")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+RIZZ SERVICE - final_demo's vibe check as a long-lived service with micro-batching.
+
+`predict_with_rizz` pays a whole `model.predict` call for every single image. When 20 people
+ask at once, that's 20 tiny forward passes back to back - like a pizza shop baking
+every order in its own oven run.
+
+This service keeps the model loaded and puts every request on a queue (like a JS event loop):
+- a batcher thread grabs the first waiting request...
+- ...then waits up to `max_wait_ms` for more to show up (or until `max_batch_size` is reached)
+- the whole group goes through the model in ONE forward pass
+- every caller still gets their own (verdict, confidence) back through a Future (like a JS Promise)
+
+Decoding happens on the caller's thread, so many callers also decode in parallel.
+
+In-process:
+    with RizzService(max_batch_size=32, max_wait_ms=5) as service:
+        verdict, confidence = service.predict('pizza.jpg')
+
+Over HTTP (POST the raw image bytes, get JSON back):
+    python rizz_service.py --port 8000
+    curl --data-binary @pizza.jpg http://localhost:8000/predict
+"""
+
+import argparse
+import io
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+_STOP = object()  # Sentinel that tells the batcher thread to clock off
+
+
+# =============================================
+# 1. THE BATCHER (Groups Requests Into Micro-Batches)
+# =============================================
+class RizzService:
+    """
+    Queue + batcher thread around a loaded model.
+
+    Args:
+        model: A loaded Keras model (default: the one final_demo.py loads from best_brain.h5)
+        max_batch_size (int): Most requests that ride one forward pass
+        max_wait_ms (float): How long the first request in a batch waits for company
+    """
+
+    def __init__(self, model=None, max_batch_size=32, max_wait_ms=5.0):
+        if model is None:
+            import final_demo  # Loads best_brain.h5 (like importing a module with side effects)
+            model = final_demo.model
+            if model is None:
+                raise FileNotFoundError("final_demo.py couldn't load best_brain.h5 - train a model first")
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait_s = max_wait_ms / 1000
+        self.requests = queue.Queue()
+        self.stats = {"requests": 0, "batches": 0}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="rizz-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, image):
+        """
+        Queue one image (path, file-like object or an already-normalized array).
+
+        Returns:
+            Future: Resolves to (verdict, confidence) - like a JS Promise
+        """
+        from final_demo import load_rizz_image
+
+        future = Future()
+        try:
+            pixels = image if isinstance(image, np.ndarray) else load_rizz_image(image)
+        except Exception as e:
+            future.set_exception(e)
+            return future
+        self.requests.put((pixels, future))
+        return future
+
+    def predict(self, image, timeout=None):
+        """Blocking version of `submit` (like `await service.submit(image)`)."""
+        return self.submit(image).result(timeout)
+
+    def _collect(self):
+        """Block for the first request, then gather more until the batch is full or the wait is over."""
+        first = self.requests.get()
+        if first is _STOP:
+            return None
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait_s
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self.requests.get(timeout=remaining) if remaining > 0 else self.requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self.requests.put(_STOP)  # Finish this batch first, stop on the next round
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        from final_demo import vibe_check
+
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            futures = [future for _, future in batch]
+            try:
+                x = np.stack([pixels for pixels, _ in batch])
+                predictions = np.asarray(self.model.predict_on_batch(x))  # ONE forward pass for the group
+                for future, prediction in zip(futures, predictions):
+                    future.set_result(vibe_check(prediction[0]))
+            except Exception as e:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            with self._lock:
+                self.stats["batches"] += 1
+                self.stats["requests"] += len(batch)
+
+    def average_batch_size(self):
+        with self._lock:
+            return self.stats["requests"] / max(self.stats["batches"], 1)
+
+    def close(self):
+        """Let the queued requests finish, then stop the batcher thread."""
+        self.requests.put(_STOP)
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# =============================================
+# 2. THE HTTP FRONT DOOR (Optional)
+# =============================================
+def serve(service, host="127.0.0.1", port=8000):
+    """POST /predict with the raw image bytes → {"verdict": ..., "confidence": ...}."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path != "/predict":
+                self.send_error(404)
+                return
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            try:
+                verdict, confidence = service.predict(io.BytesIO(body))
+                status, payload = 200, {"verdict": verdict, "confidence": confidence}
+            except Exception as e:
+                status, payload = 400, {"error": str(e)}
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass  # Keep the terminal quiet under load
+
+    server = ThreadingHTTPServer((host, port), Handler)  # One thread per connection → many in the queue at once
+    print(f"🍕 Rizz service up on http://{host}:{port}/predict "
+          f"(max batch {service.max_batch_size}, max wait {service.max_wait_s * 1000:.1f} ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-batching HTTP service around final_demo's model")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    with RizzService(max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms) as rizz:
+        serve(rizz, args.host, args.port)
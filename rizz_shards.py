@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+RIZZ SHARDS - Decode your GoPro footage ONCE, train on it forever.
+
+`flow_from_directory` re-opens, re-decodes and re-resizes every JPEG in `training-data/`
+every epoch - once for the training subset and again for the validation subset.
+That's like re-downloading the same surf clip every time you want to rewatch it.
+
+This script does a one-time ingest:
+1. Walk the folder tree (one subfolder per class, same as flow_from_directory).
+2. Decode + resize every image to uint8 pixels and pack them into shard files (.npy).
+3. Remember each file's mtime + size, so the next ingest only touches new or changed files.
+
+Training then memory-maps the shards (`ShardSequence`) and still runs augmentation on the fly
+from the cached pixels - same `ImageDataGenerator`, same random flips and shifts, way less decoding.
+
+Usage:
+    python rizz_shards.py training-data --size 224 224
+"""
+
+import argparse
+import json
+import math
+import os
+
+import numpy as np
+import tensorflow as tf
+
+STORE_DIR = os.path.join("rizz_cache", "shards")
+MANIFEST = "manifest.json"
+# Same extensions flow_from_directory accepts
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".ppm", ".tif", ".tiff")
+
+
+# =============================================
+# 1. SCAN THE FOLDERS (Like flow_from_directory Does)
+# =============================================
+def scan_folder(src_dir):
+    """
+    Find every image under `src_dir`, one subfolder per class.
+
+    Returns:
+        tuple: (classes, files) where files is a sorted list of (relpath, label)
+    """
+    classes = sorted(d for d in os.listdir(src_dir) if os.path.isdir(os.path.join(src_dir, d)))
+    files = []
+    for label, class_name in enumerate(classes):
+        class_dir = os.path.join(src_dir, class_name)
+        for root, _, names in sorted(os.walk(class_dir)):
+            for name in sorted(names):
+                if name.lower().endswith(IMAGE_EXTENSIONS):
+                    files.append((os.path.relpath(os.path.join(root, name), src_dir), label))
+    return classes, files
+
+
+def _decode(path, target_size):
+    """Decode + resize one image the way flow_from_directory does (RGB, nearest)."""
+    img = tf.keras.utils.load_img(path, target_size=target_size, interpolation="nearest")
+    return np.asarray(img, dtype=np.uint8)
+
+
+# =============================================
+# 2. THE INGEST (Only New or Changed Files)
+# =============================================
+def _load_manifest(store_dir):
+    path = os.path.join(store_dir, MANIFEST)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_manifest(store_dir, manifest):
+    tmp = os.path.join(store_dir, MANIFEST + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp, os.path.join(store_dir, MANIFEST))  # Atomic swap, no half-written manifest
+
+
+def _next_shard_name(manifest):
+    used = [int(name[len("shard_"):-len(".npy")]) for name in manifest["shards"]]
+    return f"shard_{max(used, default=-1) + 1:05d}.npy"
+
+
+def ingest(src_dir="training-data", store_dir=STORE_DIR, target_size=(224, 224), shard_size=256):
+    """
+    Decode + resize `src_dir` into uint8 shards, re-ingesting only new or changed files.
+
+    A file counts as changed when its mtime or size differs from the last ingest.
+    Changing `target_size` (or the source folder) rebuilds everything.
+
+    Returns:
+        dict: Counts of added / changed / removed / unchanged files
+    """
+    os.makedirs(store_dir, exist_ok=True)
+    classes, files = scan_folder(src_dir)
+    manifest = _load_manifest(store_dir)
+    if (manifest is None or manifest["target_size"] != list(target_size)
+            or manifest["src_dir"] != os.path.abspath(src_dir)):
+        for name in (manifest or {}).get("shards", {}):
+            if os.path.exists(os.path.join(store_dir, name)):
+                os.remove(os.path.join(store_dir, name))
+        manifest = {"src_dir": os.path.abspath(src_dir), "target_size": list(target_size),
+                    "classes": [], "files": {}, "shards": {}}
+
+    old_entries = manifest["files"]
+    new_entries, todo = {}, []
+    stats = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0}
+    for relpath, label in files:
+        stat = os.stat(os.path.join(src_dir, relpath))
+        old = old_entries.get(relpath)
+        if old and old["mtime_ns"] == stat.st_mtime_ns and old["size"] == stat.st_size:
+            new_entries[relpath] = dict(old, label=label)  # Label follows the (sorted) class list
+            stats["unchanged"] += 1
+        else:
+            todo.append((relpath, label, stat))
+            stats["changed" if old else "added"] += 1
+    stats["removed"] = len(set(old_entries) - {relpath for relpath, _ in files})
+
+    # Only the new/changed files get decoded, into brand new shards
+    for start in range(0, len(todo), shard_size):
+        chunk = todo[start:start + shard_size]
+        pixels = np.stack([_decode(os.path.join(src_dir, relpath), target_size) for relpath, _, _ in chunk])
+        shard_name = _next_shard_name(manifest)
+        np.save(os.path.join(store_dir, shard_name), pixels)
+        manifest["shards"][shard_name] = len(chunk)
+        for index, (relpath, label, stat) in enumerate(chunk):
+            new_entries[relpath] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+                                    "label": label, "shard": shard_name, "index": index}
+
+    manifest["classes"] = classes
+    manifest["files"] = new_entries
+    dead = _repack_stale_shards(store_dir, manifest)
+    _write_manifest(store_dir, manifest)
+    # Delete only after the new manifest is on disk, so a crash never leaves it pointing at nothing
+    for shard_name in dead:
+        os.remove(os.path.join(store_dir, shard_name))
+    return stats
+
+
+def _repack_stale_shards(store_dir, manifest):
+    """
+    Forget shards nobody points at anymore, and repack shards that are mostly stale
+    (more than half their slots belong to deleted/changed files).
+
+    Returns:
+        list: Shard files that are safe to delete once the manifest is saved
+    """
+    live, dead = {}, []
+    for relpath, entry in manifest["files"].items():
+        live.setdefault(entry["shard"], []).append(relpath)
+    for shard_name, count in list(manifest["shards"].items()):
+        relpaths = live.get(shard_name, [])
+        if len(relpaths) * 2 >= count:
+            continue
+        if relpaths:
+            relpaths.sort(key=lambda r: manifest["files"][r]["index"])
+            old = np.load(os.path.join(store_dir, shard_name), mmap_mode="r")
+            pixels = np.stack([old[manifest["files"][r]["index"]] for r in relpaths])
+            del old
+            new_name = _next_shard_name(manifest)
+            np.save(os.path.join(store_dir, new_name), pixels)
+            manifest["shards"][new_name] = len(relpaths)
+            for index, relpath in enumerate(relpaths):
+                manifest["files"][relpath].update(shard=new_name, index=index)
+        del manifest["shards"][shard_name]
+        dead.append(shard_name)
+    return dead
+
+
+# =============================================
+# 3. THE LOADER (Memory-Mapped Shards → model.fit)
+# =============================================
+class ShardStore:
+    """Read-only view of an ingested store. Shards are memory-mapped on first touch."""
+
+    def __init__(self, store_dir=STORE_DIR):
+        self.store_dir = store_dir
+        manifest = _load_manifest(store_dir)
+        if manifest is None:
+            raise FileNotFoundError(f"No shard store in {store_dir!r} - run `python rizz_shards.py` first")
+        self.src_dir = manifest["src_dir"]
+        self.target_size = tuple(manifest["target_size"])
+        self.classes = manifest["classes"]
+        self.class_indices = {name: i for i, name in enumerate(self.classes)}
+        # Same order as flow_from_directory: by class, then by path
+        entries = sorted(manifest["files"].items(), key=lambda kv: (kv[1]["label"], kv[0]))
+        self.relpaths = [relpath for relpath, _ in entries]
+        self.labels = np.array([e["label"] for _, e in entries], dtype=np.int64)
+        self._locations = [(e["shard"], e["index"]) for _, e in entries]
+        self._shards = {}
+
+    def __len__(self):
+        return len(self.relpaths)
+
+    def _shard(self, name):
+        if name not in self._shards:
+            self._shards[name] = np.load(os.path.join(self.store_dir, name), mmap_mode="r")
+        return self._shards[name]
+
+    def pixels(self, indices):
+        """uint8 images for the given store indices, shape (len(indices), H, W, 3)."""
+        out = np.empty((len(indices),) + self.target_size + (3,), dtype=np.uint8)
+        for i, idx in enumerate(indices):
+            shard_name, index = self._locations[idx]
+            out[i] = self._shard(shard_name)[index]
+        return out
+
+    def split(self, subset=None, validation_split=0.0):
+        """
+        Store indices for a subset, split per class exactly like flow_from_directory:
+        the first `validation_split` of each class is validation, the rest is training.
+        """
+        if subset is None or not validation_split:
+            return np.arange(len(self))
+        picked = []
+        for label in range(len(self.classes)):
+            idx = np.flatnonzero(self.labels == label)
+            cut = int(validation_split * len(idx))
+            picked.append(idx[:cut] if subset == "validation" else idx[cut:])
+        return np.concatenate(picked) if picked else np.arange(0)
+
+
+class ShardSequence(tf.keras.utils.Sequence):
+    """
+    Drop-in for `datagen.flow_from_directory(...)` that reads pixels from the shard store.
+
+    Augmentation still happens on the fly with the same `ImageDataGenerator`
+    (random_transform + standardize per image), just without decoding any JPEGs.
+    Pass a `rizz_augment.BatchAugmenter` to do the geometric part for the whole batch in one go.
+    Exposes `samples`, `batch_size`, `filepaths`, `classes` and `class_indices` like a DirectoryIterator.
+    """
+
+    def __init__(self, store, datagen, subset=None, batch_size=32, shuffle=True, seed=None, augmenter=None):
+        super().__init__()
+        self.store = store
+        self.datagen = datagen
+        self.augmenter = augmenter
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.rng = np.random.default_rng(seed)
+        self.indices = store.split(subset, getattr(datagen, "_validation_split", 0.0))
+        self.samples = len(self.indices)
+        self.classes = store.labels[self.indices]
+        self.class_indices = store.class_indices
+        self.filepaths = [os.path.join(store.src_dir, store.relpaths[i]) for i in self.indices]
+        self.order = np.arange(self.samples)
+        if shuffle:
+            self.rng.shuffle(self.order)
+
+    def __len__(self):
+        return math.ceil(self.samples / self.batch_size)
+
+    def __getitem__(self, idx):
+        batch = self.indices[self.order[idx * self.batch_size:(idx + 1) * self.batch_size]]
+        x = self.store.pixels(batch).astype(np.float32)
+        if self.augmenter is not None:
+            x = self.augmenter.augment(x)
+        for i in range(len(x)):
+            if self.augmenter is None:
+                params = self.datagen.get_random_transform(x[i].shape, seed=int(self.rng.integers(2 ** 31)))
+                x[i] = self.datagen.apply_transform(x[i], params)
+            x[i] = self.datagen.standardize(x[i])
+        return x, self.store.labels[batch].astype(np.float32)
+
+    def on_epoch_end(self):
+        if self.shuffle:
+            self.rng.shuffle(self.order)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Decode + resize an image folder tree into uint8 shards")
+    parser.add_argument("src_dir", nargs="?", default="training-data", help="One subfolder per class")
+    parser.add_argument("--store", default=STORE_DIR, help="Where the shards + manifest live")
+    parser.add_argument("--size", nargs=2, type=int, default=[224, 224], metavar=("H", "W"))
+    parser.add_argument("--shard-size", type=int, default=256, help="Images per shard file")
+    args = parser.parse_args()
+
+    stats = ingest(args.src_dir, args.store, tuple(args.size), args.shard_size)
+    print(f"🏄‍♂️ Ingested {args.src_dir} → {args.store}: "
+          f"{stats['added']} added, {stats['changed']} changed, {stats['removed']} removed, "
+          f"{stats['unchanged']} unchanged")
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+RIZZ TFLITE - Shrink any saved brain into a TFLite file for CPU-only inference boxes.
+
+`tf.keras.models.load_model('best_brain.h5')` drags the whole Keras training machinery along
+just to answer "BUSSIN or BASIC?". TFLite is the flat-pack version (like shipping a minified
+JS bundle instead of the whole node_modules folder).
+
+Three flavors per model:
+- float32: same math, lighter runtime
+- dynamic: weights stored as int8, activations stay float (≈4x smaller, no calibration needed)
+- int8:    EVERYTHING int8, calibrated on real photos from `training-data` (smallest + fastest on most CPUs)
+
+Then a report: accuracy delta vs the Keras model, file size, per-image latency. Accuracy needs the
+model's classes to BE the training-data folders; for any other image model (e.g. a 10-class brain)
+the report shows agreement with Keras only. Non-image models (like the 28x28 MNIST brain) can't be
+fed folder photos at all, so calibration + report refuse them up front.
+
+Usage:
+    python rizz_tflite.py best_brain.h5                      # convert all three + report
+    python rizz_tflite.py borrowed_rizz_custom_data.h5 --variants int8 --no-report
+
+final_demo.py can then run on the interpreter: set `TFLITE_MODEL = 'best_brain.int8.tflite'`.
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+VARIANTS = ("float32", "dynamic", "int8")
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+def _interpreter_class():
+    """The tiny `tflite_runtime` package if it's installed (no full TF needed), else TF's own interpreter."""
+    try:
+        from tflite_runtime.interpreter import Interpreter
+    except ImportError:
+        import tensorflow as tf
+        Interpreter = tf.lite.Interpreter
+    return Interpreter
+
+
+# =============================================
+# 1. PHOTOS FROM training-data (Calibration + Evaluation)
+# =============================================
+def folder_classes(src_dir="training-data"):
+    """Class names in flow_from_directory order (sorted sub-folder names)."""
+    return sorted(d for d in os.listdir(src_dir) if os.path.isdir(os.path.join(src_dir, d)))
+
+
+def image_input_size(model):
+    """
+    (height, width) of a model that eats RGB photos.
+
+    Raises:
+        ValueError: If the input isn't (batch, H, W, 3) - e.g. the (batch, 28, 28) MNIST brain
+    """
+    shape = tuple(model.input_shape)
+    if len(shape) != 4 or shape[-1] != 3 or None in shape[1:3]:
+        raise ValueError(f"{getattr(model, 'name', 'This model')} takes input {shape}, not (batch, H, W, 3) RGB "
+                         f"photos, so it can't be calibrated or scored on training-data. "
+                         f"Convert it with --variants float32 dynamic --no-report instead.")
+    return shape[1], shape[2]
+
+
+def load_folder_images(src_dir="training-data", image_size=(160, 160), rescale=1. / 255, limit=None, seed=0):
+    """
+    Decode + resize images from a class-per-folder tree (like flow_from_directory).
+
+    Returns:
+        tuple: (float32 images, int labels), a seeded random sample of at most `limit` images
+    """
+    from PIL import Image
+
+    classes = folder_classes(src_dir)
+    files = [(os.path.join(root, name), label) for label, class_name in enumerate(classes)
+             for root, _, names in sorted(os.walk(os.path.join(src_dir, class_name)))
+             for name in sorted(names) if name.lower().endswith(IMAGE_EXTENSIONS)]
+    if limit is not None and len(files) > limit:
+        picked = np.random.default_rng(seed).choice(len(files), limit, replace=False)
+        files = [files[i] for i in sorted(picked)]
+    height, width = image_size
+    images = np.empty((len(files), height, width, 3), dtype=np.float32)
+    for i, (path, _) in enumerate(files):
+        with Image.open(path) as img:
+            images[i] = np.asarray(img.convert("RGB").resize((width, height)), dtype=np.float32)
+    images *= rescale
+    return images, np.array([label for _, label in files], dtype=np.int64)
+
+
+# =============================================
+# 2. CONVERT (.h5 → .tflite)
+# =============================================
+def convert(model, variant, representative_images=None):
+    """
+    Convert a Keras model to TFLite bytes.
+
+    Args:
+        model: A loaded Keras model
+        variant (str): 'float32', 'dynamic' or 'int8'
+        representative_images (array): Calibration images, required for 'int8'
+    """
+    import tensorflow as tf
+
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown variant {variant!r}. Pick one of: {', '.join(VARIANTS)}")
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    if variant in ("dynamic", "int8"):
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if variant == "int8":
+        if representative_images is None or not len(representative_images):
+            raise ValueError("Full-int8 needs representative images (the calibration photos)")
+
+        def representative_dataset():
+            # The converter watches these go through to learn each tensor's range
+            for image in representative_images:
+                yield [image[None].astype(np.float32)]
+
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+    return converter.convert()
+
+
+def convert_file(h5_path, variants=VARIANTS, out_dir=None, src_dir="training-data", calibration_images=200,
+                 rescale=1. / 255):
+    """
+    Convert one saved .h5 into `<name>.<variant>.tflite` files.
+
+    Returns:
+        dict: variant → .tflite path
+    """
+    import tensorflow as tf
+
+    model = tf.keras.models.load_model(h5_path)
+    stem = os.path.splitext(os.path.basename(h5_path))[0]
+    out_dir = out_dir or os.path.dirname(os.path.abspath(h5_path))
+    representative = None
+    if "int8" in variants:
+        representative, _ = load_folder_images(src_dir, image_input_size(model), rescale, limit=calibration_images)
+    paths = {}
+    for variant in variants:
+        path = os.path.join(out_dir, f"{stem}.{variant}.tflite")
+        with open(path, "wb") as f:
+            f.write(convert(model, variant, representative))
+        paths[variant] = path
+        print(f"💾 {variant:<8} → {path}")
+    return paths
+
+
+# =============================================
+# 3. THE RUNNER (Same predict API as a Keras model)
+# =============================================
+class TFLiteRunner:
+    """
+    Runs a .tflite file with the same `predict` / `predict_on_batch` calls as a Keras model,
+    so final_demo.py and rizz_service.py don't care which one they got.
+    int8 models get their inputs quantized and outputs dequantized for you.
+    """
+
+    def __init__(self, path, num_threads=None):
+        self.path = path
+        self.interpreter = _interpreter_class()(model_path=path, num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+        self.input_detail = self.interpreter.get_input_details()[0]
+        self.output_detail = self.interpreter.get_output_details()[0]
+        self.input_shape = tuple(self.input_detail["shape"])  # (1, H, W, 3)
+        self._batch_size = 1
+
+    def predict_on_batch(self, x):
+        x = np.asarray(x, dtype=np.float32)
+        if len(x) != self._batch_size:
+            # Like resizing a WebGL buffer: only when the batch size actually changes
+            self.interpreter.resize_tensor_input(self.input_detail["index"], (len(x),) + self.input_shape[1:])
+            self.interpreter.allocate_tensors()
+            self.input_detail = self.interpreter.get_input_details()[0]
+            self.output_detail = self.interpreter.get_output_details()[0]
+            self._batch_size = len(x)
+
+        dtype = self.input_detail["dtype"]
+        if dtype != np.float32:
+            scale, zero_point = self.input_detail["quantization"]
+            info = np.iinfo(dtype)
+            x = np.clip(np.round(x / scale + zero_point), info.min, info.max).astype(dtype)
+        self.interpreter.set_tensor(self.input_detail["index"], x)
+        self.interpreter.invoke()
+        out = self.interpreter.get_tensor(self.output_detail["index"])
+        if out.dtype != np.float32:
+            scale, zero_point = self.output_detail["quantization"]
+            out = (out.astype(np.float32) - zero_point) * scale
+        return out
+
+    def predict(self, x, batch_size=32, verbose=0):
+        """Keras-style `predict`: chops big inputs into batches."""
+        x = np.asarray(x, dtype=np.float32)
+        return np.concatenate([self.predict_on_batch(x[i:i + batch_size]) for i in range(0, len(x), batch_size)])
+
+
+# =============================================
+# 4. THE REPORT (Accuracy Delta, Size, Latency)
+# =============================================
+def _labels_from(predictions):
+    predictions = np.asarray(predictions)
+    if predictions.shape[-1] == 1:
+        return (predictions[:, 0] > 0.5).astype(np.int64)  # Single sigmoid output
+    return predictions.argmax(-1)
+
+
+def _median_latency_ms(predict_one, image, runs):
+    predict_one(image)  # Warm-up
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        predict_one(image)
+        times.append((time.perf_counter() - start) * 1000)
+    return float(np.median(times))
+
+
+def report(h5_path, tflite_paths, src_dir="training-data", eval_images=200, latency_runs=50, rescale=1. / 255):
+    """
+    Compare every TFLite variant against the Keras model on photos from `src_dir`.
+    Accuracy + delta are only scored when the model's outputs line up with the folder classes
+    (otherwise they're None and agreement with Keras is the whole story).
+
+    Returns:
+        list: One row per engine: accuracy, delta vs Keras, agreement with Keras, size, latency
+    """
+    import tensorflow as tf
+
+    model = tf.keras.models.load_model(h5_path)
+    image_size = image_input_size(model)  # Fail before decoding a single photo
+    num_outputs = model.output_shape[-1]
+    scored = (2 if num_outputs == 1 else num_outputs) == len(folder_classes(src_dir))  # 1 sigmoid = 2 classes
+    if not scored:
+        print(f"⚠️  {num_outputs} outputs vs {len(folder_classes(src_dir))} folders in {src_dir}: "
+              f"reporting agreement with Keras only, no accuracy")
+    x, y = load_folder_images(src_dir, image_size, rescale, limit=eval_images, seed=1)
+    keras_labels = _labels_from(model.predict(x, verbose=0))
+    keras_acc = float((keras_labels == y).mean()) if scored else None
+    rows = [{"engine": "keras (.h5)", "accuracy": keras_acc, "delta": 0.0 if scored else None, "agreement": 1.0,
+             "size_mb": os.path.getsize(h5_path) / 1e6,
+             "latency_ms": _median_latency_ms(lambda img: model.predict_on_batch(img), x[:1], latency_runs)}]
+    for variant, path in tflite_paths.items():
+        runner = TFLiteRunner(path)
+        labels = _labels_from(runner.predict(x))
+        accuracy = float((labels == y).mean()) if scored else None
+        rows.append({"engine": f"tflite {variant}", "accuracy": accuracy,
+                     "delta": accuracy - keras_acc if scored else None,
+                     "agreement": float((labels == keras_labels).mean()), "size_mb": os.path.getsize(path) / 1e6,
+                     "latency_ms": _median_latency_ms(runner.predict_on_batch, x[:1], latency_runs)})
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert a saved .h5 to float32 / dynamic / int8 TFLite + report")
+    parser.add_argument("h5_path", nargs="?", default="best_brain.h5")
+    parser.add_argument("--variants", nargs="*", default=list(VARIANTS), choices=VARIANTS)
+    parser.add_argument("--out-dir", default=None, help="Default: next to the .h5")
+    parser.add_argument("--data", default="training-data", help="Class-per-folder photos for calibration + eval")
+    parser.add_argument("--calibration-images", type=int, default=200)
+    parser.add_argument("--eval-images", type=int, default=200)
+    parser.add_argument("--latency-runs", type=int, default=50)
+    parser.add_argument("--rescale", type=float, default=1. / 255, help="Pixel scaling the model was trained with")
+    parser.add_argument("--no-report", action="store_true")
+    args = parser.parse_args()
+
+    if "int8" in args.variants or not args.no_report:
+        import tensorflow as tf
+        try:
+            image_input_size(tf.keras.models.load_model(args.h5_path))  # Needs folder photos - check before converting
+        except ValueError as e:
+            parser.error(str(e))
+
+    print(f"🏄‍♂️ Flat-packing {args.h5_path}...")
+    paths = convert_file(args.h5_path, args.variants, args.out_dir, args.data, args.calibration_images, args.rescale)
+    if not args.no_report:
+        rows = report(args.h5_path, paths, args.data, args.eval_images, args.latency_runs, args.rescale)
+        print(f"\n{'Engine':<18}{'Accuracy':>10}{'Delta':>9}{'Agree':>8}{'Size MB':>10}{'ms/image':>10}")
+        for row in rows:
+            accuracy = "n/a" if row["accuracy"] is None else f"{row['accuracy']:.4f}"
+            delta = "n/a" if row["delta"] is None else f"{row['delta']:+.4f}"
+            print(f"{row['engine']:<18}{accuracy:>10}{delta:>9}{row['agreement']:>8.3f}"
+                  f"{row['size_mb']:>10.2f}{row['latency_ms']:>10.2f}")
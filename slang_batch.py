@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLANG BATCH - Generate a whole crew of slang at once (and beam search for the gnarliest one).
+
+surfer_slang.py / surfer_slang_simplernn.py make ONE phrase at a time, one `predict` per char.
+Want 64 phrases? That's 64 × 20 tiny predicts - like sending 1280 separate `fetch()` calls
+when the API takes a batch.
+
+This decoder keeps N sequences in flight and does ONE forward pass per timestep for all of them:
+- `generate_batch(["stoked", "gnar", ...])` → N seeds, N phrases
+- `generate_batch("stoked", n=32)` → 32 different samples from one seed
+- `beam_search("stoked", beam_width=8)` → the most likely continuations, with the log-prob
+  bookkeeping done as NumPy array ops (no Python loop over beams)
+
+Windows are built exactly like the scripts' loop (last `maxlen` chars, zero-padded at the end
+when a sequence is still short), so every row sees what the trained model expects.
+
+Throughput vs batch size (imports the script, which trains its model first):
+    python slang_batch.py --script surfer_slang --batch-sizes 1 4 16 64 256
+"""
+
+import argparse
+import importlib
+import time
+
+import numpy as np
+import tensorflow as tf
+
+from slang_sampling import logits_from_probs, sample_logits
+
+
+class BatchDecoder:
+    """
+    Batched char decoding for the surfer-slang models.
+
+    Args:
+        model: Trained Embedding → LSTM/SimpleRNN → Dense(softmax) model
+        char_to_int (dict): char → index
+        int_to_char (dict): index → char
+        maxlen (int): Window the model was trained on
+    """
+
+    def __init__(self, model, char_to_int, int_to_char, maxlen):
+        self.model = model
+        self.char_to_int = char_to_int
+        self.int_to_char = int_to_char
+        self.maxlen = maxlen
+        # One compiled call for any batch size (no retracing when N changes)
+        self._forward = tf.function(lambda x: model(x, training=False),
+                                    input_signature=[tf.TensorSpec([None, maxlen], tf.int32)])
+
+    # =============================================
+    # 1. WINDOWS FOR THE WHOLE BATCH (Vectorized)
+    # =============================================
+    def _encode(self, seeds, extra):
+        """Token buffer with room for `extra` more chars per row, plus each row's current length."""
+        lengths = np.array([len(seed) for seed in seeds], dtype=np.int64)
+        tokens = np.zeros((len(seeds), lengths.max() + extra), dtype=np.int32)
+        for row, seed in enumerate(seeds):
+            tokens[row, :len(seed)] = [self.char_to_int[c] for c in seed]
+        return tokens, lengths
+
+    def _windows(self, tokens, lengths):
+        """(N, maxlen): each row's last maxlen tokens, or its whole prefix padded with zeros at the end."""
+        start = np.maximum(lengths - self.maxlen, 0)
+        idx = start[:, None] + np.arange(self.maxlen)  # (N, maxlen)
+        valid = idx < lengths[:, None]
+        windows = np.take_along_axis(tokens, np.minimum(idx, tokens.shape[1] - 1), axis=1)
+        return np.where(valid, windows, 0).astype(np.int32)
+
+    def probs(self, tokens, lengths):
+        """Next-char probabilities for every row: ONE forward pass."""
+        return self._forward(tf.constant(self._windows(tokens, lengths))).numpy()
+
+    def _decode(self, tokens, lengths):
+        return ["".join(self.int_to_char[int(t)] for t in row[:n]) for row, n in zip(tokens, lengths)]
+
+    # =============================================
+    # 2. SAMPLE N SEQUENCES IN PARALLEL (One Gumbel-Max Draw Per Step for the Whole Batch)
+    # =============================================
+    def generate_batch(self, seeds, length=20, temperature=0.5, n=None, seed=None, top_k=0, top_p=1.0,
+                       repetition_penalty=1.0):
+        """
+        Generate `length` chars for every seed at once (sampled with slang_sampling.py's Gumbel-max kernel).
+
+        Args:
+            seeds: A list of seed strings, or ONE string together with `n`
+            n (int): With a single seed string: how many samples to draw from it
+            seed (int): RNG seed (same seed → same batch of slang)
+            top_k / top_p / repetition_penalty: Extra filters (0 / 1.0 / 1.0 = off)
+
+        Returns:
+            list: One generated string per row (seed included)
+        """
+        if isinstance(seeds, str):
+            seeds = [seeds] * (n or 1)
+        rng = np.random.default_rng(seed)
+        tokens, lengths = self._encode(seeds, length)
+        rows = np.arange(len(seeds))
+        for _ in range(length):
+            prev = None
+            if repetition_penalty != 1.0:  # Each row's text so far, -1 past its end
+                prev = np.where(np.arange(tokens.shape[1]) < lengths[:, None], tokens, -1)
+            next_ids = sample_logits(logits_from_probs(self.probs(tokens, lengths)), temperature, top_k, top_p,
+                                     repetition_penalty, prev, rng)
+            tokens[rows, lengths] = next_ids
+            lengths += 1
+        return self._decode(tokens, lengths)
+
+    # =============================================
+    # 3. BEAM SEARCH (Vectorized Log-Prob Bookkeeping)
+    # =============================================
+    def beam_search(self, seed, length=20, beam_width=5):
+        """
+        Keep the `beam_width` most likely continuations at every step.
+
+        Returns:
+            list: (text, total log-prob) pairs, best first
+        """
+        tokens, lengths = self._encode([seed], length)
+        scores = np.zeros(1)  # Start with ONE beam so we don't get beam_width copies of the same thing
+        for _ in range(length):
+            log_probs = np.log(np.maximum(self.probs(tokens, lengths).astype(np.float64), 1e-300))
+            candidates = (scores[:, None] + log_probs).ravel()  # (beams × vocab)
+            k = min(beam_width, len(candidates))
+            best = np.argpartition(-candidates, k - 1)[:k]
+            best = best[np.argsort(-candidates[best])]
+            parents, next_ids = np.divmod(best, log_probs.shape[1])
+            tokens, lengths = tokens[parents], lengths[parents]  # Fork the winning beams
+            tokens[np.arange(k), lengths] = next_ids
+            lengths = lengths + 1
+            scores = candidates[best]
+        return list(zip(self._decode(tokens, lengths), scores.tolist()))
+
+
+# =============================================
+# 4. THROUGHPUT VS BATCH SIZE
+# =============================================
+def benchmark(decoder, seed, batch_sizes, length=50, temperature=0.5):
+    """Total generated chars/sec for each batch size (one warm-up run first)."""
+    decoder.generate_batch(seed, 2, temperature, n=1)  # Trace the compiled forward pass
+    results = []
+    for n in batch_sizes:
+        start = time.perf_counter()
+        decoder.generate_batch(seed, length, temperature, n=n, seed=0)
+        elapsed = time.perf_counter() - start
+        results.append({"batch_size": n, "chars_per_s": n * length / elapsed, "ms_per_step": elapsed / length * 1000})
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batched multi-seed generation + beam search for the slang models")
+    parser.add_argument("--script", default="surfer_slang", choices=["surfer_slang", "surfer_slang_simplernn"])
+    parser.add_argument("--seed", default="stoked")
+    parser.add_argument("--batch-sizes", nargs="*", type=int, default=[1, 4, 16, 64, 256])
+    parser.add_argument("--length", type=int, default=50)
+    parser.add_argument("--beam-width", type=int, default=5)
+    args = parser.parse_args()
+
+    slang = importlib.import_module(args.script)  # Trains the script's model (its REPL stays off)
+    decoder = BatchDecoder(slang.model, slang.char_to_int, slang.int_to_char, slang.maxlen)
+
+    print(f"\n{'Batch':>7}{'chars/sec':>12}{'ms/step':>10}")
+    for row in benchmark(decoder, args.seed, args.batch_sizes, args.length):
+        print(f"{row['batch_size']:>7}{row['chars_per_s']:>12.1f}{row['ms_per_step']:>10.2f}")
+
+    print(f"\n🏄‍♂️ 4 samples from '{args.seed}':")
+    for text in decoder.generate_batch(args.seed, 20, n=4, seed=42):
+        print(f"   {text}")
+    print(f"\n🌊 Beam search (width {args.beam_width}):")
+    for text, score in decoder.beam_search(args.seed, 20, args.beam_width):
+        print(f"   {score:>8.2f}  {text}")
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLANG CORPUS - Feed the slang models a multi-GB corpus without melting your RAM.
+
+The data prep in surfer_slang.py only works because `text` is ONE 50-char line:
+- `sentences` copies every char into `maxlen` Python strings
+- `x` is filled one char at a time in a nested Python loop
+- `y` is a dense one-hot row per sample (vocab-sized!) just to store ONE number
+
+For a 2 GB corpus that's tens of GB of Python strings and bools. Instead:
+1. Read the file in chunks (like a Node `fs.createReadStream`), never the whole thing
+2. Map chars → ints with a lookup table, one NumPy gather per chunk, into a memory-mapped .npy
+3. Windows are a strided VIEW of that array (`sliding_window_view`): sample i is just
+   ids[i:i + maxlen] - zero copies
+4. Targets stay sparse ints (train with `sparse_categorical_crossentropy`)
+5. `tf.data` shuffles the sample indices (blocks, then a buffer), gathers each batch from the
+   memmap and prefetches the next one while the model trains
+
+Memory stays bounded by the chunk size + the shuffle buffer, not the corpus size.
+
+Usage:
+    python slang_corpus.py big_slang.txt --maxlen 40     # encode (cached) + print stats
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+
+import numpy as np
+
+CACHE_DIR = os.path.join("rizz_cache", "corpus")
+CHUNK_CHARS = 1 << 24  # 16M chars per read (~64 MB as UTF-32 while encoding)
+
+
+# =============================================
+# 1. CHARS → INTS (Lookup Table, One Gather Per Chunk)
+# =============================================
+def _read_chunks(path, chunk_chars=CHUNK_CHARS):
+    with open(path, encoding="utf-8", newline="") as f:  # newline="" keeps \r\n exactly as written
+        for chunk in iter(lambda: f.read(chunk_chars), ""):
+            yield chunk
+
+
+def _code_points(chunk):
+    """A string as an array of Unicode code points (no Python loop over chars)."""
+    return np.frombuffer(chunk.encode("utf-32-le"), dtype="<u4")
+
+
+def _lookup_table(chars):
+    """code point → char index (-1 = not in the vocab), as one dense array (like a JS typed-array map)."""
+    codes = np.array([ord(c) for c in chars], dtype=np.int64)
+    lut = np.full(int(codes.max()) + 1 if len(codes) else 1, -1, dtype=np.int32)
+    lut[codes] = np.arange(len(chars), dtype=np.int32)
+    return lut
+
+
+def _ids_dtype(vocab_size):
+    return np.uint8 if vocab_size <= 256 else np.uint16 if vocab_size <= 65536 else np.int32
+
+
+def _start_digest(chars):
+    digest = hashlib.sha256("".join(chars).encode("utf-8"))
+    digest.update(b"\0")  # Vocab / ids separator
+    return digest
+
+
+def encode(text, lut, dtype):
+    cps = _code_points(text)
+    if cps.size and int(cps.max()) >= len(lut):
+        raise ValueError("Text contains chars outside the vocab")
+    ids = lut[cps]
+    if (ids < 0).any():
+        raise ValueError("Text contains chars outside the vocab")
+    return ids.astype(dtype)
+
+
+# =============================================
+# 2. THE CORPUS (Memmapped Ids + Strided Windows)
+# =============================================
+class Corpus:
+    """
+    An encoded corpus with zero-copy (window, next char) samples.
+
+    Attributes:
+        chars (list): Sorted vocab (same order as the scripts' `sorted(list(set(text)))`)
+        char_to_int / int_to_char (dict): Same lookups as the scripts
+        ids (np.ndarray): Every char as an int (memory-mapped for file corpora)
+        windows (np.ndarray): (N, maxlen) strided view - sample i is ids[i:i + maxlen]
+        targets (np.ndarray): (N,) the char after each window, as sparse ints
+    """
+
+    def __init__(self, ids, chars, maxlen, fingerprint=None):
+        if len(ids) <= maxlen:
+            raise ValueError(f"Corpus has {len(ids)} chars, need more than maxlen={maxlen}")
+        self.chars = list(chars)
+        self.char_to_int = {c: i for i, c in enumerate(self.chars)}
+        self.int_to_char = {i: c for i, c in enumerate(self.chars)}
+        self.maxlen = maxlen
+        self.ids = ids
+        # Same samples as `for i in range(0, len(text) - maxlen)` in the scripts, minus the copies
+        self.windows = np.lib.stride_tricks.sliding_window_view(ids, maxlen)[:len(ids) - maxlen]
+        self.targets = ids[maxlen:]
+        self._fingerprint = fingerprint
+
+    def __len__(self):
+        return len(self.targets)
+
+    @classmethod
+    def from_text(cls, text, maxlen=5):
+        """Small in-memory text (like the scripts' one-liner)."""
+        chars = sorted(set(text))
+        return cls(encode(text, _lookup_table(chars), _ids_dtype(len(chars))), chars, maxlen)
+
+    @classmethod
+    def from_file(cls, path, maxlen=5, cache_dir=CACHE_DIR, chunk_chars=CHUNK_CHARS):
+        """
+        Encode a text file of any size in chunks (cached on disk, keyed on path + size + mtime).
+        Two streaming passes: one to find the vocab + length, one to write the ids.
+        """
+        stat = os.stat(path)
+        key = hashlib.sha256(f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:16]
+        ids_path = os.path.join(cache_dir, f"{key}.npy")
+        meta_path = os.path.join(cache_dir, f"{key}.json")
+        if not os.path.exists(meta_path):
+            os.makedirs(cache_dir, exist_ok=True)
+            chars, total = set(), 0
+            for chunk in _read_chunks(path, chunk_chars):  # Pass 1: vocab + length
+                chars.update(chunk)
+                total += len(chunk)
+            chars = sorted(chars)
+            lut, dtype = _lookup_table(chars), _ids_dtype(len(chars))
+
+            tmp_path = ids_path + ".tmp.npy"
+            ids = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=dtype, shape=(total,))
+            digest = _start_digest(chars)  # Fingerprint for free while the ids stream past
+            offset = 0
+            for chunk in _read_chunks(path, chunk_chars):  # Pass 2: chunk → ids, straight to disk
+                encoded = encode(chunk, lut, dtype)
+                ids[offset:offset + len(chunk)] = encoded
+                digest.update(encoded.tobytes())
+                offset += len(chunk)
+            ids.flush()
+            del ids
+            os.replace(tmp_path, ids_path)
+            with open(meta_path + ".tmp", "w") as f:
+                json.dump({"source": os.path.abspath(path), "chars": "".join(chars), "length": total,
+                           "sha256": digest.hexdigest()}, f)
+            os.replace(meta_path + ".tmp", meta_path)  # Meta last: it's the "cache is complete" flag
+        with open(meta_path) as f:
+            meta = json.load(f)
+        return cls(np.load(ids_path, mmap_mode="r"), list(meta["chars"]), maxlen, meta.get("sha256"))
+
+    @property
+    def fingerprint(self):
+        """sha256 of the vocab + every char id (what the model store keys on). Cached after the first call."""
+        if self._fingerprint is None:
+            digest = _start_digest(self.chars)
+            for start in range(0, len(self.ids), CHUNK_CHARS):
+                digest.update(np.ascontiguousarray(self.ids[start:start + CHUNK_CHARS]).tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def window_text(self, i):
+        """Sample i's window as a string (handy as a generation seed)."""
+        return "".join(self.int_to_char[int(t)] for t in self.windows[i])
+
+    # =============================================
+    # 3. THE STREAM (Shuffled + Prefetched tf.data)
+    # =============================================
+    def dataset(self, batch_size=32, shuffle=True, seed=None, block_size=4096, shuffle_buffer=1 << 16):
+        """
+        (windows, sparse targets) batches for `model.fit`.
+
+        Shuffling is two-level so memory stays bounded on huge corpora (like shuffling a
+        playlist of albums, then the songs inside a buffer): the order of `block_size`-sample
+        blocks is reshuffled every epoch, then a `shuffle_buffer` mixes samples across blocks.
+        """
+        import tensorflow as tf
+
+        n = len(self)
+        if shuffle:
+            num_blocks = math.ceil(n / block_size)
+            indices = tf.data.Dataset.range(num_blocks).shuffle(num_blocks, seed=seed, reshuffle_each_iteration=True)
+            indices = indices.flat_map(lambda b: tf.data.Dataset.range(b * block_size,
+                                                                       tf.minimum((b + 1) * block_size, n)))
+            indices = indices.shuffle(min(shuffle_buffer, n), seed=seed, reshuffle_each_iteration=True)
+        else:
+            indices = tf.data.Dataset.range(n)
+
+        def gather(idx):
+            # Only this batch's windows get copied out of the memmap
+            return self.windows[idx].astype(np.int32), self.targets[idx].astype(np.int32)
+
+        def load(idx):
+            x, y = tf.numpy_function(gather, [idx], (tf.int32, tf.int32))
+            x.set_shape([None, self.maxlen])
+            y.set_shape([None])
+            return x, y
+
+        return (indices.batch(batch_size)
+                .map(load, num_parallel_calls=tf.data.AUTOTUNE)
+                .prefetch(tf.data.AUTOTUNE))  # Next batch is ready before the model asks
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Encode a text corpus into memmapped char ids (cached)")
+    parser.add_argument("path")
+    parser.add_argument("--maxlen", type=int, default=5)
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    args = parser.parse_args()
+
+    corpus = Corpus.from_file(args.path, args.maxlen, args.cache_dir)
+    print(f"🏄‍♂️ {args.path}: {len(corpus.ids):,} chars, vocab {len(corpus.chars)}, "
+          f"{len(corpus):,} windows of {args.maxlen} ({corpus.ids.dtype} ids, "
+          f"{corpus.ids.nbytes / 1e6:.1f} MB on disk)")
+    print(f"🌊 First window: {corpus.window_text(0)!r} → {corpus.int_to_char[int(corpus.targets[0])]!r}")
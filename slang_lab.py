@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLANG LAB - One char-LM builder, every recurrent cell, and a race to see which one actually shreds.
+
+surfer_slang.py and surfer_slang_simplernn.py were copy-pasted twins that only differed in ONE
+line (LSTM(32) vs SimpleRNN(32)). Now both call `build_char_lm(cell, units, ...)`:
+- "SimpleRNN": the boogie board (no gates, forgets fast)
+- "LSTM":      the shortboard (input/forget/output gates + a cell state)
+- "GRU":       the fish (2 gates, no separate cell state - between the two)
+
+`generic=True` wraps the cell in a plain `RNN(LSTMCell)` / `RNN(GRUCell)` loop instead of the
+`LSTM` / `GRU` layer. The layer versions are the "cuDNN-compatible" ones: on a GPU they run as
+one fused kernel, on CPU they still use a tighter loop than the generic cell-by-cell RNN. Same
+weights, same math - only the speed differs (like `Array.map` vs a hand-written `for` loop).
+
+The race trains every config on the SAME corpus (each in a fresh CPU-only process) and reports:
+- training samples/sec and time to reach a target loss
+- inference chars/sec (compiled single-sequence generation)
+- parameter count and final loss (so you can see speed per unit of quality)
+
+Usage:
+    python slang_lab.py --epochs 50 --target-loss 0.5
+    python slang_lab.py --configs LSTM LSTM-generic GRU GRU-generic --units 64 --corpus big_slang.txt
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from child_runs import peak_rss_mb, run_child
+
+CELLS = ("SimpleRNN", "LSTM", "GRU")
+DEFAULT_TEXT = "stoked gnarly rad wicked shred send it kook wipeout"
+
+
+# =============================================
+# 1. THE BUILDER (One Function, Any Cell)
+# =============================================
+def build_char_lm(cell, units, vocab_size, maxlen, embedding_dim=8, generic=False,
+                  loss="sparse_categorical_crossentropy", optimizer="adam", streams=None):
+    """
+    Embedding → recurrent layer → Dense(softmax), compiled and ready to fit.
+
+    Args:
+        cell (str): "SimpleRNN", "LSTM" or "GRU"
+        units (int): Hidden size of the recurrent layer
+        vocab_size (int): Number of distinct chars
+        maxlen (int): Window length the model reads
+        embedding_dim (int): Size of each char's "vibe" vector
+        generic (bool): RNN(<Cell>Cell) instead of the fused-kernel layer (LSTM/GRU only)
+        loss (str): 'sparse_categorical_crossentropy' for int targets, 'categorical_crossentropy' for one-hot
+        streams (int): Build the STATEFUL training twin instead (slang_tbptt.py): a fixed batch of
+            `streams` sequences of any length, a prediction at every char, state carried across batches.
+            Same weights as the window model, so they can be copied straight across.
+
+    Returns:
+        tf.keras.Model
+    """
+    from tensorflow.keras import layers  # Deferred: importing this module must not pull in TensorFlow
+    from tensorflow.keras.models import Sequential
+
+    if cell not in CELLS:
+        raise ValueError(f"cell must be one of {CELLS}, got {cell!r}")
+    if generic and cell == "SimpleRNN":
+        raise ValueError("SimpleRNN has no fused kernel, so there is no generic variant to compare")
+    sequence = {"return_sequences": True, "stateful": True} if streams else {}
+    if generic:
+        recurrent = layers.RNN(getattr(layers, f"{cell}Cell")(units), **sequence)
+    else:
+        recurrent = getattr(layers, cell)(units, **sequence)
+    inputs = [layers.Input(batch_shape=(streams, None), dtype="int32")] if streams else []
+
+    model = Sequential(inputs + [
+        # 1. Embedding Layer: Like a JS Map() that turns numbers into "vibes"
+        layers.Embedding(vocab_size, embedding_dim, input_length=None if streams else maxlen),
+        # 2. The recurrent layer: the "memory" of the board
+        recurrent,
+        # 3. Dense Layer: The "output" (like a JS switch statement that picks the next char)
+        layers.Dense(vocab_size, activation="softmax"),
+    ])
+    model.compile(loss=loss, optimizer=optimizer)
+    return model
+
+
+def parse_config(name):
+    """'LSTM' → ("LSTM", False), 'GRU-generic' → ("GRU", True)."""
+    cell, _, variant = name.partition("-")
+    if variant not in ("", "generic"):
+        raise ValueError(f"Unknown config {name!r} (use e.g. LSTM or LSTM-generic)")
+    return cell, variant == "generic"
+
+
+# =============================================
+# 2. ONE RUN (One Config, Fresh Process)
+# =============================================
+def run_one(config, corpus_file, maxlen, units, epochs, batch_size, target_loss, gen_length=200, seed=0):
+    """Train + time one config (call this in a fresh process). Returns a JSON-ready dict."""
+    import numpy as np
+    import tensorflow as tf
+    from slang_batch import BatchDecoder
+    from slang_corpus import Corpus
+
+    tf.keras.utils.set_random_seed(seed)  # Same init + shuffle order for every config
+    corpus = Corpus.from_file(corpus_file, maxlen) if corpus_file else Corpus.from_text(DEFAULT_TEXT, maxlen)
+    cell, generic = parse_config(config)
+    model = build_char_lm(cell, units, len(corpus.chars), maxlen, generic=generic)
+
+    class Clock(tf.keras.callbacks.Callback):
+        """Epoch wall times + the moment the loss first dips under the target."""
+        def on_train_begin(self, logs=None):
+            self.start, self.epoch_s, self.hit_s = time.perf_counter(), [], None
+
+        def on_epoch_begin(self, epoch, logs=None):
+            self.epoch_start = time.perf_counter()
+
+        def on_epoch_end(self, epoch, logs=None):
+            self.epoch_s.append(time.perf_counter() - self.epoch_start)
+            if self.hit_s is None and logs["loss"] <= target_loss:
+                self.hit_s = time.perf_counter() - self.start
+
+    clock = Clock()
+    history = model.fit(corpus.dataset(batch_size=batch_size, seed=seed), epochs=epochs, verbose=0, callbacks=[clock])
+    steady = clock.epoch_s[1:] or clock.epoch_s  # Epoch 1 pays for tracing - leave it out
+    samples_per_s = len(corpus) * len(steady) / sum(steady)
+
+    decoder = BatchDecoder(model, corpus.char_to_int, corpus.int_to_char, maxlen)
+    seed_text = corpus.window_text(0)
+    decoder.generate_batch(seed_text, 2, n=1)  # Warm-up (tracing)
+    start = time.perf_counter()
+    decoder.generate_batch(seed_text, gen_length, n=1, seed=seed)
+    chars_per_s = gen_length / (time.perf_counter() - start)
+
+    return {"config": config, "params": int(model.count_params()), "train_samples_per_s": samples_per_s,
+            "time_to_target_s": clock.hit_s, "final_loss": float(history.history["loss"][-1]),
+            "infer_chars_per_s": chars_per_s, "peak_rss_mb": peak_rss_mb(),
+            "numpy": np.__version__, "tensorflow": tf.__version__}
+
+
+# =============================================
+# 3. THE RACE (Every Config, Same Corpus)
+# =============================================
+def benchmark(configs, corpus_file=None, maxlen=5, units=32, epochs=50, batch_size=32, target_loss=0.5):
+    rows = []
+    for config in configs:
+        parse_config(config)  # Fail fast on typos, before any training
+        args = [config, corpus_file, maxlen, units, epochs, batch_size, target_loss]
+        rows.append(run_child(__file__, args, label=config))  # CPU only, fair race
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SimpleRNN vs LSTM vs GRU (fused vs generic kernels) on CPU")
+    parser.add_argument("--configs", nargs="*",
+                        default=["SimpleRNN", "LSTM", "LSTM-generic", "GRU", "GRU-generic"])
+    parser.add_argument("--corpus", default=None, help="Text file (default: the scripts' one-liner)")
+    parser.add_argument("--maxlen", type=int, default=5)
+    parser.add_argument("--units", type=int, default=32)
+    parser.add_argument("--epochs", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--target-loss", type=float, default=0.5)
+    parser.add_argument("--out", default=None, help="Also write the rows to this JSON file")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_one(*json.loads(args.child))))
+        sys.exit(0)
+
+    rows = benchmark(args.configs, args.corpus, args.maxlen, args.units, args.epochs, args.batch_size,
+                     args.target_loss)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(rows, f, indent=2)
+
+    print(f"\n{'Config':<14}{'Params':>8}{'train smp/s':>13}{'to target s':>13}{'final loss':>12}{'infer ch/s':>12}")
+    for row in rows:
+        hit = f"{row['time_to_target_s']:.1f}" if row["time_to_target_s"] is not None else "never"
+        print(f"{row['config']:<14}{row['params']:>8}{row['train_samples_per_s']:>13.0f}{hit:>13}"
+              f"{row['final_loss']:>12.3f}{row['infer_chars_per_s']:>12.1f}")
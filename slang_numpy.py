@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLANG NUMPY - Run the trained surfer-slang brain with ZERO TensorFlow.
+
+The whole model is an 8-dim Embedding, one 32-unit LSTM (or SimpleRNN) and a Dense layer.
+That's a few thousand numbers. Importing TensorFlow to multiply them costs seconds of startup
+and hundreds of MB of RAM - like installing all of React to toggle one checkbox.
+
+So:
+1. `export_npz(model, ...)` dumps the weights + vocab + maxlen into one small .npz file
+2. `NumpySlang.load(path)` is the forward pass in plain NumPy (same gate math as Keras)
+   plus the same `sample()` and the same `generate_slang` window loop
+
+Same weights + same `np.random.seed` → same slang as the Keras scripts (float32 math, so the
+probabilities agree to ~1e-6).
+
+Usage:
+    python slang_numpy.py surfer_slang.npz --seed stoked                 # generate, no TF imported
+    python slang_numpy.py --benchmark surfer_slang                       # train, export, race vs Keras
+In the surfer_slang REPLs, type 'export' to write the .npz.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from child_runs import peak_rss_mb, run_child
+from slang_sampling import logits_from_probs, sample_logits
+
+
+# =============================================
+# 1. THE EXPORTER (Keras → .npz)
+# =============================================
+def export_npz(model, path, chars, maxlen):
+    """
+    Dump an Embedding → LSTM/SimpleRNN/GRU → Dense model into one .npz.
+    Only reads `get_weights()`/`get_config()`, so this module never imports TensorFlow itself.
+    """
+    embedding, recurrent, dense = model.layers[:3]
+    cell_type = type(recurrent.cell).__name__.replace("Cell", "")  # "LSTM", "SimpleRNN" or "GRU" (layer or RNN(cell))
+    config = recurrent.cell.get_config()
+    if cell_type not in ("LSTM", "SimpleRNN", "GRU"):
+        raise ValueError(f"Don't know how to export a {cell_type} layer")
+    for key, expected in (("activation", "tanh"), ("recurrent_activation", "sigmoid")):
+        if config.get(key, expected) != expected:
+            raise ValueError(f"Only the default {key}={expected!r} is supported, got {config[key]!r}")
+    if dense.get_config()["activation"] != "softmax":
+        raise ValueError("The last layer must be Dense(..., activation='softmax')")
+    if cell_type == "GRU" and not config.get("reset_after", True):
+        raise ValueError("Only GRU(reset_after=True) (the TF2 default) is supported")
+
+    arrays = {"embedding": embedding.get_weights()[0]}
+    kernel, recurrent_kernel, *bias = recurrent.get_weights()
+    arrays.update(kernel=kernel, recurrent_kernel=recurrent_kernel)
+    if bias:
+        arrays["bias"] = bias[0]
+    arrays["dense_kernel"], arrays["dense_bias"] = dense.get_weights()
+    meta = {"cell": cell_type, "chars": "".join(chars), "maxlen": int(maxlen)}
+    np.savez_compressed(path, meta=np.array(json.dumps(meta)), **arrays)
+    return path
+
+
+# =============================================
+# 2. THE RUNTIME (Plain NumPy Forward Pass)
+# =============================================
+def _sigmoid(x):
+    return 0.5 * (np.tanh(0.5 * x) + 1)  # Same value as 1/(1+e^-x), never overflows
+
+
+class NumpySlang:
+    """Forward pass + sampling for an exported char model. Needs nothing but NumPy."""
+
+    def __init__(self, arrays, meta):
+        self.cell = meta["cell"]
+        self.maxlen = meta["maxlen"]
+        self.chars = list(meta["chars"])
+        self.char_to_int = {c: i for i, c in enumerate(self.chars)}
+        self.int_to_char = {i: c for i, c in enumerate(self.chars)}
+        self.embedding = arrays["embedding"]
+        self.kernel = arrays["kernel"]
+        self.recurrent_kernel = arrays["recurrent_kernel"]
+        self.units = self.recurrent_kernel.shape[0]
+        self.bias = arrays.get("bias", np.zeros(self.kernel.shape[1], dtype=np.float32))
+        self.dense_kernel = arrays["dense_kernel"]
+        self.dense_bias = arrays["dense_bias"]
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            arrays = {name: data[name] for name in data.files if name != "meta"}
+            meta = json.loads(str(data["meta"]))
+        return cls(arrays, meta)
+
+    def zero_states(self, batch):
+        n_states = 2 if self.cell == "LSTM" else 1
+        return [np.zeros((batch, self.units), dtype=np.float32) for _ in range(n_states)]
+
+    def step(self, ids, states):
+        """One recurrent step for a batch of char ids. Returns (output, new_states)."""
+        x = self.embedding[ids]
+        if self.cell == "LSTM":
+            h, c = states
+            z = x @ self.kernel + h @ self.recurrent_kernel + self.bias
+            i, f, g, o = np.split(z, 4, axis=1)  # Keras gate order: input, forget, cell, output
+            c = _sigmoid(f) * c + _sigmoid(i) * np.tanh(g)
+            h = _sigmoid(o) * np.tanh(c)
+            return h, [h, c]
+        if self.cell == "GRU":
+            (h,) = states
+            bias = self.bias.reshape(2, -1)  # reset_after=True: separate input and recurrent biases
+            x_z, x_r, x_h = np.split(x @ self.kernel + bias[0], 3, axis=1)
+            h_z, h_r, h_h = np.split(h @ self.recurrent_kernel + bias[1], 3, axis=1)
+            z = _sigmoid(x_z + h_z)
+            r = _sigmoid(x_r + h_r)
+            h = z * h + (1 - z) * np.tanh(x_h + r * h_h)
+            return h, [h]
+        (h,) = states  # SimpleRNN
+        h = np.tanh(x @ self.kernel + h @ self.recurrent_kernel + self.bias)
+        return h, [h]
+
+    def logits(self, windows):
+        """(N, maxlen) char ids → (N, vocab) pre-softmax logits (what slang_sampling.py wants)."""
+        windows = np.asarray(windows, dtype=np.int64)
+        states = self.zero_states(len(windows))
+        output = None
+        for t in range(windows.shape[1]):
+            output, states = self.step(windows[:, t], states)
+        return output @ self.dense_kernel + self.dense_bias
+
+    @staticmethod
+    def _softmax(logits):
+        logits = logits - logits.max(axis=1, keepdims=True)
+        probs = np.exp(logits)
+        return probs / probs.sum(axis=1, keepdims=True)
+
+    def predict(self, windows):
+        """(N, maxlen) char ids → (N, vocab) probabilities. Same thing as `model.predict(windows)`."""
+        return self._softmax(self.logits(windows))
+
+    def stream_stateful(self, seed, length=20, temperature=0.5, sampler=None):
+        """
+        Yield `length` chars from ONE state carried through the whole seed and every sampled char -
+        how a TBPTT-trained model reads text (SlangStreamer's stateful mode, minus TensorFlow).
+        `sampler(probs, temperature)` defaults to `sample`.
+        """
+        if not seed:
+            raise ValueError("Stateful mode needs a seed with at least one char")
+        sampler = sampler or self.sample
+        states = self.zero_states(1)
+        for char in seed:  # Warm up on the seed
+            output, states = self.step(np.array([self.char_to_int[char]]), states)
+        for i in range(length):
+            probs = self._softmax(output @ self.dense_kernel + self.dense_bias)
+            char = self.int_to_char[sampler(probs[0], temperature)]
+            yield char
+            if i < length - 1:  # No wasted step after the last char
+                output, states = self.step(np.array([self.char_to_int[char]]), states)
+
+    @staticmethod
+    def sample(preds, temperature=1.0, fast=True):
+        """The scripts' `sample()` (`fast` = their FAST_SAMPLING flag), same np.random draws."""
+        if fast:
+            return sample_logits(logits_from_probs(preds), temperature, rng=np.random)
+        preds = np.asarray(preds).astype('float64')
+        preds = np.log(preds) / temperature
+        exp_preds = np.exp(preds)
+        preds = exp_preds / np.sum(exp_preds)
+        probas = np.random.multinomial(1, preds, 1)
+        return np.argmax(probas)
+
+    def generate(self, seed, length=20, temperature=0.5):
+        """`generate_slang`'s loop (last maxlen chars, zero-padded at the end), no printing or sleeping."""
+        generated = seed
+        for _ in range(length):
+            x_pred = np.zeros((1, self.maxlen), dtype=np.int64)
+            for t, char in enumerate(generated[-self.maxlen:]):
+                x_pred[0, t] = self.char_to_int[char]
+            generated += self.int_to_char[self.sample(self.predict(x_pred)[0], temperature)]
+        return generated
+
+
+# =============================================
+# 3. THE RACE (Startup, Memory, Chars/Sec - Each in a Fresh Process)
+# =============================================
+def _child(engine, path, seed, length):
+    """Runs in a fresh process: load, then generate, timing both."""
+    start = time.perf_counter()
+    if engine == "numpy":
+        brain = NumpySlang.load(path)
+        generate = brain.generate
+    else:
+        import tensorflow as tf
+        from slang_stream import predict_loop
+        model = tf.keras.models.load_model(path)
+        meta = NumpySlang.load(os.path.splitext(path)[0] + ".npz")  # Just for the vocab
+        def generate(s, n, temperature):
+            return predict_loop(model, s, n, temperature, meta.char_to_int, meta.int_to_char, meta.maxlen,
+                                NumpySlang.sample)
+    startup = time.perf_counter() - start
+    generate(seed, 2, 0.5)  # Warm-up
+    start = time.perf_counter()
+    generate(seed, length, 0.5)
+    chars_per_s = length / (time.perf_counter() - start)
+    return {"engine": engine, "startup_s": startup, "peak_rss_mb": peak_rss_mb(), "chars_per_s": chars_per_s}
+
+
+def benchmark(script, seed="stoked", length=100, out_dir="."):
+    """Train via the script, export .h5 + .npz, check equivalence, then race both engines in fresh processes."""
+    import importlib
+
+    slang = importlib.import_module(script)  # Trains the script's model (its REPL stays off)
+    npz_path = export_npz(slang.model, os.path.join(out_dir, f"{script}.npz"), slang.chars, slang.maxlen)
+    h5_path = os.path.join(out_dir, f"{script}.h5")
+    slang.model.save(h5_path)
+
+    max_diff = float(np.abs(slang.model.predict(slang.x, verbose=0)
+                            - NumpySlang.load(npz_path).predict(slang.x)).max())
+    rows = []
+    for engine, path in (("numpy", npz_path), ("keras", h5_path)):
+        rows.append(run_child(__file__, [engine, path, seed, length], label=f"{engine} child"))
+    return rows, max_diff
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NumPy-only runtime for the exported surfer-slang models")
+    parser.add_argument("npz_path", nargs="?", default="surfer_slang.npz")
+    parser.add_argument("--seed", default="stoked")
+    parser.add_argument("--length", type=int, default=20)
+    parser.add_argument("--temperature", type=float, default=0.5)
+    parser.add_argument("--benchmark", metavar="SCRIPT", choices=["surfer_slang", "surfer_slang_simplernn"],
+                        help="Train SCRIPT's model, export it and race NumPy vs Keras")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_child(*json.loads(args.child))))
+        sys.exit(0)
+
+    if args.benchmark:
+        rows, max_diff = benchmark(args.benchmark, args.seed, max(args.length, 100))
+        print(f"\n🔬 Max |Keras - NumPy| probability difference: {max_diff:.2e}")
+        print(f"\n{'Engine':<8}{'Startup s':>11}{'Peak RSS MB':>13}{'chars/sec':>11}")
+        for row in rows:
+            print(f"{row['engine']:<8}{row['startup_s']:>11.2f}{row['peak_rss_mb']:>13.0f}{row['chars_per_s']:>11.1f}")
+        sys.exit(0)
+
+    brain = NumpySlang.load(args.npz_path)
+    print(f"🤙 {brain.generate(args.seed, args.length, args.temperature)}")
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLANG SAMPLING - Pick the next char for a whole batch at once, without the -inf drama.
+
+The scripts' `sample()` takes ONE row of softmax probabilities, casts it to float64, takes the log
+(zero probability → -inf, hello warnings), divides by temperature, exps, renormalizes and calls
+`np.random.multinomial` - once per char, per sequence.
+
+This kernel works on a (batch, vocab) array of LOGITS and does everything as array ops:
+- temperature: logits / T  (T = 0 → greedy argmax)
+- repetition penalty: chars already in the text get pushed down (CTRL-style: /p if > 0, *p if < 0)
+- top-k: keep only the k best chars per row
+- top-p (nucleus): keep the smallest set of chars whose probability adds up to p
+- then the Gumbel-max trick: argmax(logits + Gumbel noise) is an exact sample from softmax(logits).
+  No exp, no normalizing, no cumsum - masked chars are -inf and simply never win.
+
+Reproducible: pass a seeded `np.random.Generator` (or the `np.random` module itself to share
+the global `np.random.seed` like the old `sample()` did).
+
+Microbenchmark vs the old function:
+    python slang_sampling.py --batch-sizes 1 8 64 256 1024
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+
+# =============================================
+# 1. THE LOGIT FILTERS (All Vectorized Over the Batch)
+# =============================================
+def logits_from_probs(probs):
+    """log(probs) where zero probabilities become -inf quietly (they just never get picked)."""
+    with np.errstate(divide="ignore"):
+        return np.log(np.asarray(probs, dtype=np.float64))
+
+
+def apply_repetition_penalty(logits, prev_tokens, penalty):
+    """Push down every char that already appears in each row's `prev_tokens` (batch, T; -1 = padding)."""
+    if penalty == 1.0 or prev_tokens is None or not np.size(prev_tokens):
+        return logits
+    batch, vocab = logits.shape
+    prev_tokens = np.asarray(prev_tokens)
+    seen = np.zeros((batch, vocab + 1), dtype=bool)  # Padding lands in the extra column and gets dropped
+    seen[np.arange(batch)[:, None], np.where(prev_tokens < 0, vocab, prev_tokens)] = True
+    seen = seen[:, :vocab]
+    penalized = np.where(logits > 0, logits / penalty, logits * penalty)
+    return np.where(seen, penalized, logits)
+
+
+def apply_top_k(logits, k):
+    """Keep the k biggest logits per row (ties with the k-th all survive), mask the rest to -inf."""
+    if not k or k >= logits.shape[1]:
+        return logits
+    kth = np.partition(logits, -k, axis=1)[:, -k][:, None]  # k-th largest, O(vocab) per row
+    return np.where(logits >= kth, logits, -np.inf)
+
+
+def apply_top_p(logits, p):
+    """Keep the smallest set of top chars whose softmax mass reaches p (the best one always stays)."""
+    if p is None or p >= 1.0:
+        return logits
+    order = np.argsort(-logits, axis=1)
+    sorted_logits = np.take_along_axis(logits, order, axis=1)
+    probs = np.exp(sorted_logits - sorted_logits[:, :1])  # Stable softmax (the max is column 0)
+    probs /= probs.sum(axis=1, keepdims=True)
+    mass_before = np.cumsum(probs, axis=1) - probs  # Mass of the chars ranked above each one
+    keep_sorted = mass_before < p
+    keep = np.empty_like(keep_sorted)
+    np.put_along_axis(keep, order, keep_sorted, axis=1)
+    return np.where(keep, logits, -np.inf)
+
+
+# =============================================
+# 2. THE SAMPLER (Gumbel-Max)
+# =============================================
+def sample_logits(logits, temperature=1.0, top_k=0, top_p=1.0, repetition_penalty=1.0, prev_tokens=None,
+                  rng=None):
+    """
+    One next-char index per row.
+
+    Args:
+        logits (array): (batch, vocab) or (vocab,) logits (or `logits_from_probs(probs)`)
+        temperature (float): 0 = greedy, 1 = as-is, > 1 = wilder
+        top_k (int): 0 = off
+        top_p (float): 1.0 = off
+        repetition_penalty (float): 1.0 = off, > 1 = discourage repeats
+        prev_tokens (array): (batch, T) chars so far, -1 = padding (for the repetition penalty)
+        rng: A `np.random.Generator`, or the `np.random` module (global seed); default: fresh Generator
+
+    Returns:
+        np.ndarray: (batch,) int indices (a plain int for 1-D input)
+    """
+    logits = np.asarray(logits, dtype=np.float64)
+    single = logits.ndim == 1
+    if single:
+        logits = logits[None]
+        prev_tokens = None if prev_tokens is None else np.asarray(prev_tokens)[None]
+    logits = apply_repetition_penalty(logits, prev_tokens, repetition_penalty)
+    if temperature == 0:
+        choice = logits.argmax(axis=1)
+    else:
+        logits = apply_top_p(apply_top_k(logits / temperature, top_k), top_p)
+        rng = np.random.default_rng() if rng is None else rng
+        choice = (logits + rng.gumbel(size=logits.shape)).argmax(axis=1)
+    return int(choice[0]) if single else choice
+
+
+# =============================================
+# 3. THE RACE (vs the Old sample())
+# =============================================
+def legacy_sample(preds, temperature=1.0):
+    """The scripts' original `sample()`, copied verbatim for the benchmark."""
+    preds = np.asarray(preds).astype('float64')
+    preds = np.log(preds) / temperature
+    exp_preds = np.exp(preds)
+    preds = exp_preds / np.sum(exp_preds)
+    probas = np.random.multinomial(1, preds, 1)
+    return np.argmax(probas)
+
+
+def benchmark(batch_sizes, vocab=21, repeats=20, temperature=0.7, seed=0):
+    """Samples/sec: old per-row sample() loop vs one vectorized call (plain, and with top-k + top-p)."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for batch in batch_sizes:
+        logits = rng.normal(size=(batch, vocab))
+        probs = np.exp(logits) / np.exp(logits).sum(axis=1, keepdims=True)
+        timings = {}
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for row in probs:
+                legacy_sample(row, temperature)
+        timings["legacy"] = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(repeats):
+            sample_logits(logits, temperature, rng=rng)
+        timings["gumbel"] = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(repeats):
+            sample_logits(logits, temperature, top_k=10, top_p=0.9, rng=rng)
+        timings["gumbel_topk_topp"] = time.perf_counter() - start
+        rows.append({"batch_size": batch, **{name: batch * repeats / t for name, t in timings.items()}})
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batched logits sampling vs the scripts' sample()")
+    parser.add_argument("--batch-sizes", nargs="*", type=int, default=[1, 8, 64, 256, 1024])
+    parser.add_argument("--vocab", type=int, default=21, help="21 = the surfer slang vocab")
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    # Sanity check: Gumbel-max draws match the softmax distribution
+    check_rng = np.random.default_rng(42)
+    check_logits = np.repeat(logits_from_probs([[0.6, 0.3, 0.1, 0.0]]), 20000, axis=0)  # The 0.0 → -inf
+    draws = sample_logits(check_logits, rng=check_rng)
+    print(f"🎲 Gumbel-max frequencies for [0.6, 0.3, 0.1, 0.0]: {np.bincount(draws, minlength=4) / len(draws)}")
+
+    print(f"\n{'Batch':>7}{'legacy/s':>13}{'gumbel/s':>13}{'+top-k/p/s':>13}")
+    for row in benchmark(args.batch_sizes, args.vocab, args.repeats):
+        print(f"{row['batch_size']:>7}{row['legacy']:>13.0f}{row['gumbel']:>13.0f}{row['gumbel_topk_topp']:>13.0f}")
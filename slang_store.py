@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLANG STORE - Train once, load in milliseconds (like a JS build cache keyed on a lockfile hash).
+
+Every launch of surfer_slang.py used to import TensorFlow and run 100 epochs of `model.fit`
+before the REPL even said hi. But if the corpus, `maxlen` and the model recipe haven't changed,
+the weights come out the same - so we save them under a key:
+
+    key = sha256(corpus fingerprint, maxlen, architecture + training recipe)
+
+rizz_cache/models/<key>.json        ← metadata (written LAST = "this entry is complete")
+rizz_cache/models/<key>.npz         ← the slang_numpy.py export: runs with NumPy only
+rizz_cache/models/<key>.weights.h5  ← the Keras weights, for when we need the real model
+
+Same key next launch → the REPL loads the .npz and never imports TensorFlow. Change the corpus,
+`maxlen`, the cell or the epochs → new key → train once more.
+
+Measure the REPL's time-to-first-prompt, cold (empty store = the old retrain-every-launch
+behaviour) vs warm:
+    python slang_store.py --ttfp surfer_slang
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from slang_numpy import NumpySlang, export_npz
+
+STORE_DIR = os.environ.get("SLANG_STORE_DIR", os.path.join("rizz_cache", "models"))
+
+
+def model_key(corpus, maxlen, architecture):
+    """
+    The store key.
+
+    Args:
+        corpus: A `slang_corpus.Corpus` (uses its fingerprint) or the raw training text
+        maxlen (int): Window length
+        architecture (dict): Everything that changes the weights (cell, sizes, epochs, ...)
+    """
+    fingerprint = getattr(corpus, "fingerprint", None) or hashlib.sha256(corpus.encode("utf-8")).hexdigest()
+    payload = json.dumps({"corpus": fingerprint, "maxlen": int(maxlen), "architecture": architecture},
+                         sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+
+
+class ModelStore:
+    """Trained char models on disk, one entry per key."""
+
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+
+    def _path(self, key, suffix):
+        return os.path.join(self.root, key + suffix)
+
+    def has(self, key):
+        return os.path.exists(self._path(key, ".json"))
+
+    def meta(self, key):
+        with open(self._path(key, ".json")) as f:
+            return json.load(f)
+
+    # =============================================
+    # 1. LOAD (NumPy First, Keras Only When Asked)
+    # =============================================
+    def load_numpy(self, key):
+        """The NumPy runtime for this key (no TensorFlow import), or None if it isn't stored."""
+        return NumpySlang.load(self._path(key, ".npz")) if self.has(key) else None
+
+    def load_weights(self, key, model):
+        """Pour the stored weights into a freshly built Keras model."""
+        if not model.built:
+            model.build((None, self.meta(key)["maxlen"]))
+        model.load_weights(self._path(key, ".weights.h5"))
+        return model
+
+    # =============================================
+    # 2. SAVE (Atomic-ish: Meta Goes Last)
+    # =============================================
+    def save(self, key, model, chars, maxlen, architecture=None, train_s=None):
+        os.makedirs(self.root, exist_ok=True)
+        export_npz(model, self._path(key, ".tmp.npz"), chars, maxlen)
+        os.replace(self._path(key, ".tmp.npz"), self._path(key, ".npz"))
+        model.save_weights(self._path(key, ".tmp.weights.h5"))
+        os.replace(self._path(key, ".tmp.weights.h5"), self._path(key, ".weights.h5"))
+        meta = {"key": key, "chars": "".join(chars), "maxlen": int(maxlen), "architecture": architecture,
+                "train_s": train_s, "saved_at": time.time()}
+        with open(self._path(key, ".tmp.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(self._path(key, ".tmp.json"), self._path(key, ".json"))
+
+    def export(self, key, path):
+        """Copy the stored .npz out (what the REPL's 'export' option hands to slang_numpy.py)."""
+        shutil.copyfile(self._path(key, ".npz"), path)
+        return path
+
+
+# =============================================
+# 3. TIME-TO-FIRST-PROMPT (Cold vs Warm)
+# =============================================
+def time_to_first_prompt(script, store_dir):
+    """Launch the REPL, answer 'exit' at the first prompt, return the wall time (≈ time to first prompt)."""
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, f"{script}.py"], input="exit\n", capture_output=True, text=True,
+                          env=dict(os.environ, SLANG_STORE_DIR=store_dir, CUDA_VISIBLE_DEVICES=""))
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{script} wiped out:\n{proc.stderr[-2000:]}")
+    return elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Model store for the surfer-slang REPLs")
+    parser.add_argument("--ttfp", metavar="SCRIPT", choices=["surfer_slang", "surfer_slang_simplernn"],
+                        help="Measure SCRIPT's time-to-first-prompt with an empty store, then a warm one")
+    parser.add_argument("--warm-runs", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.ttfp:
+        with tempfile.TemporaryDirectory() as store_dir:
+            cold = time_to_first_prompt(args.ttfp, store_dir)  # Trains + saves, like every launch used to
+            warm = [time_to_first_prompt(args.ttfp, store_dir) for _ in range(args.warm_runs)]
+        print(f"\n🥶 Cold (empty store, trains): {cold:.2f}s")
+        print(f"🔥 Warm (store hit, NumPy):    {min(warm):.2f}s  (best of {len(warm)})")
+        print(f"🤙 {cold / min(warm):.0f}x faster to the first prompt")
+        sys.exit(0)
+
+    store = ModelStore()
+    entries = sorted(name[:-5] for name in os.listdir(store.root) if name.endswith(".json")
+                     and not name.endswith(".tmp.json")) if os.path.isdir(store.root) else []
+    for key in entries:
+        meta = store.meta(key)
+        print(f"{key}  maxlen={meta['maxlen']}  {meta['architecture']}")
+    print(f"🏄‍♂️ {len(entries)} model(s) in {store.root}")
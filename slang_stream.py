@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLANG STREAM - Generate surf slang one char at a time WITHOUT re-surfing the whole window.
+
+`generate_slang` in surfer_slang.py does this for EVERY new char:
+1. rebuild a (1, maxlen) array
+2. push all 5 chars through `model.predict` (the whole Keras predict machinery, for 1 sample)
+3. sleep 0.1s
+Most of the time goes to `predict` overhead and to re-reading chars the LSTM already read.
+
+This engine reuses the trained layers (Embedding → recurrent cell → Dense) as a single-STEP
+function compiled with `tf.function`, and carries the hidden (+ cell) state forward instead:
+one new char = one recurrent step. Chars stream out of a generator (like a JS async iterator).
+
+Two modes:
+- "window" (default): EXACTLY what the trained model computes. The model only ever saw
+  `maxlen` chars starting from a zero state, so we keep `maxlen` staggered states (lanes), each
+  started one char apart, and step all of them as ONE batch. Every step, the lane that has read
+  exactly the last `maxlen` chars gives the prediction and restarts from zero.
+  Same probabilities as `predict` (up to float rounding), so with the same `np.random.seed`
+  you get the same slang as the old loop.
+- "stateful": one state carried over the WHOLE text (unlimited context, cheapest per char).
+  Not what the window-trained model was taught, so the output differs - handy to play with.
+
+Benchmark vs the old predict loop (imports the script, which trains its model first):
+    python slang_stream.py --script surfer_slang --length 200
+"""
+
+import argparse
+import importlib
+import time
+
+import numpy as np
+import tensorflow as tf
+
+
+class SlangStreamer:
+    """
+    Incremental char generation for an Embedding → LSTM/SimpleRNN/GRU → Dense(softmax) model.
+
+    Args:
+        model: The trained Sequential model from surfer_slang*.py
+        char_to_int (dict): char → index
+        int_to_char (dict): index → char
+        maxlen (int): The window the model was trained on
+        sampler (callable): `sample(preds, temperature)` from the script (so the RNG draws match)
+        mode (str): "window" (exact) or "stateful" (one state over the whole text)
+    """
+
+    def __init__(self, model, char_to_int, int_to_char, maxlen, sampler, mode="window"):
+        if mode not in ("window", "stateful"):
+            raise ValueError(f"mode must be 'window' or 'stateful', got {mode!r}")
+        self.embedding, self.recurrent, self.dense = model.layers[:3]
+        self.cell = self.recurrent.cell
+        self.char_to_int = char_to_int
+        self.int_to_char = int_to_char
+        self.maxlen = maxlen
+        self.sampler = sampler
+        self.mode = mode
+        state_size = self.cell.state_size
+        self.state_sizes = list(state_size) if isinstance(state_size, (list, tuple)) else [state_size]
+        self.lanes = maxlen if mode == "window" else 1
+        self._step = tf.function(self._step_fn)  # Compiled once, then a direct call per char
+        self._full_window = tf.function(self._full_window_fn)
+
+    # =============================================
+    # 1. THE COMPILED STEPS
+    # =============================================
+    def zero_states(self, batch):
+        return [tf.zeros((batch, size)) for size in self.state_sizes]
+
+    def _step_fn(self, char_id, states, reset_lane, read_lane):
+        """
+        Feed one char to every lane (one batched cell call), then read one lane's prediction.
+        `reset_lane` starts from zero first (-1 = none).
+        """
+        keep = 1.0 - tf.one_hot(reset_lane, self.lanes)[:, None]  # (lanes, 1): 0 for the restarting lane
+        states = [s * keep for s in states]
+        emb = self.embedding(tf.fill([self.lanes], char_id))
+        output, new_states = self.cell(emb, states)
+        new_states = list(new_states) if isinstance(new_states, (list, tuple)) else [new_states]
+        probs = self.dense(output[read_lane][None])
+        return probs[0], new_states
+
+    def _full_window_fn(self, window_ids):
+        """The old way, for windows shorter than maxlen: the whole (zero-padded) window from a zero state."""
+        states = self.zero_states(1)
+        output = None
+        for t in range(self.maxlen):  # Unrolled at trace time (maxlen is tiny)
+            output, states = self.cell(self.embedding(window_ids[t][None]), states)
+            states = list(states) if isinstance(states, (list, tuple)) else [states]
+        return self.dense(output)[0]
+
+    def _window_ids(self, text):
+        # Same as the old loop: the last maxlen chars, zero-padded at the END when text is short
+        ids = np.zeros(self.maxlen, dtype=np.int32)
+        for t, char in enumerate(text[-self.maxlen:]):
+            ids[t] = self.char_to_int[char]
+        return tf.constant(ids)
+
+    # =============================================
+    # 2. THE STREAM (Like a JS async iterator)
+    # =============================================
+    def stream(self, seed, length=20, temperature=0.5):
+        """Yield `length` new chars, one per step."""
+        text = seed
+        if self.mode == "window":
+            # Seed shorter than the window? The old loop pads with zeros at the end, which
+            # a running state can't reproduce - use full windows until we have maxlen real chars.
+            while len(text) < self.maxlen and length > 0:
+                probs = self._full_window(self._window_ids(text)).numpy()
+                char = self.int_to_char[self.sampler(probs, temperature)]
+                text += char
+                length -= 1
+                yield char
+            if length <= 0:
+                return
+            start = len(text) - self.maxlen  # Lanes only need the last maxlen chars
+        else:
+            if not text:
+                raise ValueError("Stateful mode needs a seed with at least one char")
+            start = 0
+
+        states = self.zero_states(self.lanes)
+        probs = None
+        for p in range(start, len(text)):  # Warm up on the seed
+            probs, states = self._advance(text[p], p, states)
+        for i, position in enumerate(range(len(text), len(text) + length)):
+            char = self.int_to_char[self.sampler(probs.numpy(), temperature)]
+            yield char
+            if i < length - 1:  # No wasted step after the last char
+                probs, states = self._advance(char, position, states)
+
+    def _advance(self, char, position, states):
+        """Feed the char at `position`; returns the prediction for the NEXT char."""
+        if self.mode == "window":
+            # Lane (p % maxlen) starts fresh at p; after reading char p, lane ((p+1) % maxlen)
+            # has read exactly chars p+1-maxlen .. p, i.e. the model's window
+            reset, read = position % self.maxlen, (position + 1) % self.maxlen
+        else:
+            reset, read = -1, 0
+        return self._step(tf.constant(self.char_to_int[char], tf.int32), states,
+                          tf.constant(reset, tf.int32), tf.constant(read, tf.int32))
+
+    def generate(self, seed, length=20, temperature=0.5):
+        return seed + "".join(self.stream(seed, length, temperature))
+
+
+# =============================================
+# 3. THE RACE (vs the predict-per-char loop)
+# =============================================
+def predict_loop(model, seed, length, temperature, char_to_int, int_to_char, maxlen, sampler):
+    """surfer_slang.generate_slang's loop, minus the printing and the sleep."""
+    generated = seed
+    for _ in range(length):
+        x_pred = np.zeros((1, maxlen))
+        for t, char in enumerate(generated[-maxlen:]):
+            x_pred[0, t] = char_to_int[char]
+        preds = model.predict(x_pred, verbose=0)[0]
+        generated += int_to_char[sampler(preds, temperature)]
+    return generated
+
+
+def benchmark(script, seeds, length=200, temperature=0.5, rng_seed=42):
+    """chars/sec for predict vs window-stream vs stateful-stream, plus whether the window output matched."""
+    slang = importlib.import_module(script)  # Trains the script's model (its REPL stays off)
+    args = (slang.char_to_int, slang.int_to_char, slang.maxlen, slang.sample)
+    engines = {
+        "predict": lambda seed: predict_loop(slang.model, seed, length, temperature, *args),
+        "window": SlangStreamer(slang.model, *args, mode="window").generate,
+        "stateful": SlangStreamer(slang.model, *args, mode="stateful").generate,
+    }
+    results, outputs = {}, {}
+    for name, generate in engines.items():
+        if name != "predict":
+            generate(seeds[0], 2, temperature)  # Warm-up (tracing), not timed
+        np.random.seed(rng_seed)
+        start = time.perf_counter()
+        outputs[name] = [generate(seed, length, temperature) for seed in seeds]
+        results[name] = len(seeds) * length / (time.perf_counter() - start)
+    matches = sum(a == b for a, b in zip(outputs["predict"], outputs["window"]))
+    return results, matches, outputs
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Streaming char generation vs the predict-per-char loop")
+    parser.add_argument("--script", default="surfer_slang", choices=["surfer_slang", "surfer_slang_simplernn"])
+    parser.add_argument("--seeds", nargs="*", default=["stoked", "gnar", "wipeout"])
+    parser.add_argument("--length", type=int, default=200, help="Chars per seed")
+    parser.add_argument("--temperature", type=float, default=0.5)
+    args = parser.parse_args()
+
+    results, matches, outputs = benchmark(args.script, args.seeds, args.length, args.temperature)
+    print(f"\n{'Engine':<10}{'chars/sec':>12}")
+    for name, cps in results.items():
+        print(f"{name:<10}{cps:>12.1f}")
+    print(f"\n🤙 window stream == predict loop for {matches}/{len(args.seeds)} seeds (same np.random seed)")
+    print(f"🌊 e.g. '{outputs['window'][0]}'")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLANG TBPTT - Train on long corpora with truncated backprop-through-time instead of windows.
+
+The window setup (maxlen=5) turns every char into `maxlen` training samples: "stoke" → "t",
+"toked" → " ", ... each window re-reads 4 chars the previous one just read, and the model never
+sees more than 5 chars of context. That's like re-watching the last 5 seconds of a surf clip
+before every new frame.
+
+TBPTT does it the way a video player does:
+1. Cut the corpus into B long CONTIGUOUS streams (one per batch row):
+       stream 0: chars [0, L)      stream 1: chars [L, 2L)   ...
+2. Walk all B streams forward together, `chunk_len` chars at a time. Batch k is
+   streams[:, k*T:(k+1)*T] → predict the next char at EVERY position.
+3. The recurrent layer is `stateful`: row b's state at the end of batch k is its starting state
+   for batch k+1, so context flows across the whole stream (gradients stop at the chunk edge -
+   that's the "truncated" part).
+
+Every char is fed once per epoch (instead of `maxlen` times), batches are zero-copy views of the
+id array, and the effective context is as long as the stream.
+
+The trained weights are the SAME shapes as the window model's, so `to_window_model` copies them
+straight into a normal `build_char_lm` model (model store, NumPy runtime, streamer all work).
+Heads-up: the window sampler only shows it the last `maxlen` chars - `SlangStreamer(mode="stateful")`
+carries the long context like training did.
+
+Per-epoch time + memory vs the window approach (each in a fresh CPU-only process):
+    python slang_tbptt.py --repeat 2000 --streams 32 --chunk-len 50
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from child_runs import peak_rss_mb, run_child
+from slang_lab import DEFAULT_TEXT, build_char_lm
+
+
+# =============================================
+# 1. THE STREAMS (B Contiguous Rows, Zero Copies)
+# =============================================
+def make_streams(ids, streams, chunk_len):
+    """
+    (inputs, targets), each (streams, num_chunks * chunk_len): row b is one contiguous slice of
+    the corpus and targets are the inputs shifted by one char. Views of `ids`, not copies. The
+    last < chunk_len chars of each row are dropped (every batch must have the same shape).
+    """
+    length = (len(ids) - 1) // streams  # -1: the very last char has no "next char"
+    length -= length % chunk_len
+    if length == 0:
+        raise ValueError(f"Corpus of {len(ids)} chars is too short for {streams} streams × {chunk_len} chars")
+    # Row b covers ids[b*length : (b+1)*length]; its targets are the same slice shifted by one
+    inputs = ids[:streams * length].reshape(streams, length)
+    targets = ids[1:streams * length + 1].reshape(streams, length)
+    return inputs, targets
+
+
+def chunk_sequence(ids, streams, chunk_len):
+    """A keras Sequence: batch k = every stream's k-th chunk. Must be fed in order (shuffle=False)."""
+    import tensorflow as tf
+
+    inputs, targets = make_streams(ids, streams, chunk_len)
+
+    class Chunks(tf.keras.utils.Sequence):
+        def __len__(self):
+            return inputs.shape[1] // chunk_len
+
+        def __getitem__(self, k):
+            cols = slice(k * chunk_len, (k + 1) * chunk_len)  # Only this chunk gets copied out of the memmap
+            return inputs[:, cols].astype(np.int32), targets[:, cols].astype(np.int32)
+
+    return Chunks()
+
+
+# =============================================
+# 2. TRAIN (Stateful, State Reset Once Per Epoch)
+# =============================================
+def train_tbptt(corpus, cell="LSTM", units=32, embedding_dim=8, streams=32, chunk_len=50, epochs=10,
+                generic=False, verbose=1, callbacks=()):
+    """
+    Train the stateful twin on `corpus` (a slang_corpus.Corpus).
+
+    Returns:
+        (model, history): the STATEFUL model - use `to_window_model` for generation
+    """
+    import tensorflow as tf
+
+    model = build_char_lm(cell, units, len(corpus.chars), corpus.maxlen, embedding_dim, generic=generic,
+                          streams=streams)
+    # Each epoch walks the streams from the start again, so the carried state starts from zero too
+    reset = tf.keras.callbacks.LambdaCallback(on_epoch_begin=lambda epoch, logs: model.reset_states())
+    history = model.fit(chunk_sequence(corpus.ids, streams, chunk_len), epochs=epochs, shuffle=False,
+                        verbose=verbose, callbacks=[reset, *callbacks])
+    return model, history
+
+
+def to_window_model(stateful_model, cell, units, vocab_size, maxlen, embedding_dim=8, generic=False,
+                    loss="sparse_categorical_crossentropy"):
+    """Copy the TBPTT weights into a normal window model (same layers, same weight shapes)."""
+    model = build_char_lm(cell, units, vocab_size, maxlen, embedding_dim, generic=generic, loss=loss)
+    model.set_weights(stateful_model.get_weights())
+    return model
+
+
+# =============================================
+# 3. THE RACE (Window vs TBPTT, Per Epoch)
+# =============================================
+def run_one(mode, repeat, maxlen, units, epochs, batch_size, streams, chunk_len, seed=0):
+    """One training mode in a fresh process. Loss is per predicted char, so the two are comparable."""
+    import tensorflow as tf
+    from slang_corpus import Corpus
+
+    tf.keras.utils.set_random_seed(seed)
+    corpus = Corpus.from_text(" ".join([DEFAULT_TEXT] * repeat), maxlen)
+    epoch_s = []
+    clock = tf.keras.callbacks.LambdaCallback(
+        on_epoch_begin=lambda epoch, logs: epoch_s.append(-time.perf_counter()),
+        on_epoch_end=lambda epoch, logs: epoch_s.__setitem__(-1, epoch_s[-1] + time.perf_counter()))
+    if mode == "tbptt":
+        _, history = train_tbptt(corpus, units=units, streams=streams, chunk_len=chunk_len, epochs=epochs,
+                                 verbose=0, callbacks=[clock])
+        chars_fed = streams * len(chunk_sequence(corpus.ids, streams, chunk_len)) * chunk_len
+    else:
+        model = build_char_lm("LSTM", units, len(corpus.chars), maxlen)
+        history = model.fit(corpus.dataset(batch_size=batch_size, seed=seed), epochs=epochs, verbose=0,
+                            callbacks=[clock])
+        chars_fed = len(corpus) * maxlen  # Every window re-feeds maxlen chars
+    steady = epoch_s[1:] or epoch_s  # Epoch 1 pays for tracing
+    return {"mode": mode, "corpus_chars": len(corpus.ids), "chars_fed_per_epoch": chars_fed,
+            "epoch_s": sum(steady) / len(steady), "final_loss": float(history.history["loss"][-1]),
+            "peak_rss_mb": peak_rss_mb()}
+
+
+def benchmark(repeat=2000, maxlen=5, units=32, epochs=5, batch_size=32, streams=32, chunk_len=50):
+    rows = []
+    for mode in ("window", "tbptt"):
+        args = [mode, repeat, maxlen, units, epochs, batch_size, streams, chunk_len]
+        rows.append(run_child(__file__, args, label=mode))
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Truncated-BPTT training vs overlapping windows")
+    parser.add_argument("--repeat", type=int, default=2000, help="Corpus = the slang one-liner repeated N times")
+    parser.add_argument("--maxlen", type=int, default=5)
+    parser.add_argument("--units", type=int, default=32)
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=32, help="Window mode batch size")
+    parser.add_argument("--streams", type=int, default=32, help="TBPTT parallel streams (its batch size)")
+    parser.add_argument("--chunk-len", type=int, default=50, help="TBPTT chars per chunk (backprop horizon)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_one(*json.loads(args.child))))
+        sys.exit(0)
+
+    rows = benchmark(args.repeat, args.maxlen, args.units, args.epochs, args.batch_size, args.streams,
+                     args.chunk_len)
+    print(f"\n{'Mode':<8}{'chars fed/epoch':>17}{'s/epoch':>10}{'peak RSS MB':>13}{'final loss':>12}")
+    for row in rows:
+        print(f"{row['mode']:<8}{row['chars_fed_per_epoch']:>17,}{row['epoch_s']:>10.2f}{row['peak_rss_mb']:>13.0f}"
+              f"{row['final_loss']:>12.3f}")
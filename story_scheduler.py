@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+STORY SCHEDULER - Many surf stories at once, with riders paddling in while others finish.
+
+transformers.py writes ONE story for ONE prompt. Ten prompts = ten runs back to back, and a plain
+batch of ten would make the 5-token story wait for the 200-token one (like a bus that only
+leaves when the last passenger gets off at the last stop).
+
+Continuous batching (like a JS event loop that keeps taking new work):
+- every request gets a row in the running batch; each step = ONE forward pass for all rows
+- a new prompt is PREFILLED (its own forward pass, building its key/value cache), then MERGED
+  into the running batch's cache - it doesn't wait for the others to finish
+- a finished row is DROPPED from the cache right away, and its slot goes to the next prompt
+
+Rows have different lengths, so the cache is LEFT-padded: every row's newest token sits in the
+last column. The attention mask hides the padding, and `position_ids` are counted from the mask,
+so each prompt still sees positions 0, 1, 2, ... as if it ran alone (greedy output matches a
+solo run, up to float rounding).
+
+Same shape as rizz_service.py: `submit()` returns a Future, a worker thread does the batching.
+
+    with StoryScheduler.from_local("gpt2", max_batch_size=8) as scheduler:
+        futures = [scheduler.submit(p, max_new_tokens=40) for p in prompts]
+        stories = [f.result()["text"] for f in futures]
+
+Race vs one prompt at a time:
+    python story_scheduler.py --prompts 16 --max-batch-size 8
+"""
+
+import argparse
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from hf_local import STORY_MODEL, import_hf, load_causal_lm
+from slang_sampling import sample_logits
+
+_STOP = object()  # Sentinel that tells the scheduler thread to clock off
+
+
+class _Request:
+    def __init__(self, prompt, ids, max_new_tokens, future):
+        self.prompt = prompt
+        self.ids = ids
+        self.max_new_tokens = max_new_tokens
+        self.future = future
+        self.tokens = []
+        self.submitted = time.perf_counter()
+        self.first_token_at = None
+
+
+# =============================================
+# 1. CACHE SURGERY (Merge New Rows, Drop Finished Ones)
+# =============================================
+# The cache is kept as a list of per-layer (keys, values), each (batch, heads, time, head_dim).
+def from_model_cache(past):
+    return [tuple(kv) for kv in (past.to_legacy_cache() if hasattr(past, "to_legacy_cache") else past)]
+
+
+def to_model_cache(layers):
+    cache_cls = getattr(import_hf(), "DynamicCache", None)  # Newer transformers want a Cache object
+    if cache_cls is not None and hasattr(cache_cls, "from_legacy_cache"):
+        return cache_cls.from_legacy_cache(tuple(layers))
+    return tuple(layers)
+
+
+def _left_pad(torch, cache, mask, length):
+    """Pad the time axis on the LEFT up to `length` (padding is masked out, so it's never attended to)."""
+    pad = length - mask.shape[1]
+    if pad == 0:
+        return cache, mask
+    cache = [tuple(torch.nn.functional.pad(t, (0, 0, pad, 0)) for t in kv) for kv in cache]
+    return cache, torch.nn.functional.pad(mask, (pad, 0))
+
+
+def merge(torch, cache_a, mask_a, cache_b, mask_b):
+    """Stack two batches' caches (rows of A, then rows of B), aligning their newest tokens on the right."""
+    if cache_a is None:
+        return cache_b, mask_b
+    length = max(mask_a.shape[1], mask_b.shape[1])
+    cache_a, mask_a = _left_pad(torch, cache_a, mask_a, length)
+    cache_b, mask_b = _left_pad(torch, cache_b, mask_b, length)
+    cache = [tuple(torch.cat([a, b]) for a, b in zip(kv_a, kv_b)) for kv_a, kv_b in zip(cache_a, cache_b)]
+    return cache, torch.cat([mask_a, mask_b])
+
+
+def select(torch, cache, mask, rows):
+    """Keep only `rows`, then trim columns that are now padding for EVERY row (keeps the cache short)."""
+    index = torch.tensor(rows, dtype=torch.long)
+    mask = mask.index_select(0, index)
+    start = int((mask.sum(dim=0) > 0).float().argmax())  # First column someone still uses
+    cache = [tuple(t.index_select(0, index)[:, :, start:] for t in kv) for kv in cache]
+    return cache, mask[:, start:]
+
+
+# =============================================
+# 2. THE SCHEDULER (Prefill, Merge, Step, Drop)
+# =============================================
+class StoryScheduler:
+    """
+    Continuous-batching generation around a GPT-2-style model.
+
+    Args:
+        model: A Hugging Face causal LM
+        tokenizer: Its tokenizer
+        max_batch_size (int): Most stories in flight at once
+        temperature (float): 0 = greedy (default, reproducible), otherwise sample
+        top_k / top_p: Sampling filters (see slang_sampling.py)
+        seed (int): Sampling RNG seed
+    """
+
+    def __init__(self, model, tokenizer, max_batch_size=8, temperature=0.0, top_k=0, top_p=1.0, seed=None):
+        import torch
+
+        self.torch = torch
+        self.model = model.eval()
+        self.tokenizer = tokenizer
+        self.max_batch_size = max_batch_size
+        self.sampling = {"temperature": temperature, "top_k": top_k, "top_p": top_p}
+        self.rng = np.random.default_rng(seed)
+        self.max_positions = getattr(model.config, "n_positions", None) or model.config.max_position_embeddings
+        self.pad_id = tokenizer.pad_token_id if tokenizer.pad_token_id is not None else tokenizer.eos_token_id
+        self.requests = queue.Queue()
+        self.stats = {"requests": 0, "steps": 0, "tokens": 0, "row_steps": 0}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="story-scheduler", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_local(cls, name=STORY_MODEL, **kwargs):
+        tokenizer, model = load_causal_lm(name)
+        return cls(model, tokenizer, **kwargs)
+
+    def submit(self, prompt, max_new_tokens=50):
+        """
+        Queue one prompt.
+
+        Returns:
+            Future: Resolves to {"text", "tokens", "latency_s", "ttft_s"} - like a JS Promise
+        """
+        future = Future()
+        ids = self.tokenizer(prompt).input_ids
+        max_new_tokens = min(max_new_tokens, self.max_positions - len(ids))
+        if not ids or max_new_tokens < 1:
+            future.set_exception(ValueError(f"Prompt must be 1..{self.max_positions - 1} tokens, got {len(ids)}"))
+            return future
+        self.requests.put(_Request(prompt, ids, max_new_tokens, future))
+        return future
+
+    def generate(self, prompt, max_new_tokens=50, timeout=None):
+        """Blocking version of `submit`."""
+        return self.submit(prompt, max_new_tokens).result(timeout)["text"]
+
+    def _prefill(self, new):
+        """One forward pass over the new prompts (left-padded together). Returns cache, mask, last logits."""
+        torch = self.torch
+        length = max(len(r.ids) for r in new)
+        input_ids = torch.tensor([[self.pad_id] * (length - len(r.ids)) + r.ids for r in new])
+        mask = torch.tensor([[0] * (length - len(r.ids)) + [1] * len(r.ids) for r in new])
+        position_ids = (mask.cumsum(-1) - 1).clamp(min=0)  # Each prompt starts at position 0
+        out = self.model(input_ids=input_ids, attention_mask=mask, position_ids=position_ids, use_cache=True)
+        return from_model_cache(out.past_key_values), mask, out.logits[:, -1]
+
+    def _step(self, cache, mask, running):
+        """One decode step for every running row: feed each row's last token, read the next logits."""
+        torch = self.torch
+        input_ids = torch.tensor([[r.tokens[-1]] for r in running])
+        position_ids = mask.sum(-1, keepdim=True)  # = how many real tokens this row has seen
+        mask = torch.cat([mask, torch.ones((len(running), 1), dtype=mask.dtype)], dim=1)
+        out = self.model(input_ids=input_ids, past_key_values=to_model_cache(cache), attention_mask=mask,
+                         position_ids=position_ids, use_cache=True)
+        return from_model_cache(out.past_key_values), mask, out.logits[:, -1]
+
+    def _emit(self, rows, logits):
+        """Pick one token per row; returns which rows are done."""
+        picks = sample_logits(logits.float().numpy(), rng=self.rng, **self.sampling)
+        now = time.perf_counter()
+        done = []
+        for request, token in zip(rows, picks.tolist()):
+            if request.first_token_at is None:
+                request.first_token_at = now
+            finished = token == self.tokenizer.eos_token_id
+            if not finished:
+                request.tokens.append(token)
+            done.append(finished or len(request.tokens) >= request.max_new_tokens)
+        return done
+
+    def _finish(self, request):
+        now = time.perf_counter()
+        request.future.set_result({
+            "text": request.prompt + self.tokenizer.decode(request.tokens, skip_special_tokens=True),
+            "tokens": len(request.tokens), "latency_s": now - request.submitted,
+            "ttft_s": request.first_token_at - request.submitted})
+
+    def _run(self):
+        torch = self.torch
+        running, cache, mask, closing = [], None, None, False
+        while True:
+            new = []
+            while not closing and len(running) + len(new) < self.max_batch_size:
+                try:
+                    item = self.requests.get(block=not running and not new)  # Idle → wait, busy → just peek
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    closing = True
+                    break
+                new.append(item)
+            if not running and not new:
+                if closing:
+                    return
+                continue
+            try:
+                with torch.inference_mode():
+                    if new:  # Paddle in: prefill the newcomers, then merge them into the running batch
+                        new_cache, new_mask, logits = self._prefill(new)
+                        cache, mask = merge(torch, cache, mask, new_cache, new_mask)
+                        running += new
+                        done = [False] * (len(running) - len(new)) + self._emit(new, logits)
+                        with self._lock:
+                            self.stats["requests"] += len(new)
+                            self.stats["tokens"] += len(new)
+                    else:
+                        cache, mask, logits = self._step(cache, mask, running)
+                        done = self._emit(running, logits)
+                        with self._lock:
+                            self.stats["steps"] += 1
+                            self.stats["row_steps"] += len(running)
+                            self.stats["tokens"] += len(running)
+                    if any(done):  # Drop finished rows right away, their slots go to the next prompts
+                        for request, finished in zip(running, done):
+                            if finished:
+                                self._finish(request)
+                        keep = [i for i, finished in enumerate(done) if not finished]
+                        running = [running[i] for i in keep]
+                        cache, mask = select(torch, cache, mask, keep) if running else (None, None)
+            except Exception as e:
+                for request in running + new:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                running, cache, mask = [], None, None
+
+    def average_batch_size(self):
+        with self._lock:
+            return self.stats["row_steps"] / max(self.stats["steps"], 1)
+
+    def close(self):
+        """Let the queued stories finish, then stop the scheduler thread."""
+        self.requests.put(_STOP)
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# =============================================
+# 3. THE RACE (vs One Prompt at a Time)
+# =============================================
+PROMPTS = [
+    "The surfer dropped into a 10-foot wave and",
+    "Brah, the swell this morning was",
+    "My board snapped in half when",
+    "The lifeguard yelled at the kook because",
+    "Nobody believed the shark story until",
+    "We paddled out at dawn and the water",
+]
+
+
+def _percentile(sorted_values, q):
+    idx = min(len(sorted_values) - 1, max(0, int(round(q / 100 * len(sorted_values))) - 1))
+    return sorted_values[idx]
+
+
+def benchmark(n_prompts=16, max_batch_size=8, name=STORY_MODEL, min_new=10, max_new=60, seed=0):
+    """
+    Same prompts + lengths both ways (greedy). Lengths vary per prompt on purpose - that's where
+    continuous batching beats waiting for the longest story.
+    """
+    from story_stream import StoryStreamer
+
+    tokenizer, model = load_causal_lm(name)
+    rng = np.random.default_rng(seed)
+    jobs = [(PROMPTS[i % len(PROMPTS)], int(rng.integers(min_new, max_new + 1))) for i in range(n_prompts)]
+
+    streamer = StoryStreamer(model, tokenizer)
+    streamer.generate(jobs[0][0], max_new_tokens=2, temperature=0)  # Warm-up
+    start = time.perf_counter()
+    solo, solo_latency, solo_tokens = [], [], 0
+    for prompt, n in jobs:  # All submitted at t=0, served one after another
+        solo.append(streamer.generate(prompt, max_new_tokens=n, temperature=0))
+        solo_latency.append(time.perf_counter() - start)
+        solo_tokens += streamer.last_stats["tokens"]
+    solo_s = time.perf_counter() - start
+
+    with StoryScheduler(model, tokenizer, max_batch_size=max_batch_size) as scheduler:
+        start = time.perf_counter()
+        futures = [scheduler.submit(prompt, n) for prompt, n in jobs]
+        results = [f.result() for f in futures]
+        batched_s = time.perf_counter() - start
+        avg_batch = scheduler.average_batch_size()
+
+    batched_latency = sorted(r["latency_s"] for r in results)
+    solo_latency.sort()
+    return {
+        "prompts": n_prompts, "max_batch_size": max_batch_size, "avg_batch_size": avg_batch,
+        "sequential_tokens_per_s": solo_tokens / solo_s,
+        "batched_tokens_per_s": sum(r["tokens"] for r in results) / batched_s,
+        "sequential_p50_s": _percentile(solo_latency, 50), "sequential_p95_s": _percentile(solo_latency, 95),
+        "batched_p50_s": _percentile(batched_latency, 50), "batched_p95_s": _percentile(batched_latency, 95),
+        "same_text": sum(a == b["text"] for a, b in zip(solo, results)),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Continuous-batching story generation vs one prompt at a time")
+    parser.add_argument("--model", default=STORY_MODEL, help="Local model folder name or path")
+    parser.add_argument("--prompts", type=int, default=16)
+    parser.add_argument("--max-batch-size", type=int, default=8)
+    parser.add_argument("--min-new", type=int, default=10)
+    parser.add_argument("--max-new", type=int, default=60)
+    args = parser.parse_args()
+
+    r = benchmark(args.prompts, args.max_batch_size, args.model, args.min_new, args.max_new)
+    print(f"\n🏄‍♂️ {r['prompts']} prompts, max batch {r['max_batch_size']} (avg rows per step {r['avg_batch_size']:.1f})")
+    print(f"{'':<12}{'tokens/s':>10}{'p50 s':>8}{'p95 s':>8}")
+    print(f"{'sequential':<12}{r['sequential_tokens_per_s']:>10.1f}{r['sequential_p50_s']:>8.2f}{r['sequential_p95_s']:>8.2f}")
+    print(f"{'continuous':<12}{r['batched_tokens_per_s']:>10.1f}{r['batched_p50_s']:>8.2f}{r['batched_p95_s']:>8.2f}")
+    print(f"🤙 Same greedy story for {r['same_text']}/{r['prompts']} prompts")
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+STORY SPECULATIVE - Let a grom call the next few words, and the pro just checks them.
+
+GPT-2 writes one token per full forward pass. On CPU most of that pass is loading 124M weights,
+and checking 5 tokens in ONE pass costs about the same as writing 1. So:
+
+1. A small DRAFT model (distilgpt2, or GPT-2 with only its first few layers) guesses k tokens,
+   one cheap pass each
+2. GPT-2 scores the prompt + all k guesses in ONE pass → its own distribution at every position
+3. Keep guesses while GPT-2 agrees, then GPT-2 fixes the first miss (or adds a bonus token if
+   all k were right). Worst case you still get 1 GPT-2 token per GPT-2 pass
+4. Both key/value caches are cropped back to the accepted tokens (no recomputation)
+
+The output is EXACTLY what GPT-2 alone would produce:
+- greedy: a guess survives only if it IS GPT-2's argmax, and a miss is replaced by GPT-2's argmax
+- sampling: accept guess x with probability min(1, p(x)/q(x)); on a reject, draw from
+  normalize(max(0, p - q)). This rejection trick makes every token an exact sample from GPT-2's p
+  (p = GPT-2, q = draft, both after the same temperature/top-k/top-p)
+
+Report (acceptance rate + CPU speedup vs plain GPT-2, across prompts):
+    python story_speculative.py --k 4                       # draft = distilgpt2 (hf_local.py --download distilgpt2)
+    python story_speculative.py --k 4 --draft-layers 3      # draft = GPT-2's first 3 layers, no extra download
+"""
+
+import argparse
+import copy
+import time
+
+import numpy as np
+
+from hf_local import DRAFT_MODEL, STORY_MODEL, load_causal_lm
+from slang_sampling import apply_top_k, apply_top_p
+from story_scheduler import PROMPTS, from_model_cache, to_model_cache
+
+
+def truncated_draft(model, n_layers):
+    """A draft that is the target's first `n_layers` blocks (same embeddings + head, zero downloads)."""
+    import torch
+
+    draft = copy.deepcopy(model)
+    draft.transformer.h = torch.nn.ModuleList(list(draft.transformer.h)[:n_layers])
+    draft.config.n_layer = n_layers
+    return draft.eval()
+
+
+def _probs(logits, temperature, top_k, top_p):
+    """The distribution we sample from: filters + temperature, then a stable softmax (numpy, float64)."""
+    logits = np.atleast_2d(np.asarray(logits, dtype=np.float64)) / temperature  # The filters work on (batch, vocab)
+    logits = apply_top_p(apply_top_k(logits, top_k), top_p)
+    probs = np.exp(logits - logits.max(axis=1, keepdims=True))
+    return (probs / probs.sum(axis=1, keepdims=True))[0]
+
+
+def _crop(cache, length):
+    return [tuple(t[:, :, :length] for t in kv) for kv in cache] if cache else cache
+
+
+class SpeculativeStoryteller:
+    """
+    Speculative decoding with a draft + target causal LM that share a tokenizer.
+
+    Args:
+        target: The model whose output we must reproduce (GPT-2)
+        draft: The fast guesser (distilgpt2 or `truncated_draft(target, n)`)
+        tokenizer: The shared tokenizer
+        k (int): Tokens the draft proposes per round
+    """
+
+    def __init__(self, target, draft, tokenizer, k=4):
+        import torch
+
+        self.torch = torch
+        self.target = target.eval()
+        self.draft = draft.eval()
+        self.tokenizer = tokenizer
+        self.k = k
+        self.max_positions = target.config.n_positions
+        self.stats = {"proposed": 0, "accepted": 0, "target_calls": 0, "tokens": 0}
+
+    def _forward(self, model, cache, ids):
+        out = model(input_ids=self.torch.tensor([ids]), past_key_values=to_model_cache(cache) if cache else None,
+                    use_cache=True)
+        return from_model_cache(out.past_key_values), out.logits[0].float().numpy()
+
+    def acceptance_rate(self):
+        return self.stats["accepted"] / max(self.stats["proposed"], 1)
+
+    # =============================================
+    # 1. DRAFT → VERIFY → ACCEPT → CROP
+    # =============================================
+    def generate(self, prompt, max_new_tokens=50, temperature=0.0, top_k=0, top_p=1.0, seed=None):
+        """GPT-2's story for `prompt` (temperature 0 = greedy), sped up by the draft."""
+        rng = np.random.default_rng(seed)
+        greedy = temperature == 0
+        tokens = self.tokenizer(prompt).input_ids
+        prompt_len = len(tokens)
+        goal = len(tokens) + min(max_new_tokens, self.max_positions - len(tokens))
+        target_cache = draft_cache = None
+        target_len = draft_len = 0  # How many of `tokens` each cache already holds (the last token is always pending)
+        eos = self.tokenizer.eos_token_id
+
+        with self.torch.inference_mode():
+            while len(tokens) < goal:
+                # 1. The grom guesses k tokens (one cheap pass each, feeding whatever it hasn't seen yet)
+                k = min(self.k, goal - len(tokens))
+                guesses, draft_probs, pending = [], [], tokens[draft_len:]
+                for _ in range(k):
+                    draft_cache, logits = self._forward(self.draft, draft_cache, pending)
+                    draft_len += len(pending)
+                    if greedy:
+                        guess = int(logits[-1].argmax())
+                    else:
+                        q = _probs(logits[-1], temperature, top_k, top_p)
+                        guess = int(rng.choice(len(q), p=q))
+                        draft_probs.append(q)
+                    guesses.append(guess)
+                    pending = [guess]
+
+                # 2. The pro scores everything new in ONE pass: row i of `logits` predicts guess i
+                fed = tokens[target_len:] + guesses
+                target_cache, logits = self._forward(self.target, target_cache, fed)
+                logits = logits[len(tokens) - target_len - 1:]  # (k + 1, vocab)
+                self.stats["target_calls"] += 1
+                self.stats["proposed"] += k
+
+                # 3. Keep guesses while the pro agrees, then take the pro's own token
+                accepted = []
+                for i, guess in enumerate(guesses):
+                    if greedy:
+                        ok = guess == int(logits[i].argmax())
+                    else:
+                        p = _probs(logits[i], temperature, top_k, top_p)
+                        ok = rng.random() < min(1.0, p[guess] / draft_probs[i][guess])
+                    if not ok:
+                        break
+                    accepted.append(guess)
+                n = len(accepted)
+                if greedy:
+                    fix = int(logits[n].argmax())
+                elif n < k:  # Rejected: draw from what the draft under-covered
+                    p = _probs(logits[n], temperature, top_k, top_p)
+                    residual = np.maximum(p - draft_probs[n], 0)
+                    residual = residual if residual.sum() > 0 else p  # p == q up to rounding
+                    fix = int(rng.choice(len(residual), p=residual / residual.sum()))
+                else:  # All k right: bonus token straight from the pro
+                    fix = int(rng.choice(logits.shape[1], p=_probs(logits[k], temperature, top_k, top_p)))
+                self.stats["accepted"] += n
+
+                # 4. Crop both caches back to what we kept (the newest token stays pending)
+                old_len = len(tokens)
+                tokens += accepted + [fix]
+                target_len = old_len + n
+                target_cache = _crop(target_cache, target_len)
+                draft_len = min(draft_len, target_len)
+                draft_cache = _crop(draft_cache, draft_len)
+
+                if eos in tokens[old_len:]:
+                    tokens = tokens[:tokens.index(eos, old_len)]
+                    break
+            tokens = tokens[:goal]
+        new_tokens = tokens[prompt_len:]
+        self.stats["tokens"] += len(new_tokens)
+        return prompt + self.tokenizer.decode(new_tokens, skip_special_tokens=True)
+
+
+# =============================================
+# 2. THE REPORT (Acceptance Rate + Speedup Across Prompts)
+# =============================================
+def benchmark(k=4, draft_name=DRAFT_MODEL, draft_layers=None, max_new_tokens=60, temperature=0.0, seed=0):
+    from story_stream import StoryStreamer
+
+    tokenizer, target = load_causal_lm(STORY_MODEL)
+    draft = truncated_draft(target, draft_layers) if draft_layers else load_causal_lm(draft_name)[1]
+    baseline = StoryStreamer(target, tokenizer)
+    baseline.generate(PROMPTS[0], max_new_tokens=2, temperature=0)  # Warm-up
+    rows = []
+    for i, prompt in enumerate(PROMPTS):
+        start = time.perf_counter()
+        plain = baseline.generate(prompt, max_new_tokens=max_new_tokens, temperature=temperature, seed=seed + i)
+        plain_s = time.perf_counter() - start
+
+        spec = SpeculativeStoryteller(target, draft, tokenizer, k)
+        start = time.perf_counter()
+        fast = spec.generate(prompt, max_new_tokens, temperature, seed=seed + i)
+        spec_s = time.perf_counter() - start
+        rows.append({"prompt": prompt, "acceptance_rate": spec.acceptance_rate(), "speedup": plain_s / spec_s,
+                     "tokens_per_target_call": spec.stats["tokens"] / max(spec.stats["target_calls"], 1),
+                     "same_text": plain == fast if temperature == 0 else None})
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Speculative decoding for GPT-2 with a small draft model (CPU)")
+    parser.add_argument("--k", type=int, default=4, help="Draft tokens proposed per round")
+    parser.add_argument("--draft", default=DRAFT_MODEL, help="Local draft model (shares GPT-2's tokenizer)")
+    parser.add_argument("--draft-layers", type=int, default=None, help="Use GPT-2's first N layers as the draft")
+    parser.add_argument("--max-new-tokens", type=int, default=60)
+    parser.add_argument("--temperature", type=float, default=0.0, help="0 = greedy (output must match exactly)")
+    args = parser.parse_args()
+
+    rows = benchmark(args.k, args.draft, args.draft_layers, args.max_new_tokens, args.temperature)
+    print(f"\n{'Prompt':<46}{'accept':>8}{'tok/call':>10}{'speedup':>9}{'same':>6}")
+    for row in rows:
+        print(f"{row['prompt'][:44]:<46}{row['acceptance_rate']:>8.0%}{row['tokens_per_target_call']:>10.2f}"
+              f"{row['speedup']:>8.2f}x{str(row['same_text']):>6}")
+    print(f"\n🤙 Mean: {np.mean([r['acceptance_rate'] for r in rows]):.0%} accepted, "
+          f"{np.mean([r['speedup'] for r in rows]):.2f}x faster (k={args.k})")
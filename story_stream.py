@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+STORY STREAM - Watch GPT-2 write the surf story word by word, instead of staring at a blank screen.
+
+`generator(prompt, max_length=200)` in transformers.py only returns when ALL 200 tokens are done.
+This streamer yields text the moment each token is picked (like a JS async iterator / SSE stream):
+
+1. PREFILL: run the whole prompt once → logits for the first new token + the key/value cache
+   (every layer's attention keys and values for every token so far)
+2. DECODE: feed ONLY the new token, together with the cache. Attention reads the old tokens from
+   the cache instead of recomputing them, so each step costs one token's worth of work
+3. Decode the token ids so far and yield just the new characters (BPE can split an emoji over
+   several tokens, so half-finished chars wait for the next token)
+
+Metrics: time-to-first-token (what the user feels) and tokens/sec (the steady-state speed).
+
+Race against the one-shot pipeline call, greedy so both write the same story:
+    python story_stream.py --lengths 30 100 200
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from hf_local import STORY_MODEL, load_causal_lm, load_pipeline
+from slang_sampling import sample_logits
+
+
+class StoryStreamer:
+    """
+    KV-cached token streaming for a GPT-2-style model.
+
+    Args:
+        model: A Hugging Face causal LM (e.g. `generator.model` from a text-generation pipeline)
+        tokenizer: Its tokenizer (e.g. `generator.tokenizer`)
+    """
+
+    def __init__(self, model, tokenizer):
+        import torch
+
+        self.torch = torch
+        self.model = model.eval()
+        self.tokenizer = tokenizer
+        self.max_positions = getattr(model.config, "n_positions", None) or model.config.max_position_embeddings
+        self.last_stats = {}
+
+    @classmethod
+    def from_local(cls, name=STORY_MODEL):
+        tokenizer, model = load_causal_lm(name)
+        return cls(model, tokenizer)
+
+    # =============================================
+    # 1. THE STREAM (Prefill Once, Then One Token Per Step)
+    # =============================================
+    def stream(self, prompt, max_new_tokens=50, temperature=1.0, top_k=0, top_p=1.0, seed=None):
+        """
+        Yield the story text piece by piece (temperature 0 = greedy).
+        When it's done, `self.last_stats` has ttft_s, tokens, tokens_per_s and total_s.
+        """
+        torch = self.torch
+        rng = np.random.default_rng(seed)
+        start = time.perf_counter()
+        input_ids = self.tokenizer(prompt, return_tensors="pt").input_ids
+        max_new_tokens = min(max_new_tokens, self.max_positions - input_ids.shape[1])  # GPT-2 tops out at 1024
+        generated, shown, first_token_at = [], "", None
+        past = None
+        next_input = input_ids
+        with torch.inference_mode():
+            for _ in range(max_new_tokens):
+                out = self.model(input_ids=next_input, past_key_values=past, use_cache=True)
+                past = out.past_key_values  # Reused next step - no recomputing the old tokens
+                logits = out.logits[:, -1].float().numpy()
+                token = int(sample_logits(logits, temperature, top_k, top_p, rng=rng)[0])
+                if token == self.tokenizer.eos_token_id:
+                    break
+                generated.append(token)
+                next_input = torch.tensor([[token]])
+
+                text = self.tokenizer.decode(generated, skip_special_tokens=True)
+                if text.endswith("\ufffd"):
+                    continue  # Half an emoji - wait for the rest of its bytes
+                if first_token_at is None:
+                    first_token_at = time.perf_counter() - start
+                yield text[len(shown):]
+                shown = text
+        text = self.tokenizer.decode(generated, skip_special_tokens=True)
+        if len(text) > len(shown):  # Stopped mid-emoji: flush what's left, like the pipeline would return it
+            if first_token_at is None:
+                first_token_at = time.perf_counter() - start
+            yield text[len(shown):]
+        total = time.perf_counter() - start
+        decode_s = total - (first_token_at or total)
+        self.last_stats = {"ttft_s": total if first_token_at is None else first_token_at,
+                           "tokens": len(generated), "total_s": total,
+                           "tokens_per_s": (len(generated) - 1) / decode_s if len(generated) > 1 and decode_s else 0.0}
+
+    def generate(self, prompt, **kwargs):
+        """The whole story as one string (prompt included, like the pipeline's generated_text)."""
+        return prompt + "".join(self.stream(prompt, **kwargs))
+
+
+# =============================================
+# 2. THE RACE (vs the One-Shot Pipeline Call)
+# =============================================
+def benchmark(prompt, lengths, name=STORY_MODEL):
+    """Greedy both ways so they write the same story; the pipeline's TTFT is its whole runtime."""
+    generator = load_pipeline("text-generation", name)
+    streamer = StoryStreamer(generator.model, generator.tokenizer)
+    prompt_tokens = len(generator.tokenizer(prompt).input_ids)
+    generator(prompt, max_length=prompt_tokens + 2, do_sample=False)  # Warm-up
+    rows = []
+    for length in lengths:
+        start = time.perf_counter()
+        one_shot = generator(prompt, max_length=length, do_sample=False, num_return_sequences=1)[0]["generated_text"]
+        pipeline_s = time.perf_counter() - start
+        streamed = streamer.generate(prompt, max_new_tokens=length - prompt_tokens, temperature=0)
+        stats = streamer.last_stats
+        rows.append({"max_length": length, "pipeline_s": pipeline_s, "stream_ttft_s": stats["ttft_s"],
+                     "stream_total_s": stats["total_s"], "stream_tokens_per_s": stats["tokens_per_s"],
+                     "same_text": one_shot == streamed})
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="KV-cached streaming story generation (offline, CPU)")
+    parser.add_argument("--prompt", default="The surfer dropped into a 10-foot wave and")
+    parser.add_argument("--model", default=STORY_MODEL, help="Local model folder name or path")
+    parser.add_argument("--lengths", nargs="*", type=int, default=None,
+                        help="Benchmark these max_length values vs the pipeline instead of streaming")
+    parser.add_argument("--max-new-tokens", type=int, default=100)
+    parser.add_argument("--temperature", type=float, default=1.0)
+    parser.add_argument("--top-k", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.lengths:
+        print(f"\n{'max_length':>10}{'pipeline s':>12}{'TTFT s':>9}{'stream s':>10}{'tok/s':>8}{'same':>6}")
+        for row in benchmark(args.prompt, args.lengths, args.model):
+            print(f"{row['max_length']:>10}{row['pipeline_s']:>12.2f}{row['stream_ttft_s']:>9.3f}"
+                  f"{row['stream_total_s']:>10.2f}{row['stream_tokens_per_s']:>8.1f}{str(row['same_text']):>6}")
+        sys.exit(0)
+
+    streamer = StoryStreamer.from_local(args.model)
+    print(args.prompt, end="", flush=True)
+    for piece in streamer.stream(args.prompt, args.max_new_tokens, args.temperature, args.top_k):
+        print(piece, end="", flush=True)  # Like writing to an SSE response
+    stats = streamer.last_stats
+    print(f"\n\n⚡ TTFT {stats['ttft_s']:.3f}s, {stats['tokens_per_s']:.1f} tokens/sec, {stats['tokens']} tokens")
@@ -19,10 +19,14 @@ LSTM is like a **performance shortboard**:
 """
 
 import numpy as np
-import tensorflow as tf
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import SimpleRNN, Dense, Embedding  # CHANGED: LSTM → SimpleRNN
+# TensorFlow is NOT imported up here anymore: it costs seconds of startup, and with a warm model store
+# the REPL never needs it (like a JS dynamic `import()` - only paid when you actually train).
 import random
+from slang_corpus import Corpus  # Chunked encoding + zero-copy windows + tf.data stream
+from slang_lab import build_char_lm  # One char-LM builder for SimpleRNN / LSTM / GRU (imports TF lazily)
+from slang_numpy import export_npz  # Dump the weights so slang_numpy.py can run them without TF
+from slang_sampling import logits_from_probs, sample_logits  # Gumbel-max sampling, no -inf warnings
+from slang_store import ModelStore, model_key  # Trained weights cached on disk, keyed on corpus + model
 import time  # For dramatic effect (like JS's setTimeout)
 
 # =============================================
@@ -34,61 +38,129 @@ chars = sorted(list(set(text)))  # Like JS's new Set() - removes duplicates
 char_to_int = dict((c, i) for i, c in enumerate(chars))  # JS object: { char: index }
 int_to_char = dict((i, c) for i, c in enumerate(chars))  # Reverse lookup: { index: char }
 
+# BIG CORPUS: point this at a text file (any size, even GBs) to train on it instead of `text`.
+# It's read in chunks and encoded ONCE into a memory-mapped cache (slang_corpus.py). Needs VECTORIZED_PREP.
+CORPUS_FILE = None
+# VECTORIZED PREP: lookup-table encoding, zero-copy strided windows, sparse int targets and a shuffled,
+# prefetched tf.data stream (slang_corpus.py). False = the classic Python loops + one-hot below.
+VECTORIZED_PREP = True
+
 # =============================================
 # 2. PREPARE THE TRAINING DATA (The "Surf Lessons")
 # =============================================
 # We split the text into sequences (like JS's .slice()).
 maxlen = 5  # Like JS's .slice(0, 5)
-sentences = []  # JS array to store sequences
-next_chars = []  # JS array to store the "next char" (like labels)
-for i in range(0, len(text) - maxlen):
-    sentences.append(text[i:i + maxlen])  # JS: text.slice(i, i + maxlen)
-    next_chars.append(text[i + maxlen])  # JS: text[i + maxlen]
+if VECTORIZED_PREP:
+    # Sample i is ids[i:i + maxlen] → ids[i + maxlen], as a strided VIEW (like a JS `TypedArray.subarray`, no copies)
+    corpus = Corpus.from_file(CORPUS_FILE, maxlen) if CORPUS_FILE else Corpus.from_text(text, maxlen)
+    chars, char_to_int, int_to_char = corpus.chars, corpus.char_to_int, corpus.int_to_char
+    x = corpus.windows  # (samples, maxlen) char ids
+    y = corpus.targets  # The next char as ONE int per sample (sparse), not a vocab-sized one-hot row
+else:
+    sentences = []  # JS array to store sequences
+    next_chars = []  # JS array to store the "next char" (like labels)
+    for i in range(0, len(text) - maxlen):
+        sentences.append(text[i:i + maxlen])  # JS: text.slice(i, i + maxlen)
+        next_chars.append(text[i + maxlen])  # JS: text[i + maxlen]
 
 # =============================================
 # 3. TURN CHARS INTO NUMBERS (The "Surf Code")
 # =============================================
 # Convert each char to its index (like JS's .map()).
-x = np.zeros((len(sentences), maxlen), dtype=np.int32)  # Like JS's Array.fill(0)
-y = np.zeros((len(sentences), len(chars)), dtype=np.bool_)  # One-hot encoding (like JS's Array.fill(false))
-for i, sentence in enumerate(sentences):
-    for t, char in enumerate(sentence):
-        x[i, t] = char_to_int[char]  # JS: char_to_int[char]
-    y[i, char_to_int[next_chars[i]]] = 1  # JS: y[i][char_to_int[next_chars[i]]] = true
+if not VECTORIZED_PREP:  # (The vectorized path already did this in one gather per chunk)
+    x = np.zeros((len(sentences), maxlen), dtype=np.int32)  # Like JS's Array.fill(0)
+    y = np.zeros((len(sentences), len(chars)), dtype=np.bool_)  # One-hot encoding (like JS's Array.fill(false))
+    for i, sentence in enumerate(sentences):
+        for t, char in enumerate(sentence):
+            x[i, t] = char_to_int[char]  # JS: char_to_int[char]
+        y[i, char_to_int[next_chars[i]]] = 1  # JS: y[i][char_to_int[next_chars[i]]] = true
 
 # =============================================
 # 4. BUILD THE AI MODEL (The "Digital Boogie Board")
 # =============================================
-# This is like a **JS function** that takes input (previous chars)
-# and predicts the next char—but **SimpleRNN is simpler** (and dumber).
-model = Sequential([
-    # 1. Embedding Layer: Like a JS Map() that turns numbers into "vibes"
-    Embedding(len(chars), 8, input_length=maxlen),
-
-    # 2. SimpleRNN Layer: The "kook" version of LSTM (like a boogie board vs. a shortboard)
-    # - No fancy gates (forget/input/output) → just remembers the last few chars.
-    # - Less powerful, but **easier to train** (like learning to surf on a boogie board).
-    SimpleRNN(32),  # CHANGED: LSTM(32) → SimpleRNN(32)
-
-    # 3. Dense Layer: The "output" (like a JS switch statement that picks the next char)
-    Dense(len(chars), activation='softmax')
-])
+# Everything that changes the trained weights. It goes into the model store key, so tweak any of
+# these (or the corpus, or maxlen) and the next launch retrains once.
+ARCHITECTURE = {"cell": "SimpleRNN", "units": 32, "embedding_dim": 8, "epochs": 100, "batch_size": 1}
+# TRAIN MODE: "window" = the overlapping maxlen windows below. "tbptt" = B contiguous streams trained
+# statefully chunk by chunk (slang_tbptt.py): every char fed once per epoch and context longer than
+# maxlen, then the weights are copied into this same window model. Needs VECTORIZED_PREP.
+TRAIN_MODE = "window"
+TBPTT = {"streams": 2, "chunk_len": 10}  # The one-liner is tiny - crank these up for a real corpus
+if TRAIN_MODE == "tbptt":
+    ARCHITECTURE.update(train_mode="tbptt", **TBPTT)  # Different training → different store key
 
-# Compile the model (like JS's .then() after a Promise)
-model.compile(loss='categorical_crossentropy', optimizer='adam')
+def build_model():
+    """
+    This is like a **JS function** that takes input (previous chars)
+    and predicts the next char—but **SimpleRNN is simpler** (and dumber).
+    """
+    # Embedding (chars → "vibes") → SimpleRNN (the "kook" version of LSTM: no fancy gates, just remembers
+    # the last few chars, but **easier to train**) → Dense softmax (picks the next char).
+    # Same builder for every cell type (slang_lab.py) - ARCHITECTURE["cell"] is the only difference.
+    # Sparse targets → sparse loss (same math as categorical_crossentropy on the one-hot rows)
+    return build_char_lm(ARCHITECTURE["cell"], ARCHITECTURE["units"], len(chars), maxlen,
+                         embedding_dim=ARCHITECTURE["embedding_dim"],
+                         loss='sparse_categorical_crossentropy' if VECTORIZED_PREP else 'categorical_crossentropy')
 
 # =============================================
 # 5. TRAIN THE MODEL (The "Surf Session")
 # =============================================
-# This is like a **JS loop** that keeps adjusting the boogie board
-# until it "sorta shreds" the waves (but not as well as an LSTM).
-print("🏄‍♂️  Paddling out... (Training the AI - SimpleRNN Edition)")
-model.fit(x, y, batch_size=1, epochs=100)  # JS: for (let i = 0; i < 100; i++)
+def train_model(model):
+    """
+    This is like a **JS loop** that keeps adjusting the boogie board
+    until it "sorta shreds" the waves (but not as well as an LSTM).
+    """
+    print("🏄‍♂️  Paddling out... (Training the AI - SimpleRNN Edition)")
+    epochs, batch_size = ARCHITECTURE["epochs"], ARCHITECTURE["batch_size"]
+    if TRAIN_MODE == "tbptt":
+        from slang_tbptt import train_tbptt
+        stateful, _ = train_tbptt(corpus, ARCHITECTURE["cell"], ARCHITECTURE["units"], ARCHITECTURE["embedding_dim"],
+                                  epochs=epochs, **TBPTT)
+        model.set_weights(stateful.get_weights())  # Same layers, same shapes → straight copy
+    elif VECTORIZED_PREP:
+        model.fit(corpus.dataset(batch_size=batch_size), epochs=epochs)  # Shuffled + prefetched stream
+    else:
+        model.fit(x, y, batch_size=batch_size, epochs=epochs)  # JS: for (let i = 0; i < 100; i++)
+
+# MODEL STORE: save the trained weights under hash(corpus, maxlen, ARCHITECTURE) (slang_store.py).
+# Same key next launch → load in milliseconds instead of 100 epochs. False = retrain every launch.
+MODEL_STORE = True
+# NUMPY RUNTIME: with a store hit, generate with slang_numpy.py's forward pass - TensorFlow never gets
+# imported. Needs MODEL_STORE. False = load the Keras model (and use the streaming engine below).
+NUMPY_RUNTIME = True
+store = ModelStore()
+MODEL_KEY = model_key(corpus if VECTORIZED_PREP else text, maxlen, ARCHITECTURE)
+_model = None  # Loaded/trained on first use (like a lazy JS getter)
+_brain = None
+
+def get_model():
+    """The Keras model: stored weights if the key matches, otherwise train it (and store it)."""
+    global _model
+    if _model is None:
+        model = build_model()
+        if MODEL_STORE and store.has(MODEL_KEY):
+            store.load_weights(MODEL_KEY, model)  # Warm start: no training
+        else:
+            start = time.perf_counter()
+            train_model(model)
+            if MODEL_STORE:
+                store.save(MODEL_KEY, model, chars, maxlen, ARCHITECTURE, time.perf_counter() - start)
+        _model = model
+    return _model
+
+def get_brain():
+    """The NumPy-only model from the store (trains once first if the key is new)."""
+    global _brain
+    if _brain is None:
+        if not store.has(MODEL_KEY):
+            get_model()  # Cold start: the only time TensorFlow gets imported
+        _brain = store.load_numpy(MODEL_KEY)
+    return _brain
 
 # =============================================
 # 6. GENERATE NEW SLANG (The "Boogie Board Mode")
 # =============================================
-def generate_slang(seed=None, length=20, temperature=0.5):
+def generate_slang(seed=None, length=20, temperature=0.5, delay=0.1):
     """
     Generate **gnarly** surf slang (but SimpleRNN might be a **kook** at it)!
 
@@ -96,37 +168,58 @@ def generate_slang(seed=None, length=20, temperature=0.5):
         seed (str): Starting text (like a JS prompt)
         length (int): How many chars to generate (like JS's .length)
         temperature (float): How "wild" the AI gets (0.1 = safe, 1.0 = cooked)
+        delay (float): Dramatic pause per char in seconds (0 = full send)
 
     Returns:
         str: A **rad** (or **bogus**) surf phrase
     """
     if seed is None:
-        seed = random.choice(sentences)  # Pick a random starting point (like JS's Math.random())
+        if VECTORIZED_PREP:
+            seed = corpus.window_text(random.randrange(len(corpus)))  # Same draw as random.choice(sentences)
+        else:
+            seed = random.choice(sentences)  # Pick a random starting point (like JS's Math.random())
     generated = seed
 
     print(f"🌊  Starting with: '{seed}'")
     print("🏄‍♂️  Trying to shred the gnar (SimpleRNN style)...")
 
+    numpy_runtime = NUMPY_RUNTIME and MODEL_STORE
+    # Streaming engine: one compiled recurrent step per char (like a JS async iterator)
+    stream = get_streamer().stream(seed, length, temperature) if STREAMING_GENERATION and not numpy_runtime else None
+    if numpy_runtime and TRAIN_MODE == "tbptt":
+        # TBPTT brains read one long stream, not zero-state windows: carry a single state through it all
+        stream = get_brain().stream_stateful(seed, length, temperature, sample)
+
     for i in range(length):
-        # Convert the current text to numbers (like JS's .map())
-        x_pred = np.zeros((1, maxlen))
-        for t, char in enumerate(generated[-maxlen:]):
-            x_pred[0, t] = char_to_int[char]
+        if stream is not None:
+            next_char = next(stream)  # Same slang as the predict() path below, way less overhead
+        else:
+            # Convert the current text to numbers (like JS's .map())
+            x_pred = np.zeros((1, maxlen))
+            for t, char in enumerate(generated[-maxlen:]):
+                x_pred[0, t] = char_to_int[char]
 
-        # Predict the next char (like JS's .then() in a Promise)
-        preds = model.predict(x_pred, verbose=0)[0]
-        next_index = sample(preds, temperature)  # Pick a char based on "temperature"
-        next_char = int_to_char[next_index]
+            # Predict the next char (like JS's .then() in a Promise)
+            if numpy_runtime:
+                preds = get_brain().predict(x_pred)[0]  # Same math in plain NumPy, no TensorFlow
+            else:
+                preds = get_model().predict(x_pred, verbose=0)[0]
+            next_index = sample(preds, temperature)  # Pick a char based on "temperature"
+            next_char = int_to_char[next_index]
 
         generated += next_char  # Add the new char (like JS's +=)
 
         # Print progress (like JS's console.log)
         print(f"🔥  Generated so far: '{generated}'", end='\r')
-        time.sleep(0.1)  # Dramatic pause (like JS's setTimeout)
+        time.sleep(delay)  # Dramatic pause (like JS's setTimeout)
 
     print(f"\n🤙  Final shred: '{generated}'")
     return generated
 
+# FAST SAMPLING: the batched Gumbel-max kernel from slang_sampling.py (also does top-k / top-p /
+# repetition penalty for batches). False = the classic log → exp → multinomial below.
+FAST_SAMPLING = True
+
 def sample(preds, temperature=1.0):
     """
     Pick the next char based on "temperature" (like JS's Math.random() but smarter).
@@ -138,6 +231,10 @@ def sample(preds, temperature=1.0):
     Returns:
         int: The index of the next char (like JS's array index)
     """
+    if FAST_SAMPLING:
+        # log(probs) = logits (up to a constant), then argmax(logits / T + Gumbel noise) - same distribution,
+        # zero probs stay -inf and just never win. np.random → the global seed still works.
+        return sample_logits(logits_from_probs(preds), temperature, rng=np.random)
     preds = np.asarray(preds).astype('float64')
     preds = np.log(preds) / temperature
     exp_preds = np.exp(preds)
@@ -145,10 +242,40 @@ def sample(preds, temperature=1.0):
     probas = np.random.multinomial(1, preds, 1)
     return np.argmax(probas)
 
+# STREAMING GENERATION: carry the recurrent state forward and pay ONE compiled step per char
+# instead of a whole `model.predict` on the window (slang_stream.py). Same slang for the same
+# np.random seed. Only used with the Keras model (NUMPY_RUNTIME off; a TBPTT brain streams statefully in
+# NumPy either way). False = the classic predict-per-char loop.
+STREAMING_GENERATION = True
+_streamer = None
+
+def get_streamer():
+    global _streamer
+    if _streamer is None:
+        from slang_stream import SlangStreamer  # Imports TensorFlow, so only when we stream with Keras
+        mode = "stateful" if TRAIN_MODE == "tbptt" else "window"  # Stream with the context it was trained on
+        _streamer = SlangStreamer(get_model(), char_to_int, int_to_char, maxlen, sample, mode=mode)
+    return _streamer
+
+def __getattr__(name):
+    """`slang.model` / `slang.streamer` for the benchmark modules: loaded (or trained) on first touch."""
+    if name == "model":
+        return get_model()
+    if name == "streamer":
+        return get_streamer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # =============================================
 # 7. LET'S SHRED! (The "Main Event")
 # =============================================
 if __name__ == "__main__":
+    # Load the brain BEFORE the first prompt: a store hit takes milliseconds, a new key trains once
+    warm = MODEL_STORE and store.has(MODEL_KEY)
+    start = time.perf_counter()
+    get_brain() if NUMPY_RUNTIME and MODEL_STORE else get_model()
+    print(f"⚡  Brain {'loaded from the model store' if warm else 'trained'} in {time.perf_counter() - start:.2f}s"
+          f" (key {MODEL_KEY[:8]})")
+
     print("""
     🌊🏄‍♂️  WELCOME TO THE DIGITAL BOOGIE BRAIN! 🏄‍♂️🌊
     -------------------------------------------------
@@ -163,12 +290,19 @@ if __name__ == "__main__":
         print("1. Generate random slang (press Enter)")
         print("2. Start with a custom seed (type your seed)")
         print("3. Exit (type 'exit')")
+        print("4. Export for the NumPy-only runtime (type 'export')")
 
         user_input = input("\n🤙  What's your move? ")
 
         if user_input.lower() == 'exit':
             print("🤙  Catch you on the flip side, brah!")
             break
+        elif user_input.lower() == 'export':
+            if MODEL_STORE:
+                store.export(MODEL_KEY, 'surfer_slang_simplernn.npz')  # Already exported when it was stored
+            else:
+                export_npz(get_model(), 'surfer_slang_simplernn.npz', chars, maxlen)  # Like `JSON.stringify` for the brain
+            print("💾  Saved 'surfer_slang_simplernn.npz' - run it with `python slang_numpy.py surfer_slang_simplernn.npz` (no TensorFlow!)")
         elif user_input.strip() == "":
             generate_slang()
         else:
@@ -16,7 +16,18 @@
 # YOU NEED: pip install transformers torch
 # (This is like downloading the **AI's surfboard**—it needs the right gear to shred.)
 import time
-from transformers import pipeline
+# `from transformers import pipeline` would import THIS file (it's called transformers.py too!),
+# so grab the real library with our folder temporarily off the import path (hf_local.py).
+from hf_local import import_hf
+pipeline = import_hf(offline=False).pipeline  # offline=False: still allowed to download on first run
+
+# INT8 MODELS: load both brains with their Linear layers quantized to 1-byte ints (hf_quantize.py) -
+# smaller and faster on CPU, same `pipeline` object. Needs the local copies first:
+#     python hf_local.py --download distilbert-base-uncased-finetuned-sst-2-english gpt2
+# False = the full fp32 models straight from the Hub.
+INT8_MODELS = False
+if INT8_MODELS:
+    from hf_quantize import load_quantized_pipeline
 
 # =============================================
 # 1. THE VIBE-CHECKER (Sentiment Analysis)
@@ -27,7 +38,7 @@ from transformers import pipeline
 print("🏄‍♂️ Downloading the Vibe-Checker... wait for it, brah...")
 # `pipeline("sentiment-analysis")` is like calling a **lifeguard** to check the vibe.
 # It's a pre-trained AI model that already knows how to judge text.
-vibe_checker = pipeline("sentiment-analysis")
+vibe_checker = load_quantized_pipeline("sentiment-analysis") if INT8_MODELS else pipeline("sentiment-analysis")
 
 # =============================================
 # 2. THE TEST (Let's Check Some Comments)
@@ -41,10 +52,19 @@ comments = [
     "I'm lowkey stoked about this pizza."  # This should be **stoked** (positive).
 ]
 
+# BATCHED VIBES: hand the lifeguard the whole list at once - one tokenizer call + batched forward passes
+# instead of a batch of ONE per comment. For millions of comments from a file, see vibe_batch.py.
+# False = the classic one-call-per-comment loop.
+BATCHED_VIBES = True
+batched_results = vibe_checker(comments, batch_size=8) if BATCHED_VIBES else None
+
 print("\n--- VIBE-CHECK RESULTS ---")
-for comment in comments:
-    # `vibe_checker(comment)` is like asking the lifeguard: "Is this vibe gnarly or bogus?"
-    result = vibe_checker(comment)
+for i, comment in enumerate(comments):
+    if BATCHED_VIBES:
+        result = [batched_results[i]]  # Same {'label', 'score'} dict, already computed
+    else:
+        # `vibe_checker(comment)` is like asking the lifeguard: "Is this vibe gnarly or bogus?"
+        result = vibe_checker(comment)
     print(f"Comment: {comment}")
     print(f"AI Vibe: {result[0]['label']} (Score: {result[0]['score']:.2f})")
     # The `score` is like how **confident** the lifeguard is—closer to 1.0 means "deadset gnarly."
@@ -62,7 +82,7 @@ for comment in comments:
 print("📖 Downloading the Storyteller... wait for it, dude...")
 # `pipeline("text-generation", model="gpt2")` is like borrowing a **shaka master's brain** to write a story.
 # `gpt2` is a smaller version of the AI that powers big models like ChatGPT.
-generator = pipeline("text-generation", model="gpt2")
+generator = load_quantized_pipeline("text-generation") if INT8_MODELS else pipeline("text-generation", model="gpt2")
 
 prompt = "The surfer dropped into a 10-foot wave and"
 # This is like giving the shaka master a **starting line**—they'll take it from here.
@@ -70,8 +90,20 @@ prompt = "The surfer dropped into a 10-foot wave and"
 print("\n--- AI STORY TIME ---")
 # `generator(prompt, max_length=30, num_return_sequences=1)` is like saying:
 # "Shaka master, write a story starting with this prompt, but keep it short (30 words max)."
-story = generator(prompt, max_length=30, num_return_sequences=1)
-print(story[0]['generated_text'])
+# STREAMING STORY: print each token the moment it's picked, reusing the attention key/value cache
+# between steps (story_stream.py) - no blank screen at max_length=200. False = the one-shot call.
+STREAMING_STORY = True
+if STREAMING_STORY:
+    from story_stream import StoryStreamer
+    streamer = StoryStreamer(generator.model, generator.tokenizer)  # Same brain the pipeline loaded
+    print(prompt, end="", flush=True)
+    for piece in streamer.stream(prompt, max_new_tokens=30 - len(generator.tokenizer(prompt).input_ids), top_k=50):
+        print(piece, end="", flush=True)  # Like `res.write()` on a streaming HTTP response
+    print(f"\n(⚡ first token after {streamer.last_stats['ttft_s']:.2f}s, "
+          f"{streamer.last_stats['tokens_per_s']:.1f} tokens/sec)")
+else:
+    story = generator(prompt, max_length=30, num_return_sequences=1)
+    print(story[0]['generated_text'])
 
 # JS Analogy:
 # This is like `storyGenerator.generate(prompt)` where `storyGenerator` is a function that writes stories.
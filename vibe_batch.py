@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VIBE BATCH - Vibe-check millions of comments, not three.
+
+transformers.py does `vibe_checker(comment)` in a loop: every comment gets tokenized alone and
+runs through DistilBERT as a batch of ONE. Fine for 3 comments, a week for 3 million.
+
+This scorer:
+1. Streams comments from a .jsonl (one object per line, text in `--field`) or a .txt (one per
+   line) file - never the whole file in memory (like a Node readline stream). Blank lines are skipped
+2. Tokenizes a bounded WINDOW of them (e.g. 4096), sorts that window by token length and cuts it
+   into batches - so a 6-token "rad" doesn't get padded out to a 120-token rant
+3. Runs each batch through the model in one forward pass
+4. Writes results back in INPUT order (each window is re-sorted before it's written)
+5. Reports comments/sec and padding waste (vs what plain in-order batches would have wasted)
+
+Runs fully offline from a local model folder (see hf_local.py):
+    python hf_local.py --download distilbert-base-uncased-finetuned-sst-2-english   # once, online
+    python vibe_batch.py comments.jsonl --out vibes.jsonl --batch-size 64 --window 4096
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from hf_local import SENTIMENT_MODEL, load_classifier
+
+
+# =============================================
+# 1. THE STREAM (Comments In, One at a Time)
+# =============================================
+def read_comments(path, field="text"):
+    """
+    Yield (record, text): the parsed JSON object (or None for .txt lines) and the comment text.
+    Blank lines are skipped in both formats, and Windows (CRLF) line endings are handled.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            if not line.strip():
+                continue
+            if path.endswith(".jsonl"):
+                record = json.loads(line)
+                yield record, str(record[field])
+            else:
+                yield None, line
+
+
+def _windows(items, size):
+    window = []
+    for item in items:
+        window.append(item)
+        if len(window) == size:
+            yield window
+            window = []
+    if window:
+        yield window
+
+
+# =============================================
+# 2. THE SCORER (Length Buckets Inside a Window)
+# =============================================
+class VibeBatcher:
+    """
+    Batched sentiment scoring with length bucketing.
+
+    Args:
+        name (str): Local model folder name or path (see hf_local.py)
+        batch_size (int): Comments per forward pass
+        window (int): Comments sorted together (bigger = less padding, more memory + latency)
+        max_length (int): Truncate longer comments (DistilBERT tops out at 512 tokens)
+    """
+
+    def __init__(self, name=SENTIMENT_MODEL, batch_size=64, window=4096, max_length=512, bucket=True):
+        import torch
+
+        self.torch = torch
+        self.tokenizer, self.model = load_classifier(name)
+        self.labels = self.model.config.id2label
+        self.batch_size = batch_size
+        self.window = window
+        self.max_length = max_length
+        self.bucket = bucket
+        self.stats = {"comments": 0, "batches": 0, "real_tokens": 0, "padded_tokens": 0,
+                      "fifo_padded_tokens": 0, "seconds": 0.0}
+
+    @staticmethod
+    def _padded(lengths):
+        return max(lengths) * len(lengths) if lengths else 0
+
+    def score_window(self, texts):
+        """Score one window. Returns [{"label", "score"}] in the SAME order as `texts`."""
+        encoded = self.tokenizer(texts, truncation=True, max_length=self.max_length)["input_ids"]
+        lengths = [len(ids) for ids in encoded]
+        order = sorted(range(len(texts)), key=lengths.__getitem__) if self.bucket else list(range(len(texts)))
+        results = [None] * len(texts)
+        for start in range(0, len(order), self.batch_size):
+            rows = order[start:start + self.batch_size]
+            batch = self.tokenizer.pad({"input_ids": [encoded[i] for i in rows]}, return_tensors="pt")
+            with self.torch.inference_mode():
+                probs = self.model(**batch).logits.softmax(dim=-1)
+            scores, label_ids = probs.max(dim=-1)
+            for row, score, label_id in zip(rows, scores.tolist(), label_ids.tolist()):
+                results[row] = {"label": self.labels[label_id], "score": score}  # Same shape as pipeline output
+            self.stats["batches"] += 1
+            self.stats["padded_tokens"] += self._padded([lengths[i] for i in rows])
+        # What plain in-order batches of the same size would have padded to (for the report)
+        self.stats["fifo_padded_tokens"] += sum(self._padded(lengths[s:s + self.batch_size])
+                                                for s in range(0, len(lengths), self.batch_size))
+        self.stats["real_tokens"] += sum(lengths)
+        self.stats["comments"] += len(texts)
+        return results
+
+    def score_stream(self, items):
+        """(record, text) pairs in → (record, text, result) out, in input order, one window at a time."""
+        for window in _windows(items, self.window):
+            start = time.perf_counter()
+            results = self.score_window([text for _, text in window])
+            self.stats["seconds"] += time.perf_counter() - start
+            for (record, text), result in zip(window, results):
+                yield record, text, result
+
+    def report(self):
+        s = self.stats
+        return {"comments": s["comments"], "batches": s["batches"],
+                "comments_per_s": s["comments"] / s["seconds"] if s["seconds"] else 0.0,
+                "padding_waste": 1 - s["real_tokens"] / s["padded_tokens"] if s["padded_tokens"] else 0.0,
+                "fifo_padding_waste": 1 - s["real_tokens"] / s["fifo_padded_tokens"] if s["fifo_padded_tokens"] else 0.0}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Length-bucketed batch sentiment scoring (offline)")
+    parser.add_argument("path", help=".jsonl (one object per line) or .txt (one comment per line)")
+    parser.add_argument("--out", default=None, help="Results as JSONL, in input order (default: stdout)")
+    parser.add_argument("--field", default="text", help="JSON field holding the comment")
+    parser.add_argument("--model", default=SENTIMENT_MODEL, help="Local model folder name or path")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--window", type=int, default=4096, help="Comments sorted together per bucket window")
+    parser.add_argument("--max-length", type=int, default=512)
+    parser.add_argument("--no-bucket", action="store_true", help="Plain in-order batches (for comparison)")
+    args = parser.parse_args()
+
+    scorer = VibeBatcher(args.model, args.batch_size, args.window, args.max_length, bucket=not args.no_bucket)
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    try:
+        for record, text, result in scorer.score_stream(read_comments(args.path, args.field)):
+            row = dict(record) if record is not None else {"text": text}
+            row.update(vibe=result["label"], vibe_score=result["score"])
+            out.write(json.dumps(row, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    r = scorer.report()
+    print(f"🏄‍♂️ {r['comments']:,} comments in {r['batches']:,} batches: {r['comments_per_s']:.1f} comments/sec",
+          file=sys.stderr)
+    print(f"🌊 Padding waste: {r['padding_waste']:.1%} (in-order batches would waste {r['fifo_padding_waste']:.1%})",
+          file=sys.stderr)